@@ -1,18 +1,40 @@
 import pygame
+import os
 import sys
 import math
 import random
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pygame.locals import *
 
-# Initialize pygame
-pygame.init()
-pygame.mixer.init()
+import level_data
+from replay import (InputRecorder, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_ENDLESS,
+                    INPUT_RESTART, INPUT_NEXT, INPUT_START)
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Repository root, for common/
+from common import assets
+from common.fonts import sys_font
+from common.lazy import Lazy, init_display, init_mixer
+from common.pacing import FramePacer, add_gc_argument, schedule_gc
+from common.profiler import FrameProfiler, add_profile_argument
+from common.rng import RandomStreams, Stream
+from common.sprites import SpriteBatch, circle, shade, sprite
+
+# Headless runs need SDL's dummy drivers before pygame initializes
+if "--headless" in sys.argv:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
 
 # Screen dimensions
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 700
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Light Jumper 💡")
+screen = None  # Opened by open_window() when the game starts, not at import
+
+def open_window():
+    global screen
+    screen = init_display((SCREEN_WIDTH, SCREEN_HEIGHT), "Light Jumper 💡")  # Reuses the launcher's window
+    return screen
 
 # Colors
 BACKGROUND = (10, 10, 30)
@@ -30,50 +52,81 @@ BUTTON_COLOR = (70, 130, 180)
 BUTTON_HOVER_COLOR = (100, 180, 255)
 
 # Game parameters
-FPS = 60
-GRAVITY = 0.8
-JUMP_STRENGTH = -16
-PLAYER_SPEED = 7
+FPS = 60  # Physics steps per second; rendering runs at its own rate
+SIM_DT = 1.0 / FPS
+MAX_STEPS_PER_FRAME = 5  # Drop simulated time rather than spiral after a stall
+STEP_UP = 10  # Feet may sink this far into a platform top and still land on it
+GRAVITY = level_data.GRAVITY  # Player physics live in level_data, shared with the level solver
+JUMP_STRENGTH = level_data.JUMP_STRENGTH
+PLAYER_SPEED = level_data.PLAYER_SPEED
 LIGHT_RADIUS = 250
+LIGHT_RADIUS_SQ = LIGHT_RADIUS ** 2  # Reveal tests compare squared distances
 LIGHT_DURATION = 20  # frames
 
-# Create sounds
-try:
-    jump_sound = pygame.mixer.Sound(pygame.mixer.Sound(bytes(random.randint(0, 255) for _ in range(44))))
-    jump_sound.set_volume(0.3)
-    
-    land_sound = pygame.mixer.Sound(pygame.mixer.Sound(bytes(random.randint(0, 255) for _ in range(44))))
-    land_sound.set_volume(0.2)
-    
-    win_sound = pygame.mixer.Sound(pygame.mixer.Sound(bytes(random.randint(0, 255) for _ in range(44))))
-    win_sound.set_volume(0.5)
-    
-    level_sound = pygame.mixer.Sound(pygame.mixer.Sound(bytes(random.randint(0, 255) for _ in range(44))))
-    level_sound.set_volume(0.4)
-except:
-    # Fallback if sound creation fails
-    jump_sound = land_sound = win_sound = level_sound = type('MockSound', (), {'play': lambda: None})()
-
-# Font setup - Using pixel-style fonts
-try:
-    # Try to use a pixel-style font (monospace fonts work well for pixel art look)
-    pixel_font_large = pygame.font.SysFont('Courier New', 72, bold=True)  # For title
-    pixel_font_medium = pygame.font.SysFont('Courier New', 36, bold=True)  # For buttons
-except:
-    pixel_font_large = pygame.font.Font(None, 72)
-    pixel_font_medium = pygame.font.Font(None, 36)
+# Create sounds (the mixer opens on the first one played)
+def create_sound(volume):
+    try:
+        init_mixer()
+        # Cached per volume: each gets its own Sound, since set_volume changes it
+        rng = Stream(round(volume * 100), "light_jumper.click")  # Noise of its own per volume
+        sound = assets.sound(("light_jumper.click", volume), lambda: pygame.mixer.Sound(
+            pygame.mixer.Sound(bytes(rng.randint(0, 255) for _ in range(44)))))
+        sound.set_volume(volume)
+        return sound
+    except:
+        # Fallback if sound creation fails
+        return type('MockSound', (), {'play': lambda self: None})()
+
+jump_sound = Lazy(lambda: create_sound(0.3))
+land_sound = Lazy(lambda: create_sound(0.2))
+win_sound = Lazy(lambda: create_sound(0.5))
+level_sound = Lazy(lambda: create_sound(0.4))
+
+# The background: the starfield never changes, so it is drawn once
+def create_starfield():
+    surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    surf.fill(BACKGROUND)
+    for i in range(100):
+        x = (i * 97) % SCREEN_WIDTH  # Pseudo-random distribution
+        y = (i * 63) % SCREEN_HEIGHT
+        brightness = (i * 53) % 155 + 100
+        size = (i % 3) + 1
+        pygame.draw.circle(surf, (brightness, brightness, brightness), (x, y), size)
+    return surf
+
+starfield = Lazy(create_starfield)
+
+# Font setup - Using pixel-style fonts (monospace fonts work well for pixel art look).
+# Fonts load on first use; a missing font falls back to pygame's default
+pixel_font_large = Lazy(lambda: sys_font('Courier New', 72, bold=True))  # For title
+pixel_font_medium = Lazy(lambda: sys_font('Courier New', 36, bold=True))  # For buttons
 
 # In-game fonts - cleaner and more readable
-ui_font = pygame.font.SysFont('Verdana', 20, bold=True)
-instruction_font = pygame.font.SysFont('Verdana', 16)
-title_font = pygame.font.SysFont('Verdana', 36, bold=True)
+ui_font = Lazy(lambda: sys_font('Verdana', 20, bold=True))
+instruction_font = Lazy(lambda: sys_font('Verdana', 16))
+title_font = Lazy(lambda: sys_font('Verdana', 36, bold=True))
+
+def create_solver():
+    import level_solver
+    return level_solver.game_solver(world_width=SCREEN_WIDTH)
+
+# Generated levels are validated for reachability and cached on disk,
+# keyed by level number and seed. The solver is only built on the first
+# cache miss: the hand-made levels never need it
+level_cache = level_data.LevelCache(
+    screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT, solver=Lazy(create_solver))
 
 class Player:
+    __slots__ = ("x", "y", "width", "height", "center_x", "center_y", "vel_x", "vel_y", "on_ground",
+                 "jumping", "facing_right", "light_pulse", "jump_count", "lives", "invincible",
+                 "min_x", "max_x", "respawn_point", "support", "prev_x", "prev_y")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.width = 30
-        self.height = 40
+        self.width = level_data.PLAYER_WIDTH
+        self.height = level_data.PLAYER_HEIGHT
+        self.recenter()
         self.vel_x = 0
         self.vel_y = 0
         self.on_ground = False
@@ -83,8 +136,21 @@ class Player:
         self.jump_count = 0
         self.lives = 3
         self.invincible = 0
+        # Horizontal limits (max_x is None when the world scrolls) and where
+        # to reappear after falling off the bottom of the screen
+        self.min_x = 0
+        self.max_x = SCREEN_WIDTH - self.width
+        self.respawn_point = (100, 300)
+        self.support = None  # Platform the player last landed on
+        # Position at the start of the current physics step, for rendering
+        self.prev_x = x
+        self.prev_y = y
         
     def move(self, platforms, dangers):
+        # Remember where this step started for swept collision tests
+        old_x = self.x
+        old_bottom = self.y + self.height
+
         # Apply gravity
         self.vel_y += GRAVITY
         
@@ -93,23 +159,26 @@ class Player:
         self.y += self.vel_y
         
         # Keep player on screen (but can fall off bottom)
-        if self.x < 0:
-            self.x = 0
-        if self.x > SCREEN_WIDTH - self.width:
-            self.x = SCREEN_WIDTH - self.width
+        if self.x < self.min_x:
+            self.x = self.min_x
+        if self.max_x is not None and self.x > self.max_x:
+            self.x = self.max_x
             
-        # Check for collisions with platforms
+        # Check for collisions with platforms. The test is swept: the feet
+        # must cross the platform top during this step, so no fall speed can
+        # carry the player through a thin platform between two frames
         self.on_ground = False
         on_moving_platform = None
         for platform in platforms:
             if (self.y + self.height >= platform.y and 
-                self.y + self.height <= platform.y + 10 and
+                old_bottom <= platform.y + STEP_UP and
                 self.x + self.width > platform.x and 
                 self.x < platform.x + platform.width and
                 self.vel_y > 0):
                 self.y = platform.y - self.height
                 self.vel_y = 0
                 self.on_ground = True
+                self.support = platform
                 if getattr(platform, 'is_moving', False):
                     on_moving_platform = platform
                 if self.jumping:
@@ -121,13 +190,17 @@ class Player:
             dx = on_moving_platform.x - on_moving_platform.last_x
             self.x += dx
         
-        # Check for collisions with dangers
+        # Check for collisions with dangers, against the box swept by this step
         if self.invincible <= 0:
+            swept_left = min(old_x, self.x)
+            swept_right = max(old_x, self.x) + self.width
+            swept_top = min(old_bottom - self.height, self.y)
+            swept_bottom = max(old_bottom, self.y + self.height)
             for danger in dangers:
-                if (self.x < danger.x + danger.width and
-                    self.x + self.width > danger.x and
-                    self.y < danger.y + danger.height and
-                    self.y + self.height > danger.y):
+                if (swept_left < danger.x + danger.width and
+                    swept_right > danger.x and
+                    swept_top < danger.y + danger.height and
+                    swept_bottom > danger.y):
                     self.invincible = 90 
                     # 1.5 seconds of invincibility
                     # Bounce back from danger
@@ -148,14 +221,25 @@ class Player:
             self.lives -= 1
             self.invincible = 90
             # Reset player position
-            self.x = 100
-            self.y = 300
+            self.x, self.y = self.respawn_point
             self.vel_x = 0
             self.vel_y = 0
             
         # Update light pulse
         if self.light_pulse > 0:
             self.light_pulse -= 1
+        self.recenter()
+
+    def recenter(self):
+        """Cache the centre of the player's box; only move() moves the player."""
+        self.center_x = self.x + self.width/2
+        self.center_y = self.y + self.height/2
+
+    def lights(self, center_x, center_y):
+        """Whether the light pulse reaches a point this step."""
+        dx = self.center_x - center_x
+        dy = self.center_y - center_y
+        return self.light_pulse > 0 and dx*dx + dy*dy < LIGHT_RADIUS_SQ
             
     def jump(self):
         if self.on_ground:
@@ -166,34 +250,43 @@ class Player:
             jump_sound.play()
             self.jump_count += 1
             
-    def draw(self, screen):
+    def draw(self, screen, offset_x=0, blend=1.0):
+        # Interpolate between the last two physics steps, then apply the camera
+        x = self.prev_x + (self.x - self.prev_x) * blend - offset_x
+        y = self.prev_y + (self.y - self.prev_y) * blend
         # Draw light pulse if active
         if self.light_pulse > 0:
-            # Create a pulsing light effect
+            # Create a pulsing light effect: one cached circle, faded with its surface alpha
             alpha = min(150, self.light_pulse * 10)
-            pulse_surface = pygame.Surface((LIGHT_RADIUS * 2, LIGHT_RADIUS * 2), pygame.SRCALPHA)
-            pygame.draw.circle(pulse_surface, (*LIGHT_PULSE_COLOR, alpha), 
-                              (LIGHT_RADIUS, LIGHT_RADIUS), LIGHT_RADIUS)
-            screen.blit(pulse_surface, (self.x + self.width/2 - LIGHT_RADIUS, 
-                                       self.y + self.height/2 - LIGHT_RADIUS))
+            size = (LIGHT_RADIUS * 2, LIGHT_RADIUS * 2)
+            pulse_surface = sprite(("light_pulse",), size, lambda surf: pygame.draw.circle(
+                surf, LIGHT_PULSE_COLOR, (LIGHT_RADIUS, LIGHT_RADIUS), LIGHT_RADIUS))
+            pulse_surface.set_alpha(alpha)
+            screen.blit(pulse_surface, (x + self.width/2 - LIGHT_RADIUS, 
+                                       y + self.height/2 - LIGHT_RADIUS))
         
         # Draw player body (flash when invincible)
         if self.invincible <= 0 or self.invincible % 10 > 5:
-            pygame.draw.rect(screen, PLAYER_COLOR, (self.x, self.y, self.width, self.height), 0, 7)
+            pygame.draw.rect(screen, PLAYER_COLOR, (x, y, self.width, self.height), 0, 7)
             
             # Draw player face/eyes
-            eye_x = self.x + 20 if self.facing_right else self.x + 10
-            pygame.draw.circle(screen, (30, 30, 50), (eye_x, self.y + 15), 5)
+            eye_x = x + 20 if self.facing_right else x + 10
+            pygame.draw.circle(screen, (30, 30, 50), (eye_x, y + 15), 5)
             
             # Draw a little light above the player's head
-            pygame.draw.circle(screen, (255, 255, 200), (self.x + self.width/2, self.y - 5), 4)
+            pygame.draw.circle(screen, (255, 255, 200), (x + self.width/2, y - 5), 4)
 
 class Platform:
+    __slots__ = ("x", "y", "width", "height", "center_x", "center_y", "revealed", "reveal_timer",
+                 "is_moving", "original_x", "original_y", "move_direction", "move_speed", "move_range", "last_x")
+
     def __init__(self, x, y, width, height=20, is_moving=False):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
+        self.center_x = x + width/2  # Kept up to date when the platform moves
+        self.center_y = y + height/2
         self.revealed = False
         self.reveal_timer = 0
         self.is_moving = is_moving
@@ -201,7 +294,7 @@ class Platform:
         self.original_y = y
         self.move_direction = 1
         self.move_speed = 1 if is_moving else 0
-        self.move_range = 100 if is_moving else 0
+        self.move_range = level_data.MOVING_PLATFORM_RANGE if is_moving else 0
         self.last_x = x
 
     def update(self, player):
@@ -209,23 +302,14 @@ class Platform:
         # Move if it's a moving platform
         if self.is_moving:
             self.x += self.move_speed * self.move_direction
+            self.center_x = self.x + self.width/2
             if self.x > self.original_x + self.move_range or self.x < self.original_x - self.move_range:
                 self.move_direction *= -1
         
         # Check if platform should be revealed by player's light pulse
-        if player.light_pulse > 0:
-            # Calculate distance from player to platform center
-            player_center_x = player.x + player.width/2
-            player_center_y = player.y + player.height/2
-            platform_center_x = self.x + self.width/2
-            platform_center_y = self.y + self.height/2
-            
-            distance = math.sqrt((player_center_x - platform_center_x)**2 + 
-                                (player_center_y - platform_center_y)**2)
-            
-            if distance < LIGHT_RADIUS:
-                self.revealed = True
-                self.reveal_timer = LIGHT_DURATION + 10  # Slightly longer than the pulse
+        if player.lights(self.center_x, self.center_y):
+            self.revealed = True
+            self.reveal_timer = LIGHT_DURATION + 10  # Slightly longer than the pulse
                 
         # Update reveal timer
         if self.revealed and self.reveal_timer > 0:
@@ -233,53 +317,71 @@ class Platform:
         elif self.reveal_timer <= 0:
             self.revealed = False
             
-    def draw(self, screen):
+    def draw(self, layer, offset_x=0, blend=1.0):
+        """Queue the platform's sprites on a SpriteBatch."""
+        # Interpolate between the last two physics steps, like the player, then apply the camera
+        x = self.last_x + (self.x - self.last_x) * blend - offset_x
         if self.revealed:
-            # Choose color based on platform type
-            color = MOVING_PLATFORM_COLOR if self.is_moving else PLATFORM_COLOR
             highlight = MOVING_PLATFORM_HIGHLIGHT if self.is_moving else PLATFORM_HIGHLIGHT
             
             # Draw the platform with a glow effect
-            alpha = min(255, self.reveal_timer * 15)
-            glow_surface = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (*highlight, alpha//3), 
-                            (0, 0, self.width + 20, self.height + 20), 0, 5)
-            screen.blit(glow_surface, (self.x - 10, self.y - 10))
+            glow_alpha = min(255, self.reveal_timer * 15) // 3
+            glow_size = (self.width + 20, self.height + 20)
+            glow = sprite(("platform_glow", glow_size, highlight, glow_alpha), glow_size,
+                          lambda surf: pygame.draw.rect(surf, (*highlight, glow_alpha), (0, 0, *glow_size), 0, 5))
+            layer.add(glow, (x - 10, self.y - 10))
             
-            # Draw the main platform
-            pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height), 0, 3)
+            # The platform itself only changes with its size, type and direction
+            direction = self.move_direction if self.is_moving else 0
+            body = sprite(("platform", self.width, self.height, direction),
+                          (self.width + 25, self.height + 21), self.paint)
+            layer.add(body, (x, self.y))
+
+    def paint(self, surf):
+        """Draw the platform at (0, 0) of its sprite."""
+        color = MOVING_PLATFORM_COLOR if self.is_moving else PLATFORM_COLOR
+        highlight = MOVING_PLATFORM_HIGHLIGHT if self.is_moving else PLATFORM_HIGHLIGHT
+        
+        # Draw the main platform
+        pygame.draw.rect(surf, color, (0, 0, self.width, self.height), 0, 3)
+        
+        # Add some details to the platform
+        pattern_color = highlight
+        for i in range(0, self.width, 15):
+            pygame.draw.rect(surf, pattern_color, 
+                            (i, 5, 8, 3), 0, 2)
             
-            # Add some details to the platform
-            pattern_color = highlight
-            for i in range(0, self.width, 15):
-                pygame.draw.rect(screen, pattern_color, 
-                                (self.x + i, self.y + 5, 8, 3), 0, 2)
-                
-            # Add arrows to moving platforms
-            if self.is_moving:
-                for i in range(0, self.width, 30):
-                    arrow_x = self.x + i + 15
-                    arrow_y = self.y + self.height + 10
-                    # Simple arrow drawing
-                    if self.move_direction > 0:
-                        pygame.draw.polygon(screen, highlight, [
-                            (arrow_x, arrow_y),
-                            (arrow_x + 10, arrow_y + 5),
-                            (arrow_x, arrow_y + 10)
-                        ])
-                    else:
-                        pygame.draw.polygon(screen, highlight, [
-                            (arrow_x, arrow_y),
-                            (arrow_x - 10, arrow_y + 5),
-                            (arrow_x, arrow_y + 10)
-                        ])
+        # Add arrows to moving platforms
+        if self.is_moving:
+            for i in range(0, self.width, 30):
+                arrow_x = i + 15
+                arrow_y = self.height + 10
+                # Simple arrow drawing
+                if self.move_direction > 0:
+                    pygame.draw.polygon(surf, highlight, [
+                        (arrow_x, arrow_y),
+                        (arrow_x + 10, arrow_y + 5),
+                        (arrow_x, arrow_y + 10)
+                    ])
+                else:
+                    pygame.draw.polygon(surf, highlight, [
+                        (arrow_x, arrow_y),
+                        (arrow_x - 10, arrow_y + 5),
+                        (arrow_x, arrow_y + 10)
+                    ])
 
 class Danger:
+    __slots__ = ("x", "y", "width", "height", "center_x", "center_y", "revealed", "reveal_timer",
+                 "is_moving", "original_x", "original_y", "move_direction", "move_speed", "move_range", "pulse",
+                 "last_x")
+
     def __init__(self, x, y, width, height, is_moving=False):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
+        self.center_x = x + width/2  # Kept up to date when the danger moves
+        self.center_y = y + height/2
         self.revealed = False
         self.reveal_timer = 0
         self.is_moving = is_moving
@@ -289,11 +391,14 @@ class Danger:
         self.move_speed = 2 if is_moving else 0
         self.move_range = 150 if is_moving else 0
         self.pulse = 0
+        self.last_x = x
         
     def update(self, player):
+        self.last_x = self.x  # Store current x before moving, for drawing between steps
         # Move if it's a moving danger
         if self.is_moving:
             self.x += self.move_speed * self.move_direction
+            self.center_x = self.x + self.width/2
             if self.x > self.original_x + self.move_range or self.x < self.original_x - self.move_range:
                 self.move_direction *= -1
                 
@@ -301,19 +406,9 @@ class Danger:
         self.pulse = (self.pulse + 0.1) % (2 * math.pi)
         
         # Check if danger should be revealed by player's light pulse
-        if player.light_pulse > 0:
-            # Calculate distance from player to danger center
-            player_center_x = player.x + player.width/2
-            player_center_y = player.y + player.height/2
-            danger_center_x = self.x + self.width/2
-            danger_center_y = self.y + self.height/2
-            
-            distance = math.sqrt((player_center_x - danger_center_x)**2 + 
-                                (player_center_y - danger_center_y)**2)
-            
-            if distance < LIGHT_RADIUS:
-                self.revealed = True
-                self.reveal_timer = LIGHT_DURATION + 10
+        if player.lights(self.center_x, self.center_y):
+            self.revealed = True
+            self.reveal_timer = LIGHT_DURATION + 10
                 
         # Update reveal timer
         if self.revealed and self.reveal_timer > 0:
@@ -321,45 +416,64 @@ class Danger:
         elif self.reveal_timer <= 0:
             self.revealed = False
             
-    def draw(self, screen):
+    def draw(self, layer, offset_x=0, blend=1.0):
+        """Queue the danger zone's sprite on a SpriteBatch."""
+        # Interpolate between the last two physics steps, like the player, then apply the camera
+        x = self.last_x + (self.x - self.last_x) * blend - offset_x
         if self.revealed:
-            # Pulsing glow effect
-            pulse_intensity = 0.5 + 0.5 * math.sin(self.pulse)
-            alpha = min(255, self.reveal_timer * 15)
-            
-            # Draw danger zone with warning pattern
-            pygame.draw.rect(screen, (*DANGER_COLOR, alpha//2), 
-                            (self.x, self.y, self.width, self.height), 0, 3)
-            
-            # Draw warning stripes
-            stripe_width = 10
-            for i in range(0, self.width, stripe_width * 2):
-                pygame.draw.rect(screen, (255, 255, 255, alpha), 
-                                (self.x + i, self.y, stripe_width, self.height))
-            
-            # Draw skull icon in the center
-            center_x = self.x + self.width/2
-            center_y = self.y + self.height/2
-            
-            # Skull shape
-            pygame.draw.circle(screen, (255, 255, 255, alpha), (center_x, center_y - 5), 8)
-            pygame.draw.rect(screen, (255, 255, 255, alpha), (center_x-10, center_y, 20, 10))
-            
-            # Eye sockets
-            pygame.draw.circle(screen, (0, 0, 0, alpha), (center_x-4, center_y-5), 2)
-            pygame.draw.circle(screen, (0, 0, 0, alpha), (center_x+4, center_y-5), 2)
-            
-            # Teeth
-            for i in range(-2, 3, 2):
-                pygame.draw.rect(screen, (0, 0, 0, alpha), 
-                                (center_x + i - 1, center_y + 5, 2, 3))
+            pad = self.SPRITE_PAD
+            image = sprite(("danger", self.width, self.height),
+                           (self.width + 2 * pad, self.height + 2 * pad), self.paint)
+            layer.add(image, (x - pad, self.y - pad))
+
+    # The skull and the last stripe stick out of the zone by up to this much
+    SPRITE_PAD = 16
+
+    def paint(self, surf):
+        """
+        Draw the danger zone into its sprite, SPRITE_PAD in from the corner.
+        Colors are opaque: the display has no alpha, so the old per-frame
+        alpha never showed.
+        """
+        x = y = self.SPRITE_PAD
+        
+        # Draw danger zone with warning pattern
+        pygame.draw.rect(surf, DANGER_COLOR, 
+                        (x, y, self.width, self.height), 0, 3)
+        
+        # Draw warning stripes
+        stripe_width = 10
+        for i in range(0, self.width, stripe_width * 2):
+            pygame.draw.rect(surf, (255, 255, 255), 
+                            (x + i, y, stripe_width, self.height))
+        
+        # Draw skull icon in the center
+        center_x = x + self.width/2
+        center_y = y + self.height/2
+        
+        # Skull shape
+        pygame.draw.circle(surf, (255, 255, 255), (center_x, center_y - 5), 8)
+        pygame.draw.rect(surf, (255, 255, 255), (center_x-10, center_y, 20, 10))
+        
+        # Eye sockets
+        pygame.draw.circle(surf, (0, 0, 0), (center_x-4, center_y-5), 2)
+        pygame.draw.circle(surf, (0, 0, 0), (center_x+4, center_y-5), 2)
+        
+        # Teeth
+        for i in range(-2, 3, 2):
+            pygame.draw.rect(surf, (0, 0, 0), 
+                            (center_x + i - 1, center_y + 5, 2, 3))
 
 class Goal:
+    __slots__ = ("x", "y", "width", "height", "center_x", "center_y", "revealed", "reveal_timer", "pulse")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.width = 40
-        self.height = 60
+        self.width = level_data.GOAL_WIDTH
+        self.height = level_data.GOAL_HEIGHT
+        self.center_x = x + self.width/2  # The goal never moves
+        self.center_y = y + self.height/2
         self.revealed = False
         self.reveal_timer = 0
         self.pulse = 0
@@ -369,19 +483,9 @@ class Goal:
         self.pulse = (self.pulse + 0.05) % (2 * math.pi)
         
         # Check if goal should be revealed by player's light pulse
-        if player.light_pulse > 0:
-            # Calculate distance from player to goal
-            player_center_x = player.x + player.width/2
-            player_center_y = player.y + player.height/2
-            goal_center_x = self.x + self.width/2
-            goal_center_y = self.y + self.height/2
-            
-            distance = math.sqrt((player_center_x - goal_center_x)**2 + 
-                                (player_center_y - goal_center_y)**2)
-            
-            if distance < LIGHT_RADIUS:
-                self.revealed = True
-                self.reveal_timer = LIGHT_DURATION + 10
+        if player.lights(self.center_x, self.center_y):
+            self.revealed = True
+            self.reveal_timer = LIGHT_DURATION + 10
                 
         # Update reveal timer
         if self.revealed and self.reveal_timer > 0:
@@ -389,28 +493,28 @@ class Goal:
         elif self.reveal_timer <= 0:
             self.revealed = False
             
-    def draw(self, screen):
+    def draw(self, screen, offset_x=0):
+        x = self.x - offset_x  # Screen position under the camera
         if self.revealed:
             # Draw a pulsing glow effect
-            pulse_size = 10 + 5 * math.sin(self.pulse)
-            glow_surface = pygame.Surface((self.width + 40, self.height + 40), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (*GOAL_COLOR, 100), 
-                            (0, 0, self.width + 40, self.height + 40), 0, 10)
-            screen.blit(glow_surface, (self.x - 20, self.y - 20))
+            glow_size = (self.width + 40, self.height + 40)
+            glow_surface = sprite(("goal_glow", glow_size), glow_size, lambda surf: pygame.draw.rect(
+                surf, (*GOAL_COLOR, 100), (0, 0, *glow_size), 0, 10))
+            screen.blit(glow_surface, (x - 20, self.y - 20))
             
             # Draw the goal
-            pygame.draw.rect(screen, GOAL_COLOR, (self.x, self.y, self.width, self.height), 0, 5)
+            pygame.draw.rect(screen, GOAL_COLOR, (x, self.y, self.width, self.height), 0, 5)
             
             # Draw a door handle
-            pygame.draw.circle(screen, (255, 215, 0), (self.x + 30, self.y + 30), 5)
+            pygame.draw.circle(screen, (255, 215, 0), (x + 30, self.y + 30), 5)
             
             # Draw a light beam coming from the top
             beam_height = 20 + 10 * math.sin(self.pulse)
             points = [
-                (self.x + 10, self.y - beam_height),
-                (self.x + self.width - 10, self.y - beam_height),
-                (self.x + self.width - 5, self.y),
-                (self.x + 5, self.y)
+                (x + 10, self.y - beam_height),
+                (x + self.width - 10, self.y - beam_height),
+                (x + self.width - 5, self.y),
+                (x + 5, self.y)
             ]
             pygame.draw.polygon(screen, (*GOAL_COLOR, 150), points)
             
@@ -421,14 +525,16 @@ class Goal:
                 player.y + player.height > self.y)
 
 class Particle:
-    def __init__(self, x, y, color):
+    __slots__ = ("x", "y", "color", "size", "speed_x", "speed_y", "lifetime")
+
+    def __init__(self, x, y, color, rng=random):
         self.x = x
         self.y = y
         self.color = color
-        self.size = random.randint(2, 5)
-        self.speed_x = random.uniform(-2, 2)
-        self.speed_y = random.uniform(-3, 0)
-        self.lifetime = random.randint(20, 40)
+        self.size = rng.randint(2, 5)
+        self.speed_x = rng.uniform(-2, 2)
+        self.speed_y = rng.uniform(-3, 0)
+        self.lifetime = rng.randint(20, 40)
         
     def update(self):
         self.x += self.speed_x
@@ -438,283 +544,121 @@ class Particle:
         self.size = max(0, self.size - 0.1)
         return self.lifetime > 0
         
-    def draw(self, screen):
-        alpha = min(255, self.lifetime * 6)
-        pygame.draw.circle(screen, (*self.color, alpha), (int(self.x), int(self.y)), int(self.size))
+    def draw(self, layer, offset_x=0):
+        """Queue the particle on a SpriteBatch (the display has no alpha, so it is drawn opaque)."""
+        radius = int(self.size)
+        if radius >= 1:
+            layer.add_centered(circle(self.color, radius), (int(self.x - offset_x), int(self.y)))
 
 class Level:
-    def __init__(self, level_num):
+    def __init__(self, level_num, seed=0):
         self.level_num = level_num
+        self.seed = seed
         self.platforms = []
         self.dangers = []
         self.goal = None
-        self.player_start = (100, 300)
+        self.player_start = level_data.DEFAULT_SPAWN
         self.setup_level()
 
     def setup_level(self):
-        # Common ground platform
-        self.platforms.append(Platform(0, SCREEN_HEIGHT - 50, SCREEN_WIDTH))
+        # Common ground platform and a small platform directly below the spawn point
+        for x, y, w, h, m in level_data.common_platforms(self.player_start, SCREEN_WIDTH, SCREEN_HEIGHT):
+            self.platforms.append(Platform(x, y, w, h, bool(m)))
+
+        # Hand-made levels ship as level files; anything beyond them is
+        # generated from a seed and cached on disk
+        path = level_data.handmade_level_path(self.level_num)
+        if path is None:
+            path = level_cache.ensure(self.level_num, self.seed)
+        self.load(path)
 
-        # Add a small platform directly below the spawn point
+    def load(self, path):
+        """Stream a level file and build its entities in bulk."""
+        spawn, platforms, dangers, goal = level_data.read_level(path)
+        if spawn is not None:
+            self.player_start = spawn
+        self.platforms.extend([Platform(x, y, w, h, bool(m)) for x, y, w, h, m in platforms])
+        self.dangers.extend([Danger(x, y, w, h, bool(m)) for x, y, w, h, m in dangers])
+        self.goal = Goal(*level_data.resolve_goal(goal, Stream(self.seed, "light_jumper.goal")))
+
+class EndlessLevel:
+    """
+    Endless mode world, streamed in chunks of level_data.CHUNK_WIDTH pixels.
+    Chunks are generated ahead of the player on a background worker and
+    evicted once they fall behind, so only the chunks around the player hold
+    live entities and per-frame cost stays flat however far the player runs.
+    The live window only ever moves forward.
+    """
+    CHUNKS_BEHIND = 1
+    CHUNKS_AHEAD = 1
+    PREFETCH_AHEAD = 3
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.platforms = []
+        self.dangers = []
+        self.goal = None
+        self.player_start = level_data.DEFAULT_SPAWN
         spawn_x, spawn_y = self.player_start
-        spawn_platform_y = spawn_y + 40  # align to player bottom
-        self.platforms.append(Platform(spawn_x - 50, spawn_platform_y, 100, height=20))
-
-        if self.level_num == 1:
-            self.platforms.extend([
-                Platform(200, 550, 150),
-                Platform(450, 500, 100),
-                Platform(650, 450, 120),
-                Platform(350, 400, 100),
-                Platform(150, 350, 120),
-                Platform(500, 300, 150),
-                Platform(250, 250, 100),
-                Platform(600, 200, 120),
-                Platform(400, 150, 100),
-                Platform(150, 100, 150),
-            ])
-            # Randomize green door (goal) spawn point
-            goal_x = random.randint(700, SCREEN_WIDTH - 100)
-            goal_y = random.randint(40, 120)
-            self.goal = Goal(goal_x, goal_y)
-            
-        elif self.level_num == 2:
-            # Level 2 - Introduces moving platforms
-            self.platforms.extend([
-                Platform(200, 550, 150),
-                Platform(450, 500, 100, is_moving=True),
-                Platform(650, 450, 120),
-                Platform(350, 400, 100, is_moving=True),
-                Platform(150, 350, 120),
-                Platform(500, 300, 150),
-                Platform(250, 250, 100, is_moving=True),
-                Platform(600, 200, 120),
-                Platform(400, 150, 100),
-            ])
-            goal_x = random.randint(700, SCREEN_WIDTH - 100)
-            goal_y = random.randint(40, 120)
-            self.goal = Goal(goal_x, goal_y)
-            
-        elif self.level_num == 3:
-            # Level 3 - Introduces dangers
-            self.platforms.extend([
-                Platform(200, 550, 150),
-                Platform(450, 500, 100, is_moving=True),
-                Platform(650, 450, 120),
-                Platform(150, 350, 120),
-                Platform(500, 300, 150, is_moving=True),
-                Platform(250, 250, 100),
-                Platform(600, 200, 120),
-            ])
-            self.dangers.extend([
-                Danger(350, 400, 100, 20),
-                Danger(400, 150, 100, 20, is_moving=True),
-            ])
-            goal_x = random.randint(700, SCREEN_WIDTH - 100)
-            goal_y = random.randint(40, 120)
-            self.goal = Goal(goal_x, goal_y)
-            
-        elif self.level_num == 4:
-            # Level 4 - More complex with moving platforms and dangers
-            self.platforms.extend([
-                Platform(200, 550, 100, is_moving=True),
-                Platform(450, 500, 100),
-                Platform(700, 450, 100, is_moving=True),
-                Platform(150, 350, 100),
-                Platform(400, 300, 100, is_moving=True),
-                Platform(650, 250, 100),
-                Platform(300, 200, 100, is_moving=True),
-            ])
-            self.dangers.extend([
-                Danger(350, 400, 100, 20, is_moving=True),
-                Danger(500, 350, 100, 20),
-                Danger(200, 150, 100, 20, is_moving=True),
-            ])
-            goal_x = random.randint(700, SCREEN_WIDTH - 100)
-            goal_y = random.randint(40, 120)
-            self.goal = Goal(goal_x, goal_y)
-            
-        elif self.level_num == 5:
-            # Level 5 - Final challenge with narrow platforms and many dangers
-            self.platforms.extend([
-                Platform(200, 550, 80, is_moving=True),
-                Platform(450, 500, 80),
-                Platform(700, 450, 80, is_moving=True),
-                Platform(150, 400, 80),
-                Platform(400, 350, 80, is_moving=True),
-                Platform(650, 300, 80),
-                Platform(300, 250, 80, is_moving=True),
-                Platform(550, 200, 80),
-                Platform(200, 150, 80, is_moving=True),
-            ])
-            self.dangers.extend([
-                Danger(350, 450, 80, 20, is_moving=True),
-                Danger(500, 400, 80, 20),
-                Danger(250, 350, 80, 20, is_moving=True),
-                Danger(600, 250, 80, 20),
-                Danger(350, 200, 80, 20, is_moving=True),
-            ])
-            goal_x = random.randint(700, SCREEN_WIDTH - 100)
-            goal_y = random.randint(40, 120)
-            self.goal = Goal(goal_x, goal_y)
-                 
-        elif self.level_num == 6:
-            # Level 6 - Tiny moving platforms with traps below
-            self.platforms.extend([
-                Platform(200, 550, 60, is_moving=True),
-                Platform(400, 500, 60, is_moving=True),
-                Platform(600, 450, 60, is_moving=True),
-                Platform(800, 400, 60, is_moving=True),
-                Platform(500, 300, 60, is_moving=True),
-            ])
-            self.dangers.extend([
-                Danger(200, 570, 150, 20, is_moving=True),
-                Danger(450, 520, 120, 20),
-                Danger(650, 470, 100, 20, is_moving=True),
-            ])
-            self.goal = Goal(850, 120)
-
-        elif self.level_num == 7:
-            # Level 7 - Zigzag with criss-cross dangers
-            self.platforms.extend([
-                Platform(150, 550, 70),
-                Platform(350, 480, 70, is_moving=True),
-                Platform(550, 410, 70),
-                Platform(750, 340, 70, is_moving=True),
-                Platform(500, 250, 70),
-            ])
-            self.dangers.extend([
-                Danger(250, 530, 100, 20, is_moving=True),
-                Danger(450, 460, 120, 20, is_moving=True),
-                Danger(650, 390, 140, 20),
-                Danger(400, 220, 120, 20, is_moving=True),
-            ])
-            self.goal = Goal(780, 100)
-
-        elif self.level_num == 8:
-            # Level 8 - Narrow stacked platforms with heavy dangers
-            self.platforms.extend([
-                Platform(250, 550, 60, is_moving=True),
-                Platform(450, 480, 60),
-                Platform(650, 410, 60, is_moving=True),
-                Platform(350, 340, 60),
-                Platform(550, 270, 60, is_moving=True),
-                Platform(750, 200, 60),
-            ])
-            self.dangers.extend([
-                Danger(200, 520, 500, 20, is_moving=True),
-                Danger(300, 450, 400, 20),
-                Danger(400, 380, 300, 20, is_moving=True),
-                Danger(500, 310, 200, 20),
-                Danger(600, 240, 100, 20, is_moving=True),
-            ])
-            self.goal = Goal(800, 80)
-
-        elif self.level_num == 9:
-            # Level 9 - Tiny platforms + many dangers
-            self.platforms.extend([
-                Platform(200, 550, 60, is_moving=True),
-                Platform(400, 500, 60),
-                Platform(600, 450, 60, is_moving=True),
-                Platform(800, 400, 60),
-                Platform(500, 300, 60, is_moving=True),
-                Platform(300, 200, 60),
-            ])
-            self.dangers.extend([
-                Danger(250, 520, 100, 20, is_moving=True),
-                Danger(450, 470, 120, 20),
-                Danger(700, 350, 100, 20, is_moving=True),
-            ])
-            self.goal = Goal(850, 100)
-
-        elif self.level_num == 10:
-            # Level 10 - Criss-cross moving platforms
-            self.platforms.extend([
-                Platform(200, 550, 70, is_moving=True),
-                Platform(400, 500, 70, is_moving=True),
-                Platform(600, 450, 70, is_moving=True),
-                Platform(800, 400, 70, is_moving=True),
-                Platform(500, 300, 70, is_moving=True),
-            ])
-            self.dangers.extend([
-                Danger(300, 480, 80, 20, is_moving=True),
-                Danger(500, 380, 80, 20, is_moving=True),
-                Danger(700, 280, 80, 20, is_moving=True),
-            ])
-            self.goal = Goal(850, 150)
-
-        elif self.level_num == 11:
-            # Level 11 - Platforms vanish into voids
-            self.platforms.extend([
-                Platform(150, 550, 80),
-                Platform(350, 500, 60, is_moving=True),
-                Platform(550, 420, 60),
-                Platform(750, 340, 60, is_moving=True),
-                Platform(400, 250, 60),
-            ])
-            self.dangers.extend([
-                Danger(200, 520, 150, 20, is_moving=True),
-                Danger(600, 390, 150, 20),
-                Danger(450, 220, 150, 20, is_moving=True),
-            ])
-            self.goal = Goal(780, 120)
-
-        elif self.level_num == 12:
-            # Level 12 - Narrow corridors of dangers
-            self.platforms.extend([
-                Platform(200, 550, 60, is_moving=True),
-                Platform(400, 450, 60, is_moving=True),
-                Platform(600, 350, 60, is_moving=True),
-                Platform(800, 250, 60, is_moving=True),
-            ])
-            self.dangers.extend([
-                Danger(250, 520, 500, 20, is_moving=True),
-                Danger(250, 420, 500, 20, is_moving=True),
-                Danger(250, 320, 500, 20, is_moving=True),
-            ])
-            self.goal = Goal(850, 100)
-
-        elif self.level_num == 13:
-            # Level 13 - Pure chaos
-            for i in range(5):
-                self.platforms.append(Platform(200 + i*150, 550 - i*80, 50, is_moving=True))
-                self.dangers.append(Danger(180 + i*150, 530 - i*80, 120, 20, is_moving=True))
-            self.goal = Goal(900, 80)
+        self.start_platform = (spawn_x - 50, spawn_y + 40, 100, 20, 0)
 
+        # Chunk k starts where chunk k-1 ended, and the single worker runs
+        # jobs in submission order, so each job can wait on its predecessor
+        self.worker = ThreadPoolExecutor(max_workers=1)
+        self.pending = {}   # chunk index -> future of (platforms, dangers, end)
+        self.chunks = {}    # chunk index -> (platforms, dangers) as live entities
+        self.last_request = None
+        self.next_chunk = 0
+        self.current_chunk = -1
+        self.update_chunks(spawn_x)
 
+    @property
+    def min_x(self):
+        """Left edge of the oldest live chunk; the player cannot go further back."""
+        return max(0, self.current_chunk - self.CHUNKS_BEHIND) * level_data.CHUNK_WIDTH
 
+    def generate(self, index, previous):
+        if previous is None:
+            x, y, width, _, _ = self.start_platform
+            start = (x + width, y)
         else:
-            # For levels beyond 5, generate random challenging levels
-            self.generate_random_level()
-            
-    def generate_random_level(self):
-        # Generate a random challenging level
-        platform_y = 550
-        prev_x = 100
-        
-        for i in range(10 + self.level_num):
-            width = max(60, 120 - self.level_num * 5)
-            gap = random.randint(80, 150)
-            x = prev_x + gap
-            
-            # Occasionally add moving platforms
-            is_moving = random.random() < 0.3 + (self.level_num - 5) * 0.1
-            
-            self.platforms.append(Platform(x, platform_y, width, is_moving=is_moving))
-            
-            # Add dangers between platforms with increasing probability
-            if random.random() < 0.2 + (self.level_num - 5) * 0.05:
-                danger_width = random.randint(60, 120)
-                danger_x = prev_x + width + random.randint(10, gap - danger_width - 10)
-                is_moving_danger = random.random() < 0.3
-                self.dangers.append(Danger(danger_x, platform_y + 5, danger_width, 15, is_moving=is_moving_danger))
-            
-            prev_x = x
-            platform_y -= max(40, 80 - self.level_num * 3)
-            
-        goal_x = random.randint(700, SCREEN_WIDTH - 100)
-        goal_y = random.randint(40, 120)
-        self.goal = Goal(goal_x, goal_y)
+            start = previous.result()[2]
+        return level_data.generate_chunk(index, self.seed, start)
+
+    def update_chunks(self, player_x):
+        """Stream chunks around player_x in and out; returns True if the live set changed."""
+        current = int(player_x // level_data.CHUNK_WIDTH)
+        if current <= self.current_chunk:
+            return False
+        self.current_chunk = current
+
+        # Queue generation ahead of the player
+        while self.next_chunk <= current + self.PREFETCH_AHEAD:
+            self.last_request = self.worker.submit(self.generate, self.next_chunk, self.last_request)
+            self.pending[self.next_chunk] = self.last_request
+            self.next_chunk += 1
+
+        # Evict chunks that fell behind
+        first = max(0, current - self.CHUNKS_BEHIND)
+        for index in [i for i in self.chunks if i < first]:
+            del self.chunks[index]
+
+        # Build entities for chunks entering the live window (waits for the
+        # worker if it has fallen behind, so the world never depends on timing)
+        for index in range(first, current + self.CHUNKS_AHEAD + 1):
+            if index not in self.chunks:
+                platforms, dangers, _ = self.pending.pop(index).result()
+                if index == 0:
+                    platforms = [self.start_platform] + platforms
+                self.chunks[index] = (
+                    [Platform(x, y, w, h, bool(m)) for x, y, w, h, m in platforms],
+                    [Danger(x, y, w, h, bool(m)) for x, y, w, h, m in dangers],
+                )
+
+        live = [self.chunks[i] for i in sorted(self.chunks)]
+        self.platforms = [p for platforms, _ in live for p in platforms]
+        self.dangers = [d for _, dangers in live for d in dangers]
+        return True
 
 def draw_heart(screen, x, y, size=20, filled=True):
     """Draw a heart shape at the given position"""
@@ -761,20 +705,54 @@ class Button:
         return self.rect.collidepoint(mouse_pos) and mouse_pressed[0]
 
 class Game:
-    def __init__(self):
-        self.clock = pygame.time.Clock()
+    def __init__(self, seed=None):
+        self.pacer = FramePacer(FPS)  # Idles on the start screen
+        self.profiler = FrameProfiler()  # F3 shows where frame time goes
+        self.layer = SpriteBatch()
         self.level_num = 1
         self.max_level = 13
         self.game_state = "start"
+        self.mode = "levels"  # or "endless"
+        self.camera_x = 0
+        self.prev_camera_x = 0
+        self.distance = 0
         self.start_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 50, 300, 60, "START GAME", pixel_font_medium)
+        # Every random choice in the simulation derives from this seed,
+        # so a run can be reproduced from its inputs
+        self.streams = RandomStreams(seed)
+        self.seed = self.streams.seed
+        self.rng = self.streams.stream("particles")
+        # Next level is built in the background while the win screen is shown
+        self.level_loader = ThreadPoolExecutor(max_workers=1)
+        self.pending_level = None
+        self.running = False
+        self.closed = False  # Window closed, as opposed to Esc back to the launcher
         self.reset_game()
         
+    def build_level(self, level_num):
+        return Level(level_num, level_data.level_seed(self.seed, level_num))
+
+    def prefetch_next_level(self):
+        next_num = self.level_num + 1 if self.level_num < self.max_level else 1
+        self.pending_level = (next_num, self.level_loader.submit(self.build_level, next_num))
+
     def reset_game(self):
-        # Create level
-        self.level = Level(self.level_num)
+        # Create level (use the prefetched one if it is for this level)
+        if self.mode == "endless":
+            self.level = EndlessLevel(level_data.level_seed(self.seed, 0))
+        elif self.pending_level and self.pending_level[0] == self.level_num:
+            self.level = self.pending_level[1].result()
+        else:
+            self.level = self.build_level(self.level_num)
+        self.pending_level = None
         
         # Create player
         self.player = Player(*self.level.player_start)
+        if self.mode == "endless":
+            self.player.max_x = None
+        self.camera_x = 0
+        self.prev_camera_x = 0
+        self.distance = 0
         
         # Particles for effects
         self.particles = []
@@ -783,6 +761,27 @@ class Game:
         self.win_timer = 0
         self.level_transition_timer = 0
         
+    def start_mode(self, mode):
+        self.mode = mode
+        self.level_num = 1
+        self.reset_game()
+        self.game_state = "playing"
+
+    def update_endless(self):
+        """Stream chunks, move the camera and track progress in endless mode."""
+        player = self.player
+        self.level.update_chunks(player.x)
+        player.min_x = self.level.min_x
+
+        # Respawn above the last platform the player stood on
+        support = player.support
+        if player.on_ground and support is not None:
+            player.respawn_point = (support.x + support.width/2 - player.width/2,
+                                    support.y - player.height - 80)
+
+        self.camera_x = max(self.level.min_x, player.x - SCREEN_WIDTH // 3)
+        self.distance = max(self.distance, int(player.x - self.level.player_start[0]) // 10)
+
     def next_level(self):
         self.level_num += 1
         if self.level_num > self.max_level:
@@ -792,49 +791,97 @@ class Game:
         level_sound.play()
         
     def handle_events(self):
+        """Poll pygame for this frame's input and return it as a bitmask."""
         mouse_pos = pygame.mouse.get_pos()
         mouse_pressed = pygame.mouse.get_pressed()
+        inputs = 0
         
-        for event in pygame.event.get():
+        for event in self.pacer.events():
+            if self.profiler.handle_event(event):
+                continue
             if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+                self.running = False
+                self.closed = True
                 
             if event.type == KEYDOWN:
-                if self.game_state == "start":
-                    if event.key == K_SPACE:
-                        self.game_state = "playing"
-                elif self.game_state == "playing":
-                    if event.key == K_SPACE:
-                        self.player.jump()
-                
-                if event.key == K_r:
-                    self.level_num = 1
-                    self.reset_game()
-                    self.game_state = "playing"
-                    
-                if event.key == K_n and self.game_state == "win" and self.win_timer <= 0:
-                    self.next_level()
+                if event.key == K_ESCAPE:
+                    self.running = False
+                elif event.key == K_SPACE:
+                    inputs |= INPUT_JUMP
+                elif event.key == K_e:
+                    inputs |= INPUT_ENDLESS
+                elif event.key == K_r:
+                    inputs |= INPUT_RESTART
+                elif event.key == K_n:
+                    inputs |= INPUT_NEXT
                     
         # Handle start button click
         if self.game_state == "start":
             self.start_button.update(mouse_pos)
             if self.start_button.is_clicked(mouse_pos, mouse_pressed):
-                self.game_state = "playing"
+                inputs |= INPUT_START
                 
+        # Continuous key presses for movement
+        keys = pygame.key.get_pressed()
+        if keys[K_LEFT] or keys[K_a]:
+            inputs |= INPUT_LEFT
+        if keys[K_RIGHT] or keys[K_d]:
+            inputs |= INPUT_RIGHT
+        return inputs
+            
+    def apply_input(self, inputs):
+        """Apply one frame's input bitmask (live or from a replay) to the game."""
+        if self.game_state == "start":
+            if inputs & INPUT_JUMP:
+                self.start_mode("levels")
+            elif inputs & INPUT_ENDLESS:
+                self.start_mode("endless")
+        elif self.game_state == "playing":
+            if inputs & INPUT_JUMP:
+                self.player.jump()
+        
+        if inputs & INPUT_RESTART:
+            self.start_mode(self.mode)
+            
+        if inputs & INPUT_NEXT and self.game_state == "win" and self.win_timer <= 0:
+            self.next_level()
+            
+        if inputs & INPUT_START and self.game_state == "start":
+            self.start_mode("levels")
+            
         # Continuous key presses for movement
         if self.game_state == "playing":
-            keys = pygame.key.get_pressed()
             self.player.vel_x = 0
             
-            if keys[K_LEFT] or keys[K_a]:
+            if inputs & INPUT_LEFT:
                 self.player.vel_x = -PLAYER_SPEED
                 self.player.facing_right = False
                 
-            if keys[K_RIGHT] or keys[K_d]:
+            if inputs & INPUT_RIGHT:
                 self.player.vel_x = PLAYER_SPEED
                 self.player.facing_right = True
+
+    def state_checksum(self):
+        """CRC of the simulation state, used to verify replays frame by frame."""
+        player = self.player
+        state = (
+            self.game_state, self.mode, self.level_num, self.win_timer, self.level_transition_timer,
+            player.x, player.y, player.vel_x, player.vel_y, player.lives, player.invincible,
+            player.light_pulse, player.jump_count,
+            [(p.x, p.reveal_timer) for p in self.level.platforms],
+            [(d.x, d.reveal_timer) for d in self.level.dangers],
+            [(p.x, p.y, p.lifetime) for p in self.particles],
+        )
+        return zlib.crc32(repr(state).encode())
             
+    def step(self, inputs):
+        """Advance the simulation by one fixed physics step."""
+        self.player.prev_x = self.player.x
+        self.player.prev_y = self.player.y
+        self.prev_camera_x = self.camera_x
+        self.apply_input(inputs)
+        self.update()
+
     def update(self):
         if self.game_state == "playing":
             # Update player
@@ -853,22 +900,27 @@ class Game:
             for danger in self.level.dangers:
                 danger.update(self.player)
                 
-            # Update goal
-            self.level.goal.update(self.player)
+            if self.mode == "endless":
+                self.update_endless()
+            else:
+                # Update goal
+                self.level.goal.update(self.player)
             
             # Check if player reached the goal
-            if self.level.goal.check_collision(self.player):
+            if self.level.goal and self.level.goal.check_collision(self.player):
                 self.game_state = "win"
                 win_sound.play()
                 self.win_timer = 120  # 2 seconds at 60 FPS
+                self.prefetch_next_level()
                 
             # Add particles when player jumps
             if self.player.jumping and self.player.light_pulse == LIGHT_DURATION - 1:
                 for _ in range(20):
                     self.particles.append(Particle(
-                        self.player.x + self.player.width/2,
-                        self.player.y + self.player.height/2,
-                        LIGHT_PULSE_COLOR
+                        self.player.center_x,
+                        self.player.center_y,
+                        LIGHT_PULSE_COLOR,
+                        self.rng
                     ))
                     
             # Add particles when player lands
@@ -877,7 +929,8 @@ class Game:
                     self.particles.append(Particle(
                         self.player.x + self.player.width/2,
                         self.player.y + self.player.height,
-                        PLAYER_COLOR
+                        PLAYER_COLOR,
+                        self.rng
                     ))
                     
         elif self.game_state == "win":
@@ -890,6 +943,7 @@ class Game:
             if self.win_timer <= 0:
                 # Reset to level 1 on game over
                 self.level_num = 1
+                self.mode = "levels"
                 self.game_state = "start"
                 self.reset_game()
                 
@@ -899,18 +953,17 @@ class Game:
             if self.level_transition_timer <= 0:
                 self.next_level()
                 
-        # Update particles
-        self.particles = [p for p in self.particles if p.update()]
+        # Update particles, compacting the list in place rather than building a new one
+        live = 0
+        for particle in self.particles:
+            if particle.update():
+                self.particles[live] = particle
+                live += 1
+        del self.particles[live:]
         
     def draw_start_screen(self):
         # Draw background with stars
-        screen.fill(BACKGROUND)
-        for i in range(100):
-            x = (i * 97) % SCREEN_WIDTH
-            y = (i * 63) % SCREEN_HEIGHT
-            brightness = (i * 53) % 155 + 100
-            size = (i % 3) + 1
-            pygame.draw.circle(screen, (brightness, brightness, brightness), (x, y), size)
+        screen.blit(starfield.get(), (0, 0))
         
         # Draw title with pixel art font
         title_text = pixel_font_large.render("LIGHT JUMPER", True, (255, 215, 0))
@@ -930,7 +983,8 @@ class Game:
             "Use LEFT/RIGHT or A/D to move",
             "Press SPACE to jump and reveal platforms",
             "Avoid red danger zones!",
-            "Reach the glowing green door to win!"
+            "Reach the glowing green door to win!",
+            "Press E for endless mode"
         ]
         
         for i, line in enumerate(instructions):
@@ -938,51 +992,51 @@ class Game:
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 150 + i * 25))
             screen.blit(text, text_rect)
         
-    def draw_game(self):
+    def draw_game(self, blend=1.0):
         # Draw background with a starry effect
-        screen.fill(BACKGROUND)
-        
-        # Draw some stars in the background
-        for i in range(100):
-            x = (i * 97) % SCREEN_WIDTH  # Pseudo-random distribution
-            y = (i * 63) % SCREEN_HEIGHT
-            brightness = (i * 53) % 155 + 100
-            size = (i % 3) + 1
-            pygame.draw.circle(screen, (brightness, brightness, brightness), (x, y), size)
+        screen.blit(starfield.get(), (0, 0))
         
         # Draw goal
-        self.level.goal.draw(screen)
+        camera_x = self.prev_camera_x + (self.camera_x - self.prev_camera_x) * blend
+        if self.level.goal:
+            self.level.goal.draw(screen, camera_x)
         
-        # Draw platforms
+        # Platforms, dangers and particles are cached sprites, drawn in one batch.
+        # They only move (and refresh last_x) while playing; otherwise draw them where they stopped
+        entity_blend = blend if self.game_state == "playing" else 1.0
         for platform in self.level.platforms:
-            platform.draw(screen)
-            
-        # Draw dangers
+            platform.draw(self.layer, camera_x, entity_blend)
         for danger in self.level.dangers:
-            danger.draw(screen)
-            
-        # Draw particles
+            danger.draw(self.layer, camera_x, entity_blend)
         for particle in self.particles:
-            particle.draw(screen)
+            particle.draw(self.layer, camera_x)
+        self.layer.flush(screen)
             
         # Draw player
-        self.player.draw(screen)
+        self.player.draw(screen, camera_x, blend)
         
         # Draw UI
         self.draw_ui()
         
-    def draw(self):
+    def draw(self, blend=1.0):
+        # blend is how far rendering is between the last two physics steps
         if self.game_state == "start":
             self.draw_start_screen()
         else:
-            self.draw_game()
+            self.draw_game(blend)
+        self.profiler.mark("draw")
+        self.profiler.draw(screen)
         
         # Update display
         pygame.display.flip()
+        self.profiler.mark("flip")
         
     def draw_ui(self):
-        # Draw level indicator
-        level_text = ui_font.render(f"Level: {self.level_num}/{self.max_level}", True, TEXT_COLOR)
+        # Draw level indicator (distance run in endless mode)
+        if self.mode == "endless":
+            level_text = ui_font.render(f"Distance: {self.distance} m", True, TEXT_COLOR)
+        else:
+            level_text = ui_font.render(f"Level: {self.level_num}/{self.max_level}", True, TEXT_COLOR)
         screen.blit(level_text, (20, 20))
         
         # Draw jump counter
@@ -1011,9 +1065,7 @@ class Game:
         # Draw win message
         if self.game_state == "win":
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
+            screen.blit(shade((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 150)), (0, 0))
             
             if self.level_transition_timer > 0:
                 # Level transition message
@@ -1035,9 +1087,7 @@ class Game:
         # Draw game over message
         if self.game_state == "game_over":
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
+            screen.blit(shade((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 150)), (0, 0))
             
             game_over_text = title_font.render("Game Over!", True, DANGER_COLOR)
             screen.blit(game_over_text, (SCREEN_WIDTH//2 - game_over_text.get_width()//2, SCREEN_HEIGHT//2 - 50))
@@ -1045,15 +1095,83 @@ class Game:
             restart_text = ui_font.render("Returning to start screen...", True, TEXT_COLOR)
             screen.blit(restart_text, (SCREEN_WIDTH//2 - restart_text.get_width()//2, SCREEN_HEIGHT//2 + 20))
             
-    def run(self):
-        while True:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+    def run(self, recorder=None, render_fps=FPS):
+        """
+        Main loop. Physics runs in fixed SIM_DT steps fed by real elapsed
+        time, so game speed no longer depends on the frame rate; rendering
+        interpolates between the last two steps. Returns True if the window
+        was closed, False if the player left with Esc.
+        """
+        open_window()
+        held_keys = INPUT_LEFT | INPUT_RIGHT
+        accumulator = 0.0
+        pressed = 0
+        self.running = True
+        self.pacer.fps = render_fps
+        try:
+            while self.running:
+                # The start screen is static; every other state runs timers
+                accumulator += self.pacer.tick(self.game_state != "start") / 1000.0
+                accumulator = min(accumulator, SIM_DT * MAX_STEPS_PER_FRAME)
+                self.profiler.begin_frame()
+
+                # Held keys reflect the current frame; presses wait for a step
+                polled = self.handle_events()
+                pressed |= polled & ~held_keys
+                self.profiler.mark("events")
+                while accumulator >= SIM_DT:
+                    inputs = (polled & held_keys) | pressed
+                    self.step(inputs)
+                    if recorder:
+                        recorder.write_frame(inputs, self.state_checksum())
+                    accumulator -= SIM_DT
+                    pressed = 0
+                self.profiler.mark("update")
+
+                self.draw(accumulator / SIM_DT)
+                self.profiler.end_frame()
+        finally:
+            if recorder:
+                recorder.close()
+            self.profiler.close()
+        return self.closed
+
+    def run_headless(self, steps, inputs=None):
+        """
+        Run physics as fast as possible with no rendering or frame cap.
+        inputs(step) supplies each step's input bitmask. Returns steps/second.
+        """
+        start = time.perf_counter()
+        for i in range(steps):
+            self.step(inputs(i) if inputs else 0)
+        return steps / max(time.perf_counter() - start, 1e-9)
 
 # Create and run the game
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Light Jumper")
+    parser.add_argument("--seed", type=int, help="seed for a reproducible run")
+    parser.add_argument("--record", metavar="FILE", help="record inputs to a replay file")
+    parser.add_argument("--fps", type=int, default=FPS, help="render frame cap (0 = uncapped)")
+    parser.add_argument("--headless", type=int, metavar="STEPS",
+                        help="run STEPS physics steps in endless mode with no display and report the speed")
+    add_profile_argument(parser)
+    add_gc_argument(parser)
+    args = parser.parse_args()
+
+    game = Game(seed=args.seed)
+    if args.profile:
+        game.profiler.record_to(args.profile)
+    if args.profile_allocations:
+        game.profiler.track_allocations()
+    if args.gc_between_frames and not args.headless:
+        schedule_gc()  # Headless runs never tick the pacer, so nothing would be collected
+    if args.headless:
+        game.start_mode("endless")
+        rate = game.run_headless(args.headless, lambda step: INPUT_RIGHT | (INPUT_JUMP if step % 40 == 0 else 0))
+        print(f"{rate:.0f} physics steps/s ({rate / FPS:.0f}x real time)")
+    else:
+        game.run(InputRecorder(args.record, game.seed) if args.record else None, args.fps)
+        pygame.quit()
 
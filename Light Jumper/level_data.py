@@ -0,0 +1,286 @@
+"""
+Level file format, streaming loader and seed-addressed cache for Light Jumper.
+
+A level file is line-oriented text with one record per line:
+
+    LJL 1                      header (format name + version)
+    S <x> <y>                  player spawn point
+    P <x> <y> <w> <h> <m>      platform (m = 1 for a moving platform)
+    D <x> <y> <w> <h> <m>      danger zone (m = 1 for a moving danger)
+    G <x> <y>                  goal door at a fixed position
+    G <x0> <x1> <y0> <y1>      goal door placed at random inside a range
+
+Blank lines and lines starting with '#' are ignored. Records are read one
+line at a time, so even very large generated levels never need to be held
+in memory as text.
+"""
+
+import os
+import random
+
+FORMAT_HEADER = "LJL 1"
+
+# Hand-made levels ship with the game; generated levels are cached on disk
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LEVELS_DIR = os.path.join(BASE_DIR, "levels")
+CACHE_DIR = os.path.join(BASE_DIR, "level_cache")
+
+# Shared by every level, and by the reachability solver
+DEFAULT_SPAWN = (100, 300)
+GOAL_WIDTH = 40
+GOAL_HEIGHT = 60
+MOVING_PLATFORM_RANGE = 100
+
+# Player physics, shared by the game and the reachability solver
+GRAVITY = 0.8
+JUMP_STRENGTH = -16
+PLAYER_SPEED = 7
+PLAYER_WIDTH = 30
+PLAYER_HEIGHT = 40
+
+# Generated levels that fail the solver are regenerated from a new seed
+MAX_GENERATION_ATTEMPTS = 50
+
+# Endless mode streams the world in chunks this wide
+CHUNK_WIDTH = 1000
+
+# Number of integer fields each record type expects
+RECORD_FIELDS = {
+    "S": (2,),
+    "P": (5,),
+    "D": (5,),
+    "G": (2, 4),
+}
+
+
+def iter_records(lines, required=()):
+    """
+    Stream (tag, values) pairs from an iterable of level file lines.
+    Raises ValueError on a malformed line, a missing header or, at the end,
+    a missing record of one of the required tags.
+    """
+    header_seen = False
+    seen = set()
+    line_no = 0
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if not header_seen:
+            if line != FORMAT_HEADER:
+                raise ValueError(f"line {line_no}: expected '{FORMAT_HEADER}' header, got '{line}'")
+            header_seen = True
+            continue
+
+        tag, *fields = line.split()
+        if tag not in RECORD_FIELDS or len(fields) not in RECORD_FIELDS[tag]:
+            raise ValueError(f"line {line_no}: malformed record '{line}'")
+        seen.add(tag)
+        yield tag, tuple(map(int, fields))
+
+    if not header_seen:
+        raise ValueError("empty level file")
+    for tag in required:
+        if tag not in seen:
+            raise ValueError(f"line {line_no}: end of file without a '{tag}' record")
+
+
+def read_level(path):
+    """
+    Read a level file into plain tuples, grouped by record type.
+    Returns (spawn, platforms, dangers, goal); spawn may be None, and a file
+    without a goal raises ValueError.
+    """
+    spawn = goal = None
+    platforms = []
+    dangers = []
+    with open(path, "r", encoding="ascii") as f:
+        for tag, values in iter_records(f, required=("G",)):
+            if tag == "P":
+                platforms.append(values)
+            elif tag == "D":
+                dangers.append(values)
+            elif tag == "G":
+                goal = values
+            else:
+                spawn = values
+    return spawn, platforms, dangers, goal
+
+
+def write_level(path, spawn, platforms, dangers, goal):
+    """Write a level file; the file is replaced atomically."""
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "w", encoding="ascii") as f:
+        f.write(FORMAT_HEADER + "\n")
+        if spawn is not None:
+            f.write("S %d %d\n" % spawn)
+        f.writelines("P %d %d %d %d %d\n" % p for p in platforms)
+        f.writelines("D %d %d %d %d %d\n" % d for d in dangers)
+        if goal is not None:
+            f.write("G " + " ".join(str(v) for v in goal) + "\n")
+    os.replace(tmp_path, path)
+
+
+def resolve_goal(goal, rng=random):
+    """Turn a goal record into a fixed (x, y), picking inside a range if needed."""
+    if len(goal) == 2:
+        return goal
+    x0, x1, y0, y1 = goal
+    return rng.randint(x0, x1), rng.randint(y0, y1)
+
+
+def handmade_level_path(level_num):
+    """Path of the shipped file for a hand-made level, or None if there is none."""
+    path = os.path.join(LEVELS_DIR, f"level_{level_num:02d}.lvl")
+    return path if os.path.exists(path) else None
+
+
+def common_platforms(spawn, screen_width, screen_height):
+    """The ground and the small ledge under the spawn point, as records."""
+    spawn_x, spawn_y = spawn
+    return [
+        (0, screen_height - 50, screen_width, 20, 0),
+        (spawn_x - 50, spawn_y + 40, 100, 20, 0),  # align to player bottom
+    ]
+
+
+def generate_random_level(level_num, seed, screen_width):
+    """
+    Generate a random challenging level from a seed.
+    Platforms zigzag between the screen edges while climbing, so the whole
+    level stays on screen. Returns (platforms, dangers, goal) as records.
+    """
+    rng = random.Random(seed)
+    platforms = []
+    dangers = []
+    platform_y = 550
+    prev_x = 100
+    direction = 1
+
+    for i in range(10 + level_num):
+        width = max(60, 120 - level_num * 5)
+        gap = rng.randint(80, 150)
+        x = prev_x + direction * gap
+        # Turn around at the screen edges
+        if x < 20 or x + width > screen_width - 20:
+            direction = -direction
+            x = prev_x + direction * gap
+
+        # Occasionally add moving platforms
+        is_moving = rng.random() < 0.3 + (level_num - 5) * 0.1
+
+        platforms.append((x, platform_y, width, 20, int(is_moving)))
+
+        # Add dangers between platforms with increasing probability
+        if rng.random() < 0.2 + (level_num - 5) * 0.05:
+            danger_width = rng.randint(60, 120)
+            left = min(prev_x, x) + width
+            space = max(prev_x, x) - left
+            # Shrink the danger to fit inside the gap, or skip it if the gap is too narrow
+            danger_width = min(danger_width, space - 20)
+            if danger_width >= 20:
+                danger_x = left + rng.randint(10, space - danger_width - 10)
+                is_moving_danger = rng.random() < 0.3
+                dangers.append((danger_x, platform_y + 5, danger_width, 15, int(is_moving_danger)))
+
+        prev_x = x
+        # Stop climbing once the platforms reach the goal's height band
+        platform_y = max(160, platform_y - max(40, 80 - level_num * 3))
+
+    goal = (rng.randint(700, screen_width - 100), rng.randint(40, 120))
+    return platforms, dangers, goal
+
+
+def generate_chunk(index, seed, start):
+    """
+    Generate one endless-mode chunk covering x in [index, index + 1) * CHUNK_WIDTH.
+    start is (x, y) of the right edge of the previous chunk's last platform;
+    gaps and steps stay inside the jump envelope so every chunk connects to
+    the one before it. Returns (platforms, dangers, end) with end feeding
+    the next chunk.
+    """
+    rng = random.Random(level_seed(seed, index))
+    difficulty = min(index, 20)
+    end_x = (index + 1) * CHUNK_WIDTH
+    x, y = start
+    platforms = []
+    dangers = []
+
+    while True:
+        gap = rng.randint(60, 120 + difficulty * 4)
+        next_x = x + gap
+        if next_x >= end_x:
+            break
+        next_y = min(600, max(200, y + rng.randint(-100, 80)))
+        width = max(50, rng.randint(80, 150) - difficulty * 4)
+        is_moving = rng.random() < min(0.5, 0.05 * difficulty)
+        platforms.append((next_x, next_y, width, 20, int(is_moving)))
+
+        # Spikes to jump over on the wider platforms
+        if not is_moving and width >= 100 and rng.random() < min(0.4, 0.05 * difficulty):
+            dangers.append((next_x + width // 2 - 20, next_y - 15, 40, 15, 0))
+
+        x, y = next_x + width, next_y
+    return platforms, dangers, (x, y)
+
+
+class LevelCache:
+    """
+    Seed-addressed on-disk cache of generated levels.
+    The same (level number, seed) always maps to the same file, so a
+    generated level can be saved, shared and replayed exactly. When a solver
+    is given, unsolvable levels are rejected and regenerated before caching.
+    """
+    def __init__(self, directory=CACHE_DIR, screen_width=1000, screen_height=700, solver=None):
+        self.directory = directory
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.solver = solver
+
+    def path_for(self, level_num, seed):
+        return os.path.join(self.directory, f"level_{level_num:04d}_{seed:08x}.lvl")
+
+    def generate(self, level_num, seed):
+        """
+        Generate a level for seed, retrying with derived seeds until it is
+        solvable. Raises ValueError if no attempt is, rather than hand out
+        (and cache) a level that cannot be finished.
+        """
+        for attempt in range(MAX_GENERATION_ATTEMPTS):
+            attempt_seed = (seed + attempt * 0x9E3779B9) & 0xFFFFFFFF
+            platforms, dangers, goal = generate_random_level(level_num, attempt_seed, self.screen_width)
+            if self.solver is None or self.solver.is_level_solvable(
+                    platforms, goal, screen_width=self.screen_width, screen_height=self.screen_height):
+                return platforms, dangers, goal
+        raise ValueError(f"level {level_num}, seed {seed:#x}: no solvable level "
+                         f"in {MAX_GENERATION_ATTEMPTS} attempts")
+
+    def ensure(self, level_num, seed):
+        """Return the cached file for (level_num, seed), generating it on a miss."""
+        path = self.path_for(level_num, seed)
+        if not os.path.exists(path):
+            os.makedirs(self.directory, exist_ok=True)
+            platforms, dangers, goal = self.generate(level_num, seed)
+            write_level(path, None, platforms, dangers, goal)
+        return path
+
+
+def level_seed(game_seed, level_num):
+    """Derive a stable 32-bit seed for one level from the game seed."""
+    return (game_seed * 1000003 + level_num) & 0xFFFFFFFF
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Precompute generated Light Jumper levels into the cache.")
+    parser.add_argument("first_level", type=int)
+    parser.add_argument("last_level", type=int)
+    parser.add_argument("--seed", type=int, default=0, help="game seed the level seeds derive from")
+    args = parser.parse_args()
+
+    # Validate with the game's own solver, since the game trusts cached files
+    import level_solver
+    cache = LevelCache(solver=level_solver.game_solver(world_width=1000))
+    for num in range(args.first_level, args.last_level + 1):
+        print(cache.ensure(num, level_seed(args.seed, num)))
@@ -0,0 +1,233 @@
+"""
+Jump reachability analysis for Light Jumper levels.
+
+The player's jump envelope (how far sideways the player can travel before
+landing on a platform at a given height difference) is precomputed once
+from GRAVITY, JUMP_STRENGTH and PLAYER_SPEED. A level is then a graph of
+platforms: an edge exists when the envelope covers the gap between two
+platforms. A breadth-first search from the spawn platform tells whether
+the goal door can be touched.
+
+Platforms are one-way (the player only collides with them while falling),
+so nothing can block a jump from below and the envelope alone decides
+reachability. Dangers are ignored: they cost a life but never block a path.
+"""
+
+import math
+import os
+from collections import deque
+
+import level_data
+
+
+class JumpEnvelope:
+    """
+    Precomputed jump arc for one set of physics constants.
+    All offsets are in pixels relative to the player's feet at take-off;
+    positive dy means the landing surface is lower than the take-off one.
+    landing_band=None models Player.move's swept landing test; a number
+    models a fixed-depth band, where fast falls can skip a platform.
+    """
+    def __init__(self, gravity, jump_strength, speed, player_width, player_height,
+                 max_fall=800, landing_band=None):
+        self.gravity = gravity
+        self.jump_strength = jump_strength
+        self.speed = speed
+        self.player_width = player_width
+        self.player_height = player_height
+        self.landing_band = landing_band
+
+        # Feet offset and fall speed after each frame of a jump and of a
+        # plain walk off an edge, simulated the same way Player.move does
+        self.jump_arc = self._simulate(jump_strength, max_fall)
+        self.fall_arc = self._simulate(0, max_fall)
+        self.max_rise = -min(offset for offset, _ in self.jump_arc)
+
+        # reach[dy + max_rise] = furthest sideways distance to a landing at dy
+        self.reach = [self._landing_reach(dy) for dy in range(-int(self.max_rise), max_fall + 1)]
+        self.max_reach = max(self.reach)
+
+    def _simulate(self, vel_y, max_fall):
+        arc = []
+        offset = 0.0
+        while offset <= max_fall:
+            vel_y += self.gravity
+            offset += vel_y
+            arc.append((offset, vel_y))
+        return arc
+
+    def _landing_frame(self, arc, dy):
+        """First frame where Player.move would land on a surface dy below the feet."""
+        prev = 0.0
+        for frame, (offset, vel_y) in enumerate(arc, 1):
+            if vel_y > 0:
+                if self.landing_band is None:
+                    if prev <= dy <= offset:
+                        return frame
+                elif dy <= offset <= dy + self.landing_band:
+                    return frame
+            prev = offset
+        return None
+
+    def _landing_reach(self, dy):
+        frames = [f for f in (self._landing_frame(self.jump_arc, dy),
+                              self._landing_frame(self.fall_arc, dy)) if f is not None]
+        return self.speed * max(frames) if frames else -1
+
+    def landing_reach(self, dy):
+        """Furthest sideways distance to a landing dy below the feet (-1 if none)."""
+        index = int(round(dy + self.max_rise))
+        if index < 0 or index >= len(self.reach):
+            return -1
+        return self.reach[index]
+
+    def touch_reach(self, top, bottom):
+        """
+        Furthest sideways distance at which the player's box can overlap the
+        vertical band [top, bottom) (offsets relative to the feet) in mid-air.
+        """
+        best = -1
+        height = self.player_height
+        for frame, (offset, _) in enumerate(self.jump_arc, 1):
+            if offset - height < bottom and offset > top:
+                best = frame
+        if best < 0 and -height < bottom and 0 > top:
+            return 0  # Overlaps while standing still
+        return self.speed * best if best >= 0 else -1
+
+
+class LevelSolver:
+    """
+    Decides whether a level's goal is reachable from its spawn point.
+    world_width clamps the player the way Player.move does; use None for
+    levels that scroll.
+    """
+    def __init__(self, envelope, world_width=None):
+        self.envelope = envelope
+        self.world_width = world_width
+
+    def _standing_span(self, platform):
+        """Horizontal range of player x positions that overlap a platform."""
+        x, _, width, _, moving = platform
+        slack = level_data.MOVING_PLATFORM_RANGE if moving else 0
+        lo = x - slack - self.envelope.player_width
+        hi = x + slack + width
+        if self.world_width is not None:
+            lo = max(lo, 0)
+            hi = min(hi, self.world_width - self.envelope.player_width)
+        return lo, hi
+
+    def is_solvable(self, spawn, platforms, goal):
+        """BFS over the platform graph from the spawn platform to the goal."""
+        if not platforms:
+            return False
+        env = self.envelope
+        spans = [self._standing_span(p) for p in platforms]
+
+        # Spatial index: platforms bucketed by the x cells their span covers
+        cell = max(1, int(env.max_reach))
+        buckets = {}
+        for i, (lo, hi) in enumerate(spans):
+            for c in range(math.floor(lo / cell), math.floor(hi / cell) + 1):
+                buckets.setdefault(c, []).append(i)
+
+        # Start on whichever platform the player falls onto from spawn
+        spawn_x, spawn_y = spawn
+        spawn_feet = spawn_y + env.player_height
+        start = None
+        for i, (x, y, width, _, _) in enumerate(platforms):
+            if spans[i][0] <= spawn_x <= spans[i][1] and y >= spawn_feet:
+                if start is None or y < platforms[start][1]:
+                    start = i
+        if start is None:
+            return False
+
+        goal_x, goal_y = goal
+        goal_lo = goal_x - env.player_width
+        goal_hi = goal_x + level_data.GOAL_WIDTH
+
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            lo, hi = spans[i]
+            feet = platforms[i][1]
+
+            # Can the goal be touched from this platform?
+            gap = max(0, goal_lo - hi, lo - goal_hi)
+            if gap <= env.max_reach:
+                reach = env.touch_reach(goal_y - feet, goal_y + level_data.GOAL_HEIGHT - feet)
+                if 0 <= gap <= reach:
+                    return True
+
+            for c in range(math.floor((lo - cell) / cell), math.floor((hi + cell) / cell) + 1):
+                for j in buckets.get(c, ()):
+                    if j in seen:
+                        continue
+                    other_lo, other_hi = spans[j]
+                    gap = max(0, other_lo - hi, lo - other_hi)
+                    if gap <= env.landing_reach(platforms[j][1] - feet):
+                        seen.add(j)
+                        queue.append(j)
+        return False
+
+    def is_level_solvable(self, platforms, goal, spawn=level_data.DEFAULT_SPAWN,
+                          screen_width=1000, screen_height=700):
+        """Check a level file's records, adding the platforms every level shares."""
+        common = level_data.common_platforms(spawn, screen_width, screen_height)
+        return self.is_solvable(spawn, common + list(platforms), goal)
+
+    def check_seed(self, level_num, seed, screen_width=1000, screen_height=700):
+        platforms, _, goal = level_data.generate_random_level(level_num, seed, screen_width)
+        return self.is_level_solvable(platforms, goal, screen_width=screen_width,
+                                      screen_height=screen_height)
+
+
+def game_solver(world_width):
+    """The solver for the game's own physics (level_data) on a world_width-wide screen."""
+    envelope = JumpEnvelope(level_data.GRAVITY, level_data.JUMP_STRENGTH, level_data.PLAYER_SPEED,
+                            level_data.PLAYER_WIDTH, level_data.PLAYER_HEIGHT, landing_band=None)
+    return LevelSolver(envelope, world_width=world_width)
+
+
+def _check_seeds(solver, level_num, seeds):
+    return [solver.check_seed(level_num, seed) for seed in seeds]
+
+
+def validate_seeds(solver, level_num, seeds, workers=None, chunk_size=64):
+    """
+    Check many generator seeds for one level number across a process pool.
+    Returns a list of booleans in the same order as seeds.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # Imports multiprocessing; only needed here
+
+    seeds = list(seeds)
+    if workers == 1 or len(seeds) <= chunk_size:
+        return _check_seeds(solver, level_num, seeds)
+
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_result in pool.map(_check_seeds, [solver] * len(chunks),
+                                     [level_num] * len(chunks), chunks):
+            results.extend(chunk_result)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Measure how fast generated levels can be validated.")
+    parser.add_argument("--level", type=int, default=14)
+    parser.add_argument("--seeds", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    solver = game_solver(world_width=1000)
+    for workers in (1, args.workers):
+        start = time.perf_counter()
+        results = validate_seeds(solver, args.level, range(args.seeds), workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"workers={workers}: {args.seeds / elapsed:.0f} seeds/s, "
+              f"{sum(results)}/{len(results)} solvable")
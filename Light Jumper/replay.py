@@ -0,0 +1,110 @@
+"""
+Input recording and deterministic replay for Light Jumper.
+
+A replay file is a small header followed by one fixed-size record per
+simulated frame:
+
+    header:  b"LJR1" + seed (uint32)
+    frame:   input bitmask (uint8) + state checksum (uint32)
+
+Everything random in the simulation derives from the seed, so feeding the
+same inputs back through Game.update reproduces the run exactly. The
+checksums catch the first frame where a change to the physics makes a
+replay diverge.
+
+Replay a recording headlessly at full speed with:
+
+    python replay.py run.ljr
+"""
+
+import os
+import struct
+import sys
+
+MAGIC = b"LJR1"
+HEADER = struct.Struct("<4sI")
+FRAME = struct.Struct("<BI")
+
+# Per-frame input bits
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4      # SPACE pressed: jump, or start the level mode
+INPUT_ENDLESS = 8   # E pressed on the start screen
+INPUT_RESTART = 16  # R pressed
+INPUT_NEXT = 32     # N pressed on the level complete screen
+INPUT_START = 64    # Start button clicked
+
+
+class InputRecorder:
+    """Streams per-frame inputs and state checksums to a replay file."""
+    def __init__(self, path, seed):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, seed))
+        self.frames = 0
+
+    def write_frame(self, inputs, checksum):
+        self.file.write(FRAME.pack(inputs, checksum))
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+
+
+def read_replay(path):
+    """Return (seed, frames) where frames is a list of (inputs, checksum)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: truncated replay header")
+    magic, seed = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a Light Jumper replay")
+    body = memoryview(data)[HEADER.size:]
+    usable = len(body) - len(body) % FRAME.size  # ignore a torn final frame
+    return seed, list(FRAME.iter_unpack(body[:usable]))
+
+
+def load_game_module():
+    """Import Light Jumper.py without a real window or audio device."""
+    import importlib.util
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location("light_jumper", os.path.join(base_dir, "Light Jumper.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def replay(path, game_module=None):
+    """
+    Feed a recording back through Game.update as fast as possible.
+    Returns (frames replayed, first diverging frame or None).
+    """
+    seed, frames = read_replay(path)
+    if game_module is None:
+        game_module = load_game_module()
+    game = game_module.Game(seed=seed)
+
+    for frame, (inputs, checksum) in enumerate(frames):
+        game.step(inputs)
+        if game.state_checksum() != checksum:
+            return frame + 1, frame
+    return len(frames), None
+
+
+if __name__ == "__main__":
+    import time
+
+    if len(sys.argv) != 2:
+        sys.exit("usage: python replay.py <recording.ljr>")
+
+    module = load_game_module()
+    start = time.perf_counter()
+    count, diverged = replay(sys.argv[1], module)
+    elapsed = time.perf_counter() - start
+    print(f"Replayed {count} frames in {elapsed:.2f}s ({count / max(elapsed, 1e-9):.0f} frames/s)")
+    if diverged is not None:
+        sys.exit(f"State diverged at frame {diverged}")
+    print("All frame checksums match")
@@ -1,99 +1,179 @@
-import pygame
-import time
-import random
-pygame.font.init() # Initialize the font module
+import os
+import sys
 
-WIDTH, HEIGHT = 1000, 800
-WIN = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Rain Dodge") # Set the window title
+import pygame
+from hazards import Hazards
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Repository root, for common/
+from common.fonts import sys_font
+from common.lazy import Lazy, init_display
+from common.pacing import FramePacer, add_gc_argument, schedule_gc
+from common.profiler import FrameProfiler, add_profile_argument
 
-BG = pygame.Surface((WIDTH, HEIGHT))
-BG.fill((0, 0, 0))                         # Black background
+WIDTH, HEIGHT = 1000, 800
+WIN = None                                 # The window, opened by open_window()
+BG_COLOR = (0, 0, 0)                       # Black background
 
 PLAYER_WIDTH = 40        
 PLAYER_HEIGHT = 60
 
 PLAYER_VEL = 5
-STAR_WIDTH = 10
-STAR_HEIGHT = 20
-STAR_VEL = 3
 
-FONT = pygame.font.SysFont("comicsans", 30)  # Use a common font available on most systems
+FPS = 60
+FRAME_MS = 1000 / FPS    # Game time per frame in seeded (deterministic) mode
+
+FONT = Lazy(lambda: sys_font("comicsans", 30))  # Use a common font available on most systems (loaded on first use)
+SMALL_FONT = Lazy(lambda: sys_font("comicsans", 20))
+
+
+class TextCache:                             # Re-renders a text only when its value changes
+    def __init__(self, font, color, template):
+        self.font = font
+        self.color = color
+        self.template = template
+        self.value = None
+        self.surface = None
+
+    def render(self, value):
+        if value != self.value or self.surface is None:
+            self.value = value
+            self.surface = self.font.render(self.template.format(value), 1, self.color)
+        return self.surface
+
+
+TIME_TEXT = TextCache(FONT, "white", "Time: {}s")   # The timer only changes once per second
+
+PROFILER = FrameProfiler()                  # F3 shows where frame time goes
+
+
+def open_window():                           # Open (or take over) the window when play starts, not at import
+    global WIN
+    WIN = init_display((WIDTH, HEIGHT), "Rain Dodge")
+    return WIN
+
+
+class GameState:                             # One game's simulation, independent of the window and the clock
+    def __init__(self, seed=None):
+        self.player = pygame.Rect(200, HEIGHT - PLAYER_HEIGHT, PLAYER_WIDTH, PLAYER_HEIGHT)
+        self.hazards = Hazards(WIDTH, HEIGHT, seed)   # Per-type pools with precomputed spawn waves
+        self.game_time = 0                  # Time driving the spawn schedule (in milliseconds)
+        self.frames = 0
+        self.hit = False                    # Flag to indicate if the player has been hit
+
+    def step(self, move, dt=FRAME_MS):      # Advance one frame; move is -1 (left), 0 or 1 (right)
+        self.update(move, dt)
+        self.check_hit()
+
+    def update(self, move, dt=FRAME_MS):    # Move the player and the hazards
+        self.game_time += dt
+        self.frames += 1
+
+        player = self.player
+        if move < 0 and player.x - PLAYER_VEL >= 0:
+            player.x -= PLAYER_VEL
+        if move > 0 and player.x + PLAYER_VEL + player.width <= WIDTH:
+            player.x += PLAYER_VEL
+
+        self.hazards.update(self.game_time)          # Spawn due waves, move and cull every hazard
+
+    def check_hit(self):
+        if self.hazards.hit(self.player):            # Check all hazards for collision with the player
+            self.hit = True
 
 
-def draw(player, elapsed_time, stars): # Draw the game window
-    WIN.blit(BG, (0, 0))                        # Draw the background
+def draw(player, elapsed_time, hazards): # Draw the game window
+    WIN.fill(BG_COLOR)                          # Draw the background
 
-    time_text = FONT.render(f"Time: {round(elapsed_time)}s", 1, "white")       # Render the time text
+    time_text = TIME_TEXT.render(round(elapsed_time))                          # Cached time text
     WIN.blit(time_text, (10, 10))                                              # Draw the time text
 
     pygame.draw.rect(WIN, "red", player)                                       # Draw the player
 
-    for star in stars:                           # Draw the stars
-        pygame.draw.rect(WIN, "white", star)           # Draw each star
+    hazards.draw(WIN)                            # Draw every hazard type in batched blits
+    PROFILER.mark("draw")
 
+    PROFILER.draw(WIN)                           # Profiler overlay, when enabled
     pygame.display.update()                             # Update the display
+    PROFILER.mark("flip")
 
 
-def main():               
-    run = True                            # Main game loop
+def draw_game_over():                                   # Draw the lost screen over the last frame
+    lost_text = FONT.render("You Lost!", 1, "white")
+    restart_text = SMALL_FONT.render("Press R to play again", 1, "white")
+    WIN.blit(lost_text, (WIDTH/2 - lost_text.get_width()/2, HEIGHT/2 - lost_text.get_height()/2))
+    WIN.blit(restart_text, (WIDTH/2 - restart_text.get_width()/2, HEIGHT/2 + lost_text.get_height()/2 + 10))
+    pygame.display.update()
 
-    player = pygame.Rect(200, HEIGHT - PLAYER_HEIGHT, PLAYER_WIDTH, PLAYER_HEIGHT)      
-    clock = pygame.time.Clock()                                     # Clock to control frame rate
-    start_time = time.time()                                        # Record the start time
-    elapsed_time = 0
 
-    star_add_increment = 2000   # Initial time interval to add stars (in milliseconds)
-    star_count = 0            # Counter to track time for adding stars
+def main(seed=None):               
+    run(seed)
+    pygame.quit()                # Quit pygame
+
 
-    stars = []         # List to hold star rectangles
-    hit = False               # Flag to indicate if the player has been hit
+def run(seed=None):           # Play games until the player leaves; returns True if the window was closed
+    open_window()
+    result = "again"                      # Main game loop
+    pacer = FramePacer(FPS)                                         # Frame rate, idling on the lost screen
 
-    while run:
-        star_count += clock.tick(60)                          # Maintain 60 FPS and get the time since last tick
-        elapsed_time = time.time() - start_time
+    while result == "again":                                        # One iteration per game
+        result = play(pacer, seed)
 
-        if star_count > star_add_increment:                  # Time to add new stars
-            for _ in range(3):
-                star_x = random.randint(0, WIDTH - STAR_WIDTH)
-                star = pygame.Rect(star_x, -STAR_HEIGHT, STAR_WIDTH, STAR_HEIGHT) # Create a new star rectangle
-                stars.append(star)
+    PROFILER.close()             # Write the --profile dump
+    return result == "closed"
 
-            star_add_increment = max(200, star_add_increment - 50)   # Decrease interval to increase difficulty
-            star_count = 0
 
-        for event in pygame.event.get():      # Event handling
+def play(pacer, seed=None):   # Play one game; returns "again" (R), "back" (Esc) or "closed"
+    state = GameState(seed)
+    start_ticks = pygame.time.get_ticks()                           # Record the start time (same clock as pacer.tick)
+    elapsed_time = 0
+
+    while True:
+        dt = pacer.tick(not state.hit)                        # Maintain 60 FPS (a few once lost) and get the time since last tick
+        PROFILER.begin_frame()
+
+        for event in pacer.events():          # Event handling (waits for a key on the lost screen)
+            if PROFILER.handle_event(event):
+                continue
             if event.type == pygame.QUIT:                                      # If the window is closed
-                run = False
-                break                         # Exit the game loop
-                                                                    
-        keys = pygame.key.get_pressed()                                 # Get the current state of all keys
-        if keys[pygame.K_LEFT] and player.x - PLAYER_VEL >= 0:
-            player.x -= PLAYER_VEL
-        if keys[pygame.K_RIGHT] and player.x + PLAYER_VEL + player.width <= WIDTH:
-            player.x += PLAYER_VEL
+                return "closed"
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                return "back"                 # Leave the game (back to the launcher)
+            if state.hit and event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                return "again"                # Restart after losing
+
+        if state.hit:                                                   # Lost: wait for R without blocking
+            continue
 
-        for star in stars[:]:                        # Update star positions and check for collisions
-            star.y += STAR_VEL
-            if star.y > HEIGHT:
-                stars.remove(star)                   # Remove stars that have moved off the screen
-            elif star.y + star.height >= player.y and star.colliderect(player):                              # Check for collision with player
-                stars.remove(star)
-                hit = True
-                break
+        elapsed_time = (pygame.time.get_ticks() - start_ticks) / 1000
 
-        if hit:                                                                         # If the player has been hit
-            lost_text = FONT.render("You Lost!", 1, "white")
-            WIN.blit(lost_text, (WIDTH/2 - lost_text.get_width()/2, HEIGHT/2 - lost_text.get_height()/2))
-            pygame.display.update()
-            pygame.time.delay(4000)
-            break
+        keys = pygame.key.get_pressed()                                 # Get the current state of all keys
+        move = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+        PROFILER.mark("events")
+        state.update(move, FRAME_MS if seed is not None else dt)   # Seeded games advance a fixed step per frame
+        PROFILER.mark("update")
+        state.check_hit()
+        PROFILER.mark("collision")
 
-        draw(player, elapsed_time, stars)                      # Draw everything    
+        if state.hit:                                                                   # If the player has been hit
+            draw_game_over()
+            continue
 
-    pygame.quit()                # Quit pygame
+        draw(state.player, elapsed_time, state.hazards)        # Draw everything    
+        PROFILER.end_frame()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rain Dodge")
+    parser.add_argument("--seed", type=int, help="deterministic hazards for a reproducible run")
+    add_profile_argument(parser)
+    add_gc_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        PROFILER.record_to(args.profile)
+    if args.profile_allocations:
+        PROFILER.track_allocations()
+    if args.gc_between_frames:
+        schedule_gc()
+    main(args.seed)
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Array-backed pool of falling objects for Rain Dodge.
+
+Every live object is one slot in a set of NumPy columns (x, y, vy), packed
+at the front of the arrays. Moving, culling and collision testing are single
+vectorized operations over the live slice, so the per-frame cost in Python
+does not grow with the number of objects on screen.
+"""
+
+import itertools
+
+import numpy
+
+from common.sprites import blit_all
+
+
+class FallingObjectPool:
+    """
+    Falling objects of one size and motion, stored column-wise.
+    Objects start at velocity and gain acceleration every frame.
+    """
+    def __init__(self, width, height, velocity, acceleration=0.0, capacity=256):
+        self.width = width
+        self.height = height
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.x = numpy.zeros(capacity, dtype=numpy.float32)
+        self.y = numpy.zeros(capacity, dtype=numpy.float32)
+        self.vy = numpy.zeros(capacity, dtype=numpy.float32)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, xs, y):
+        """Add one object at each x in xs, all at height y."""
+        n = len(xs)
+        if self.count + n > len(self.x):
+            # Grow geometrically so spawning stays amortised O(1)
+            capacity = max(2 * len(self.x), self.count + n)
+            self.x = numpy.resize(self.x, capacity)
+            self.y = numpy.resize(self.y, capacity)
+            self.vy = numpy.resize(self.vy, capacity)
+        self.x[self.count:self.count + n] = xs
+        self.y[self.count:self.count + n] = y
+        self.vy[self.count:self.count + n] = self.velocity
+        self.count += n
+
+    def move(self):
+        """Advance every object by one frame."""
+        n = self.count
+        if self.acceleration:
+            self.vy[:n] += self.acceleration
+            self.y[:n] += self.vy[:n]
+        else:
+            self.y[:n] += self.velocity  # Constant speed: skip the velocity column
+
+    def cull(self, bottom):
+        """Drop every object whose top edge is below bottom, keeping the rest packed."""
+        n = self.count
+        keep = self.y[:n] <= bottom
+        kept = int(numpy.count_nonzero(keep))
+        if kept != n:
+            self._compact(keep, kept)
+
+    def hits(self, rect):
+        """Boolean mask of live objects overlapping a pygame.Rect."""
+        x = self.x[:self.count]
+        y = self.y[:self.count]
+        return ((x < rect.right) & (x + self.width > rect.left) &
+                (y < rect.bottom) & (y + self.height > rect.top))
+
+    def remove(self, mask):
+        """Drop the objects selected by a mask over the live slice."""
+        keep = ~mask
+        self._compact(keep, int(numpy.count_nonzero(keep)))
+
+    def _compact(self, keep, kept):
+        n = self.count
+        self.x[:kept] = self.x[:n][keep]
+        self.y[:kept] = self.y[:n][keep]
+        self.vy[:kept] = self.vy[:n][keep]
+        self.count = kept
+
+    def positions(self):
+        """Integer (x, y) pairs of the live objects, ready for Surface.blits."""
+        n = self.count
+        return numpy.stack((self.x[:n], self.y[:n]), axis=1).astype(numpy.int32).tolist()
+
+    def draw(self, surface, sprite):
+        """Blit one pre-rendered sprite at every live object in a single call."""
+        if self.count:
+            blit_all(surface, zip(itertools.repeat(sprite), self.positions()), self.count)
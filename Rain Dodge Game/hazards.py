@@ -0,0 +1,134 @@
+"""
+Data-driven hazard types and spawn scheduling for Rain Dodge.
+
+Each hazard type is a row in HAZARD_TYPES: size, speed, acceleration,
+color, when it first appears and how its spawn waves speed up. Every type
+gets its own FallingObjectPool, so adding a type adds one vectorized
+update per frame, not per-object Python work.
+
+Spawn waves are precomputed: a type's difficulty curve (the interval
+before each wave) is turned into absolute wave times and spawn positions
+up front, and each frame spawns everything that has come due with one
+searchsorted. With a seed the whole run is deterministic, which lets
+difficulty curves be compared headlessly.
+"""
+
+import numpy
+import pygame
+
+from common.rng import RandomStreams
+from falling_objects import FallingObjectPool
+
+# Waves are precomputed this far ahead, then extended as play goes on
+SCHEDULE_HORIZON = 120000  # ms
+
+
+class HazardType:
+    """One kind of falling hazard and its difficulty curve."""
+    def __init__(self, name, width, height, velocity, acceleration, color,
+                 unlock_time, first_interval, interval_step, min_interval, per_wave):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.velocity = velocity            # pixels per frame at spawn
+        self.acceleration = acceleration    # pixels per frame, per frame
+        self.color = color
+        self.unlock_time = unlock_time      # ms before the first wave
+        self.first_interval = first_interval
+        self.interval_step = interval_step  # each wave comes this much sooner
+        self.min_interval = min_interval
+        self.per_wave = per_wave
+
+    def difficulty_curve(self, first_wave, waves):
+        """Interval (ms) before each of waves waves, starting at wave first_wave."""
+        index = numpy.arange(first_wave, first_wave + waves)
+        return numpy.maximum(self.min_interval, self.first_interval - self.interval_step * index)
+
+
+HAZARD_TYPES = [
+    # The original stars: a wave of 3 every 2 s, 50 ms sooner each time, down to 200 ms
+    HazardType("star", 10, 20, 3.0, 0.0, "white", 0, 2000, 50, 200, 3),
+    HazardType("raindrop", 4, 16, 6.0, 0.0, (120, 170, 255), 15000, 3000, 40, 600, 2),
+    HazardType("hail", 14, 14, 1.0, 0.06, (200, 230, 255), 30000, 4000, 50, 1000, 1),
+    HazardType("meteor", 28, 28, 2.0, 0.1, (255, 150, 50), 60000, 6000, 100, 2000, 1),
+]
+
+
+class SpawnSchedule:
+    """Precomputed wave times and x positions for one hazard type."""
+    def __init__(self, hazard_type, screen_width, rng):
+        self.type = hazard_type
+        self.max_x = screen_width - hazard_type.width
+        self.rng = rng
+        self.times = numpy.zeros(0, dtype=numpy.float64)
+        self.xs = numpy.zeros((0, hazard_type.per_wave), dtype=numpy.int32)
+        self.next_wave = 0
+        self.extend(SCHEDULE_HORIZON)
+
+    def extend(self, until):
+        """Precompute waves up to time until (ms)."""
+        hazard = self.type
+        start = self.times[-1] if len(self.times) else hazard.unlock_time
+        waves = int((until - start) // hazard.min_interval) + 1
+        intervals = hazard.difficulty_curve(len(self.times), waves)
+        times = start + numpy.cumsum(intervals)
+        xs = self.rng.integers(0, self.max_x + 1, size=(waves, hazard.per_wave), dtype=numpy.int32)
+        self.times = numpy.concatenate((self.times, times))
+        self.xs = numpy.concatenate((self.xs, xs))
+
+    def due(self, now):
+        """x positions of every hazard whose wave time has passed since the last call."""
+        if now >= self.times[-1]:
+            self.extend(now + SCHEDULE_HORIZON)
+        end = int(numpy.searchsorted(self.times, now, side="right"))
+        xs = self.xs[self.next_wave:end].ravel()
+        self.next_wave = end
+        return xs
+
+
+class Hazards:
+    """Every hazard in play: one pool and one spawn schedule per type."""
+    def __init__(self, screen_width, screen_height, seed=None, types=HAZARD_TYPES):
+        self.screen_height = screen_height
+        self.types = types
+        self.pools = [FallingObjectPool(t.width, t.height, t.velocity, t.acceleration) for t in types]
+
+        # One random stream per type, named after it, so adding or reordering
+        # types never changes the others
+        streams = RandomStreams(seed)
+        self.seed = streams.seed
+        self.schedules = [SpawnSchedule(t, screen_width, streams.stream(t.name)) for t in types]
+        self.sprites = None
+
+    def __len__(self):
+        return sum(len(pool) for pool in self.pools)
+
+    def update(self, now):
+        """Spawn everything due by now (ms of game time) and advance one frame."""
+        for pool, schedule in zip(self.pools, self.schedules):
+            xs = schedule.due(now)
+            if len(xs):
+                pool.spawn(xs, -pool.height)
+            pool.move()
+            pool.cull(self.screen_height)
+
+    def hit(self, rect):
+        """True if any hazard overlaps rect; the hazards that hit are removed."""
+        hit = False
+        for pool in self.pools:
+            mask = pool.hits(rect)
+            if mask.any():
+                pool.remove(mask)
+                hit = True
+        return hit
+
+    def draw(self, surface):
+        if self.sprites is None:
+            # Pre-rendered once per type, then blitted in batches
+            self.sprites = []
+            for t in self.types:
+                sprite = pygame.Surface((t.width, t.height))
+                sprite.fill(t.color)
+                self.sprites.append(sprite)
+        for pool, sprite in zip(self.pools, self.sprites):
+            pool.draw(surface, sprite)
@@ -0,0 +1,196 @@
+"""
+Headless survival benchmark for Rain Dodge.
+
+Plays seeded games with a scripted dodging policy under the SDL dummy
+drivers, as fast as the engine can go (no frame cap). For every seed it
+records frames per second, the number of hazards alive over time and how
+long the policy survived; seeds are spread over a process pool and the
+results are summarized, and written to a JSON report with --report.
+
+    python survival_benchmark.py --seeds 32 --report survival.json
+    python survival_benchmark.py --seeds 8 --render     # include drawing
+"""
+
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+# Hazards alive are sampled this often (ms of game time)
+SAMPLE_INTERVAL = 1000
+
+# How far ahead (in frames) the dodging policy looks for falling hazards
+LOOKAHEAD_FRAMES = 40
+
+_game = None
+
+
+def load_game_module():
+    """Import Rain Dodge game.py without a real window or audio device."""
+    global _game
+    if _game is None:
+        import importlib.util
+
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        spec = importlib.util.spec_from_file_location("rain_dodge", os.path.join(base_dir, "Rain Dodge game.py"))
+        _game = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_game)
+    return _game
+
+
+def dodge_policy(state, game):
+    """
+    Scripted player: score standing still, stepping left and stepping right
+    by the hazards that will reach each spot soon, weighting the ones that
+    arrive sooner, and take the safest. Ties go away from the nearest
+    threats, or back towards the centre when nothing is close.
+    """
+    player = state.player
+    speed = game.PLAYER_VEL
+    candidates = (-1, 0, 1)
+    threat = numpy.zeros(3)
+    threat_x = threat_weight = 0.0
+    lefts = numpy.array([player.x - speed * LOOKAHEAD_FRAMES // 4, player.x,
+                         player.x + speed * LOOKAHEAD_FRAMES // 4])
+
+    for pool in state.hazards.pools:
+        n = pool.count
+        if not n:
+            continue
+        y = pool.y[:n]
+        vy = pool.vy[:n] if pool.acceleration else pool.velocity
+        frames_to_player = (player.top - (y + pool.height)) / numpy.maximum(vy, 0.1)
+        near = (frames_to_player < LOOKAHEAD_FRAMES) & (y < player.bottom)
+        if not near.any():
+            continue
+        x = pool.x[:n][near]
+        weight = 1.0 / (1.0 + numpy.maximum(frames_to_player[near], 0))
+        threat_x += float((weight * (x + pool.width / 2)).sum())
+        threat_weight += float(weight.sum())
+        for i, left in enumerate(lefts):
+            overlap = (x < left + player.width + speed) & (x + pool.width > left - speed)
+            threat[i] += weight[overlap].sum()
+
+    # Walls are never a way out
+    if player.x - speed < 0:
+        threat[0] = numpy.inf
+    if player.right + speed > game.WIDTH:
+        threat[2] = numpy.inf
+
+    best = threat.min()
+    choices = [move for move, t in zip(candidates, threat) if t == best]
+    if len(choices) == 1:
+        return choices[0]
+    if threat_weight:
+        preferred = -1 if threat_x / threat_weight > player.centerx else 1
+    elif abs(player.centerx - game.WIDTH // 2) > speed:
+        preferred = 1 if player.centerx < game.WIDTH // 2 else -1
+    else:
+        preferred = 0
+    if preferred in choices:
+        return preferred
+    return 0 if 0 in choices else choices[0]
+
+
+def run_seed(seed, max_time=180000, render=False):
+    """Play one seeded game to the first hit (or max_time ms); returns its stats."""
+    game = load_game_module()
+    if render:
+        game.open_window()
+    state = game.GameState(seed)
+    alive = []
+    next_sample = 0
+
+    start = time.perf_counter()
+    while not state.hit and state.game_time < max_time:
+        state.step(dodge_policy(state, game))
+        if render:
+            game.draw(state.player, state.game_time / 1000, state.hazards)
+        if state.game_time >= next_sample:
+            alive.append(len(state.hazards))
+            next_sample += SAMPLE_INTERVAL
+    elapsed = time.perf_counter() - start
+
+    return {
+        "seed": seed,
+        "survival_time": state.game_time / 1000,
+        "survived": not state.hit,
+        "frames": state.frames,
+        "fps": state.frames / elapsed if elapsed else 0.0,
+        "alive": alive,
+    }
+
+
+def summarize(results):
+    """Aggregate per-seed results into the report."""
+    survival = [r["survival_time"] for r in results]
+    fps = [r["fps"] for r in results]
+
+    # Mean hazards alive per sample, over the seeds still playing at that time
+    longest = max(len(r["alive"]) for r in results)
+    alive_curve = []
+    for i in range(longest):
+        samples = [r["alive"][i] for r in results if i < len(r["alive"])]
+        alive_curve.append(round(statistics.mean(samples), 1))
+
+    return {
+        "seeds": len(results),
+        "survival_time": {
+            "mean": statistics.mean(survival),
+            "median": statistics.median(survival),
+            "min": min(survival),
+            "max": max(survival),
+        },
+        "survived_to_limit": sum(r["survived"] for r in results),
+        "fps": {"mean": statistics.mean(fps), "min": min(fps), "max": max(fps)},
+        "alive_per_second": alive_curve,
+        "peak_alive": max(max(r["alive"]) for r in results if r["alive"]),
+        "runs": [{key: r[key] for key in ("seed", "survival_time", "frames", "fps")} for r in results],
+    }
+
+
+def _run_seed_args(args):
+    return run_seed(*args)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Rain Dodge survival time and engine speed headlessly.")
+    parser.add_argument("--seeds", type=int, default=16, help="number of seeded games")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max-time", type=float, default=180, help="stop a game after this many seconds")
+    parser.add_argument("--render", action="store_true", help="draw every frame to the dummy display")
+    parser.add_argument("--report", metavar="FILE", help="write the summary report to this JSON file")
+    args = parser.parse_args()
+
+    jobs = [(seed, args.max_time * 1000, args.render)
+            for seed in range(args.first_seed, args.first_seed + args.seeds)]
+    start = time.perf_counter()
+    if args.workers == 1:
+        results = [_run_seed_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(_run_seed_args, jobs))
+    wall = time.perf_counter() - start
+
+    report = summarize(results)
+    report["wall_time"] = wall
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+
+    survival = report["survival_time"]
+    print(f"{args.seeds} seeds in {wall:.1f}s, {report['fps']['mean']:.0f} frames/s per game")
+    print(f"survival: mean {survival['mean']:.1f}s, median {survival['median']:.1f}s, "
+          f"min {survival['min']:.1f}s, max {survival['max']:.1f}s "
+          f"({report['survived_to_limit']} reached {args.max_time:.0f}s)")
+    print(f"peak hazards alive: {report['peak_alive']}")
+    if args.report:
+        print(f"report written to {args.report}")
@@ -1,17 +1,26 @@
 import pygame
+import os
 import sys
 import math
-import random
 from pygame import mixer
 
-# Initialize pygame
-pygame.init()
-mixer.init()
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Repository root, for common/
+from common import assets
+from common.fonts import sys_font
+from common.lazy import Lazy, init_display, init_mixer
+from common.pacing import FramePacer, add_gc_argument, schedule_gc
+from common.profiler import FrameProfiler, add_profile_argument
+from common.rng import RandomStreams, Stream
+from common.sprites import SpriteBatch, circle, shade
 
 # Screen dimensions
 WIDTH, HEIGHT = 1000, 700
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Sling-Ship Asteroids")
+screen = None  # Opened by open_window() when the game starts, not at import
+
+def open_window():
+    global screen
+    screen = init_display((WIDTH, HEIGHT), "Sling-Ship Asteroids")  # Reuses the launcher's window
+    return screen
 
 # Colors
 BLACK = (0, 0, 0)
@@ -22,10 +31,12 @@ BLUE = (50, 100, 255)
 YELLOW = (255, 255, 50)
 PURPLE = (180, 70, 220)
 ORANGE = (255, 150, 50)
+FIRE_COLORS = [(255, green, 50) for green in range(100, 201, 20)]  # Explosion particle shades
 
 # Game variables
-clock = pygame.time.Clock()
 FPS = 60
+profiler = FrameProfiler()  # F3 shows where frame time goes
+streams = RandomStreams()  # Every random draw in play; main() reseeds it
 score = 0
 lives = 3
 level = 1
@@ -46,16 +57,17 @@ def create_ship_image():
     return surf
 
 def create_asteroid_image(size):
+    rng = Stream(size, "sling_ship.asteroid")  # Fixed, like the cached image
     surf = pygame.Surface((size, size), pygame.SRCALPHA)
     # Create rocky asteroid appearance
     pygame.draw.circle(surf, (150, 150, 150), (size//2, size//2), size//2)
     
     # Add crater details
     for _ in range(size//10):
-        x = random.randint(size//4, 3*size//4)
-        y = random.randint(size//4, 3*size//4)
-        crater_size = random.randint(2, size//8)
-        brightness = random.randint(100, 140)
+        x = rng.randint(size//4, 3*size//4)
+        y = rng.randint(size//4, 3*size//4)
+        crater_size = rng.randint(2, size//8)
+        brightness = rng.randint(100, 140)
         pygame.draw.circle(surf, (brightness, brightness, brightness), (x, y), crater_size)
     
     return surf
@@ -68,23 +80,24 @@ def create_projectile_image():
     return surf
 
 def create_background_image():
+    rng = Stream(0, "sling_ship.background")
     surf = pygame.Surface((WIDTH, HEIGHT))
     surf.fill(BLACK)
     
     # Create starfield
     for _ in range(200):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        size = random.randint(1, 3)
-        brightness = random.randint(150, 255)
+        x = rng.randint(0, WIDTH)
+        y = rng.randint(0, HEIGHT)
+        size = rng.randint(1, 3)
+        brightness = rng.randint(150, 255)
         pygame.draw.circle(surf, (brightness, brightness, brightness), (x, y), size)
     
     # Add some nebulae
     for _ in range(5):
-        x = random.randint(0, WIDTH)
-        y = random.randint(0, HEIGHT)
-        radius = random.randint(50, 200)
-        color = random.choice([(50, 50, 100), (100, 50, 100), (50, 100, 100)])
+        x = rng.randint(0, WIDTH)
+        y = rng.randint(0, HEIGHT)
+        radius = rng.randint(50, 200)
+        color = rng.choice([(50, 50, 100), (100, 50, 100), (50, 100, 100)])
         for r in range(radius, 0, -10):
             alpha = max(0, 50 - r//4)
             s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
@@ -93,18 +106,19 @@ def create_background_image():
     
     return surf
 
-# Create game assets
-ship_img = create_ship_image()
-asteroid_imgs = [
-    create_asteroid_image(80),
-    create_asteroid_image(70),
-    create_asteroid_image(60)
-]
-projectile_img = create_projectile_image()
-background_img = create_background_image()
+# Create game assets (generated on first use, then loaded from the asset
+# cache on later launches; unwrap with .get() to blit)
+ship_img = Lazy(lambda: assets.surface(("sling_ship.ship",), create_ship_image))
+asteroid_imgs = Lazy(lambda: [
+    assets.surface(("sling_ship.asteroid", size), lambda: create_asteroid_image(size))
+    for size in (80, 70, 60)
+])
+projectile_img = Lazy(lambda: assets.surface(("sling_ship.projectile",), create_projectile_image))
+background_img = Lazy(lambda: assets.surface(("sling_ship.background", WIDTH, HEIGHT), create_background_image))
 
 # Create simple sound effects programmatically
 def create_beep_sound(frequency=440, duration=100):
+    import numpy
     sample_rate = 44100
     n_samples = int(round(duration * 0.001 * sample_rate))
     buf = numpy.zeros((n_samples, 2), dtype=numpy.int16)
@@ -117,30 +131,28 @@ def create_beep_sound(frequency=440, duration=100):
     
     return pygame.sndarray.make_sound(buf)
 
-# Try to create sounds, fallback to silent sounds if numpy not available
-try:
-    import numpy
-    shoot_sound = create_beep_sound(800, 50)
-    explosion_sound = create_beep_sound(200, 200)
-    level_up_sound = create_beep_sound(1000, 300)
-except:
-    # Create silent sounds as fallback
-    shoot_sound = mixer.Sound(buffer=bytearray())
-    explosion_sound = mixer.Sound(buffer=bytearray())
-    level_up_sound = mixer.Sound(buffer=bytearray())
+# Try to create sounds, fallback to silent sounds if numpy not available.
+# Each sound (and the mixer) is created the first time it is played
+def create_sound(frequency, duration):
+    init_mixer()
+    try:
+        return assets.sound(("sling_ship.beep", frequency, duration), lambda: create_beep_sound(frequency, duration))
+    except:
+        # Create a silent sound as fallback
+        return mixer.Sound(buffer=bytearray())
+
+shoot_sound = Lazy(lambda: create_sound(800, 50))
+explosion_sound = Lazy(lambda: create_sound(200, 200))
+level_up_sound = Lazy(lambda: create_sound(1000, 300))
 
-# Fonts
-try:
-    font_large = pygame.font.SysFont("arial", 48, bold=True)
-    font_medium = pygame.font.SysFont("arial", 36)
-    font_small = pygame.font.SysFont("arial", 24)
-except:
-    # Fallback fonts
-    font_large = pygame.font.Font(None, 48)
-    font_medium = pygame.font.Font(None, 36)
-    font_small = pygame.font.Font(None, 24)
+# Fonts (a missing system font falls back to pygame's default)
+font_large = Lazy(lambda: sys_font("arial", 48, bold=True))
+font_medium = Lazy(lambda: sys_font("arial", 36))
+font_small = Lazy(lambda: sys_font("arial", 24))
 
 class Player:
+    __slots__ = ("x", "y", "radius", "angle", "dragging", "drag_start", "drag_end", "power", "max_power")
+
     def __init__(self):
         self.x = WIDTH // 2
         self.y = HEIGHT // 2
@@ -175,7 +187,7 @@ class Player:
     
     def draw(self, screen):
         # Draw ship
-        rotated_ship = pygame.transform.rotate(ship_img, math.degrees(-self.angle) - 90)
+        rotated_ship = pygame.transform.rotate(ship_img.get(), math.degrees(-self.angle) - 90)
         ship_rect = rotated_ship.get_rect(center=(self.x, self.y))
         screen.blit(rotated_ship, ship_rect)
         
@@ -196,6 +208,8 @@ class Player:
             pygame.draw.rect(screen, WHITE, (20, HEIGHT - 40, 200, 20), 2)
 
 class Projectile:
+    __slots__ = ("x", "y", "radius", "speed", "vx", "vy", "lifetime")
+
     def __init__(self, x, y, angle, power):
         self.x = x
         self.y = y
@@ -224,37 +238,40 @@ class Projectile:
         pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), self.radius - 3)
 
 class Asteroid:
+    __slots__ = ("size", "radius", "x", "y", "vx", "vy", "rotation", "rotation_speed", "img")
+
     def __init__(self, size=3):
         self.size = size  # 3=large, 2=medium, 1=small
         self.radius = size * 15 + 10  # Radius based on size
         
         # Spawn from edges
-        side = random.randint(0, 3)
+        rng = streams.stream("asteroids")
+        side = rng.randint(0, 3)
         if side == 0:  # Top
-            self.x = random.randint(0, WIDTH)
+            self.x = rng.randint(0, WIDTH)
             self.y = -self.radius
         elif side == 1:  # Right
             self.x = WIDTH + self.radius
-            self.y = random.randint(0, HEIGHT)
+            self.y = rng.randint(0, HEIGHT)
         elif side == 2:  # Bottom
-            self.x = random.randint(0, WIDTH)
+            self.x = rng.randint(0, WIDTH)
             self.y = HEIGHT + self.radius
         else:  # Left
             self.x = -self.radius
-            self.y = random.randint(0, HEIGHT)
+            self.y = rng.randint(0, HEIGHT)
             
         # Move toward center with some randomness
-        dx = WIDTH/2 - self.x + random.uniform(-100, 100)
-        dy = HEIGHT/2 - self.y + random.uniform(-100, 100)
+        dx = WIDTH/2 - self.x + rng.uniform(-100, 100)
+        dy = HEIGHT/2 - self.y + rng.uniform(-100, 100)
         dist = math.sqrt(dx*dx + dy*dy)
-        speed = random.uniform(1.0, 3.0) / size  # Smaller asteroids are faster
+        speed = rng.uniform(1.0, 3.0) / size  # Smaller asteroids are faster
         self.vx = (dx / dist) * speed
         self.vy = (dy / dist) * speed
         
         # Rotation
         self.rotation = 0
-        self.rotation_speed = random.uniform(-0.05, 0.05)
-        self.img = random.choice(asteroid_imgs)
+        self.rotation_speed = rng.uniform(-0.05, 0.05)
+        self.img = rng.choice(asteroid_imgs.get())
         
     def update(self):
         self.x += self.vx
@@ -284,70 +301,90 @@ class Asteroid:
         return []
 
 class Explosion:
+    """
+    A burst of particles, stored as columns rather than one object each.
+    Every particle starts at the explosion's centre and flies in a straight
+    line, so its position is the centre plus velocity * age, and update()
+    only counts frames. Particles are sorted longest-lived first, so the
+    live ones are always the first `alive`. Each particle keeps one of the
+    FIRE_COLORS, so the explosion needs only a few cached circle sprites.
+    """
+    __slots__ = ("x", "y", "size", "radius", "lifetime", "age", "alive",
+                 "vx", "vy", "lifetimes", "sizes", "colors")
+
     def __init__(self, x, y, size):
         self.x = x
         self.y = y
         self.size = size
         self.radius = size * 10
-        self.particles = []
         self.lifetime = 20
+        self.age = 0  # Frames since the explosion
         
         # Create explosion particles
+        rng = streams.stream("particles")
+        shades = streams.stream("explosion_colors")  # Drawing only; kept apart from the simulation
+        particles = []
         for _ in range(size * 10):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(1, 5)
-            lifetime = random.randint(10, 30)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'lifetime': lifetime,
-                'size': random.randint(2, 5)
-            })
+            angle = rng.uniform(0, math.pi * 2)
+            speed = rng.uniform(1, 5)
+            lifetime = rng.randint(10, 30)
+            particles.append((lifetime, math.cos(angle) * speed, math.sin(angle) * speed, rng.randint(2, 5),
+                              shades.choice(FIRE_COLORS)))
+        particles.sort(key=lambda p: -p[0])
+        self.lifetimes = [p[0] for p in particles]
+        self.vx = [p[1] for p in particles]
+        self.vy = [p[2] for p in particles]
+        self.sizes = [p[3] for p in particles]
+        self.colors = [p[4] for p in particles]
+        self.alive = len(particles)
     
     def update(self):
         self.lifetime -= 1
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['lifetime'] -= 1
+        self.age += 1
             
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p['lifetime'] > 0]
+        # Drop the particles that just died off the end
+        while self.alive and self.lifetimes[self.alive - 1] <= self.age:
+            self.alive -= 1
         
-        return self.lifetime <= 0 and len(self.particles) == 0
+        return self.lifetime <= 0 and self.alive == 0
     
-    def draw(self, screen):
-        for p in self.particles:
-            alpha = min(255, p['lifetime'] * 25)
-            color = (255, random.randint(100, 200), 50, alpha)
-            pygame.draw.circle(screen, color, (int(p['x']), int(p['y'])), p['size'])
+    def draw(self, layer):
+        """Queue the particles on a SpriteBatch (opaque: the display has no alpha)."""
+        x, y, age = self.x, self.y, self.age
+        for i in range(self.alive):
+            layer.add_centered(circle(self.colors[i], self.sizes[i]),
+                               (int(x + self.vx[i] * age), int(y + self.vy[i] * age)))
 
 class Star:
+    __slots__ = ("x", "y", "size", "speed", "brightness")
+
     def __init__(self):
-        self.x = random.randint(0, WIDTH)
-        self.y = random.randint(0, HEIGHT)
-        self.size = random.uniform(0.1, 2.0)
-        self.speed = random.uniform(0.1, 0.5)
-        self.brightness = random.randint(100, 255)
+        rng = streams.stream("stars")
+        self.x = rng.randint(0, WIDTH)
+        self.y = rng.randint(0, HEIGHT)
+        self.size = int(rng.uniform(0.1, 2.0))  # pygame draws the radius truncated: 0 or 1
+        self.speed = rng.uniform(0.1, 0.5)
+        self.brightness = rng.randint(100, 255)
         
     def update(self):
         self.y += self.speed
         if self.y > HEIGHT:
             self.y = 0
-            self.x = random.randint(0, WIDTH)
+            self.x = streams.stream("stars").randint(0, WIDTH)
             
-    def draw(self, screen):
+    def draw(self, layer):
+        """Queue the star on a SpriteBatch."""
+        if not self.size:
+            return  # pygame draws nothing below radius 1
         color = (self.brightness, self.brightness, self.brightness)
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
+        layer.add_centered(circle(color, self.size), (int(self.x), int(self.y)))
 
 def check_collision(obj1, obj2):
     # Simple circle-based collision detection
     dx = obj1.x - obj2.x
     dy = obj1.y - obj2.y
-    distance = math.sqrt(dx*dx + dy*dy)
-    return distance < (obj1.radius + obj2.radius)
+    reach = obj1.radius + obj2.radius
+    return dx*dx + dy*dy < reach*reach  # Squared, so no sqrt
 
 def spawn_asteroids(count, size=3):
     return [Asteroid(size) for _ in range(count)]
@@ -366,8 +403,20 @@ def draw_text(screen, text, font, color, x, y, align="center"):
     screen.blit(text_surface, text_rect)
     return text_rect
 
-def main():
-    global score, lives, level, game_over, level_complete, asteroids_destroyed, asteroids_to_destroy
+def main(seed=None):
+    """Play until the player leaves; returns True if the window was closed, False on Esc."""
+    global score, lives, level, game_over, level_complete, asteroids_destroyed, asteroids_to_destroy, streams
+    open_window()
+    streams = RandomStreams(seed)  # The whole run replays from this seed
+    
+    # Start from a fresh game, also when the launcher runs it again
+    score = 0
+    lives = 3
+    level = 1
+    game_over = False
+    level_complete = False
+    asteroids_destroyed = 0
+    asteroids_to_destroy = 5
     
     # Game objects
     player = Player()
@@ -375,19 +424,27 @@ def main():
     asteroids = spawn_asteroids(3 + level, 3)  # More asteroids at higher levels
     explosions = []
     stars = [Star() for _ in range(100)]
+    layer = SpriteBatch()  # Stars and explosion particles go out in one blit each
     
     # Game loop
+    pacer = FramePacer(FPS)  # Idles while the game over / level complete screen waits for a key
     running = True
+    closed = False
     mouse_click = False
     mouse_release = False
     
     while running:
+        profiler.begin_frame()
+
         # Event handling
         mouse_click = False
         mouse_release = False
-        for event in pygame.event.get():
+        for event in pacer.events():
+            if profiler.handle_event(event):
+                continue
             if event.type == pygame.QUIT:
                 running = False
+                closed = True
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
@@ -419,6 +476,7 @@ def main():
         
         # Get mouse position
         mouse_pos = pygame.mouse.get_pos()
+        profiler.mark("events")
         
         # Update game state if not game over
         if not game_over and not level_complete:
@@ -460,6 +518,7 @@ def main():
                     
                     if lives <= 0:
                         game_over = True
+            profiler.mark("update")
             
             # Check collisions between projectiles and asteroids
             projectiles_to_remove = []
@@ -507,6 +566,7 @@ def main():
             
             # Add new asteroids from splits
             asteroids.extend(new_asteroids)
+            profiler.mark("collision")
             
             # Update explosions
             explosions_to_remove = []
@@ -521,13 +581,15 @@ def main():
             # Update stars for parallax background
             for star in stars:
                 star.update()
+            profiler.mark("effects")
         
         # Draw everything
-        screen.blit(background_img, (0, 0))
+        screen.blit(background_img.get(), (0, 0))
         
         # Draw stars
         for star in stars:
-            star.draw(screen)
+            star.draw(layer)
+        layer.flush(screen)
         
         # Draw game objects
         for asteroid in asteroids:
@@ -537,7 +599,8 @@ def main():
             projectile.draw(screen)
             
         for explosion in explosions:
-            explosion.draw(screen)
+            explosion.draw(layer)
+        layer.flush(screen)
             
         player.draw(screen)
         
@@ -553,9 +616,7 @@ def main():
         
         # Game over screen
         if game_over:
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
+            screen.blit(shade((WIDTH, HEIGHT), (0, 0, 0, 180)), (0, 0))
             
             draw_text(screen, "GAME OVER", font_large, RED, WIDTH // 2, HEIGHT // 2 - 50)
             draw_text(screen, f"Final Score: {score}", font_medium, WHITE, WIDTH // 2, HEIGHT // 2 + 20)
@@ -563,9 +624,7 @@ def main():
         
         # Level complete screen
         if level_complete:
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
+            screen.blit(shade((WIDTH, HEIGHT), (0, 0, 0, 180)), (0, 0))
             
             draw_text(screen, "LEVEL COMPLETE!", font_large, GREEN, WIDTH // 2, HEIGHT // 2 - 50)
             draw_text(screen, f"Score: {score}", font_medium, WHITE, WIDTH // 2, HEIGHT // 2 + 20)
@@ -574,15 +633,34 @@ def main():
         # Instructions
         if not game_over and not level_complete and len(projectiles) == 0 and not player.dragging:
             draw_text(screen, "Click and drag to aim, release to fire", font_small, YELLOW, WIDTH // 2, HEIGHT - 40)
+        profiler.mark("draw")
+        profiler.draw(screen)
         
         # Update display
         pygame.display.flip()
+        profiler.mark("flip")
+        profiler.end_frame()
         
         # Control frame rate
-        clock.tick(FPS)
+        pacer.tick(animating=not (game_over or level_complete))
     
-    pygame.quit()
-    sys.exit()
+    profiler.close()
+    return closed
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sling-Ship Asteroids")
+    parser.add_argument("--seed", type=int, help="seed for reproducible asteroids and effects")
+    add_profile_argument(parser)
+    add_gc_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        profiler.record_to(args.profile)
+    if args.profile_allocations:
+        profiler.track_allocations()
+    if args.gc_between_frames:
+        schedule_gc()
+    main(args.seed)
+    pygame.quit()
+    sys.exit()
\ No newline at end of file
@@ -3,16 +3,33 @@ Snake Game Upgrade
 Enhanced version of the classic Snake game with improved visuals, gameplay features, and code organization.
 """
 
+import argparse
 import tkinter
-import random  
+import time
+from collections import deque
+
+import snake_autopilot
+import snake_state
 
 # Game configuration constants
-ROWS = 25
-COLS = 25
 TILE_SIZE = 25
+MAX_VIEW_CELLS = 25  # Largest number of cells shown along each side
 
-WINDOW_WIDTH = TILE_SIZE * COLS  # 25*25 = 625
-WINDOW_HEIGHT = TILE_SIZE * ROWS  # 25*25 = 625
+def configure_board(rows, cols):
+    """
+    Sets the board size and the window size that follows from it.
+    Boards bigger than the window scroll to follow the head.
+    """
+    global ROWS, COLS, VIEW_ROWS, VIEW_COLS, WINDOW_WIDTH, WINDOW_HEIGHT
+    ROWS = rows
+    COLS = cols
+    VIEW_ROWS = min(ROWS, MAX_VIEW_CELLS)
+    VIEW_COLS = min(COLS, MAX_VIEW_CELLS)
+    WINDOW_WIDTH = TILE_SIZE * VIEW_COLS  # 25*25 = 625
+    WINDOW_HEIGHT = TILE_SIZE * VIEW_ROWS  # 25*25 = 625
+
+# Board size (25x25 by default, see --rows/--cols)
+configure_board(snake_state.ROWS, snake_state.COLS)
 
 # Game colors
 BACKGROUND_COLOR = "black"
@@ -21,15 +38,11 @@ SNAKE_BODY_COLOR = "green"
 FOOD_COLOR = "red"
 TEXT_COLOR = "white"
 GAME_OVER_COLOR = "red"
+SNAKE_BODY_ALT_COLOR = "light green"
 
-class Tile:
-    """
-    Represents a single tile/position in the game grid.
-    Used for snake segments and food items.
-    """
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+def cell_to_xy(cell):
+    """Top-left pixel position of a packed cell index (row * COLS + col)."""
+    return (cell % COLS) * TILE_SIZE, (cell // COLS) * TILE_SIZE
 
 def create_window():
     """
@@ -69,196 +82,321 @@ def center_window(window):
 
 def initialize_game():
     """
-    Initializes all game variables to their starting state.
+    Starts a new game and drops any buffered input from the previous one.
     """
-    global snake, food, velocityX, velocityY, snake_body, game_over, score
-    
-    # Snake starts in the middle of the grid
-    snake = Tile(TILE_SIZE * (COLS // 2), TILE_SIZE * (ROWS // 2))
-    
-    # Place first food at random position
-    food = Tile(
-        random.randint(0, COLS-1) * TILE_SIZE,
-        random.randint(0, ROWS-1) * TILE_SIZE
-    )
-    
-    # Initial movement direction (stationary)
-    velocityX = 0
-    velocityY = 0
-    
-    # Snake body starts empty (just the head)
-    snake_body = []
-    
-    # Game state
-    game_over = False
-    score = 0
+    global state
+    state = snake_state.GameState(ROWS, COLS)
+    inputs.clear()
+    if autopilot is not None:
+        autopilot.reset()
+
+# Arrow keys to movement directions
+KEY_DIRECTIONS = {
+    "Up": snake_state.UP,
+    "Down": snake_state.DOWN,
+    "Left": snake_state.LEFT,
+    "Right": snake_state.RIGHT,
+}
 
 def change_direction(e):
     """
     Handles keyboard input to change snake direction.
-    Prevents 180-degree turns that would cause immediate collision.
+    Turns are buffered and applied one per tick; step() rejects 180-degree
+    turns against the direction the snake actually last moved in.
     """
-    global velocityX, velocityY, game_over
-    
-    # Ignore input if game is over
-    if game_over:
-        return
-    
-    # Map key presses to direction changes with collision prevention
-    if e.keysym == "Up" and velocityY != 1:      # Can't turn up if moving down
-        velocityX = 0
-        velocityY = -1
-    elif e.keysym == "Down" and velocityY != -1: # Can't turn down if moving up
-        velocityX = 0
-        velocityY = 1
-    elif e.keysym == "Left" and velocityX != 1:  # Can't turn left if moving right
-        velocityX = -1
-        velocityY = 0
-    elif e.keysym == "Right" and velocityX != -1: # Can't turn right if moving left
-        velocityX = 1
-        velocityY = 0
-    elif e.keysym == "r" or e.keysym == "R":     # Restart game with 'R' key
+    if e.keysym == "r" or e.keysym == "R":     # Restart game with 'R' key
         reset_game()
+    elif e.keysym == "a" or e.keysym == "A":   # Toggle autopilot with 'A' key
+        toggle_autopilot()
+    elif e.keysym in KEY_DIRECTIONS and not state.game_over:
+        inputs.push(KEY_DIRECTIONS[e.keysym])
 
 def reset_game():
     """
     Resets the game to its initial state after game over.
     """
-    global game_over
-    if game_over:
+    if state.game_over:
         initialize_game()
+        renderer.reset()
+        scheduler.resync()
 
-def wrap_around_walls():
+def toggle_autopilot():
     """
-    Implements wrap-around behavior when snake hits walls.
-    Snake will appear from the opposite side of the screen.
+    Hands the controls to the autopilot, or takes them back.
+    The autopilot (and its Hamiltonian cycle) is only built on first use.
     """
-    global snake
-    
-    # Wrap around horizontal boundaries
-    if snake.x < 0:
-        snake.x = WINDOW_WIDTH - TILE_SIZE  # Appear from right side
-    elif snake.x >= WINDOW_WIDTH:
-        snake.x = 0  # Appear from left side
-    
-    # Wrap around vertical boundaries
-    if snake.y < 0:
-        snake.y = WINDOW_HEIGHT - TILE_SIZE  # Appear from bottom
-    elif snake.y >= WINDOW_HEIGHT:
-        snake.y = 0  # Appear from top
+    global autopilot, autopilot_on
+    if autopilot is None:
+        autopilot = snake_autopilot.Autopilot(ROWS, COLS)
+    autopilot_on = not autopilot_on
+    inputs.clear()
+    if not autopilot_on:
+        mean, p99, worst = autopilot.latency_report()
+        print(f"Autopilot decision time: mean {mean:.1f} us, p99 {p99:.1f} us, max {worst:.1f} us")
+    renderer.shown_autopilot = None  # Refresh the status line
 
-def move():
+class Renderer:
     """
-    Updates the game state by moving the snake and checking for collisions.
-    Implements wrap-around wall behavior instead of game over on wall collision.
+    Retained-mode renderer for the game canvas.
+    Every canvas item is created once and then moved or restyled in place,
+    so a tick only touches the head, the tail, the food and (when the score
+    changes) the text. Per-tick cost does not grow with the snake's length.
     """
-    global snake, food, snake_body, game_over, score
-    
-    # Don't update if game is over
-    if game_over:
-        return
-    
-    # Check wall collisions and implement wrap-around
-    wrap_around_walls()
-    
-    # Check self-collision (game over only on self-collision)
-    for tile in snake_body:
-        if snake.x == tile.x and snake.y == tile.y:
-            game_over = True
+    def __init__(self, canvas):
+        self.canvas = canvas
+
+        # Static background grid, drawn once
+        draw_grid()
+
+        self.food_item = canvas.create_rectangle(0, 0, 0, 0, fill=FOOD_COLOR,
+                                                 outline="dark red", width=2)
+
+        # Body segment items, front = segment nearest the head, plus a pool
+        # of hidden items left over from a previous (longer) game
+        self.body_items = deque()
+        self.spare_items = []
+        self.front_color = SNAKE_BODY_ALT_COLOR
+
+        self.head_item = canvas.create_rectangle(0, 0, 0, 0, fill=SNAKE_HEAD_COLOR,
+                                                 outline="dark green", width=2)
+
+        # In-game information
+        self.score_item = canvas.create_text(50, 15, font="Arial 12 bold", fill=TEXT_COLOR, tags="hud")
+        self.length_item = canvas.create_text(WINDOW_WIDTH - 50, 15, font="Arial 10",
+                                              fill=TEXT_COLOR, tags="hud")
+        # Display wrap-around feature indicator
+        canvas.create_text(WINDOW_WIDTH/2, 15, font="Arial 8",
+                           text="Wrap-Around Walls: ON", fill="yellow", tags="hud")
+        # Autopilot status and decision latency
+        self.status_item = canvas.create_text(WINDOW_WIDTH/2, WINDOW_HEIGHT - 12, font="Arial 8",
+                                              fill="yellow", tags="hud")
+
+        # Game over screen (only from self-collision now), hidden until needed
+        self.final_score_item = canvas.create_text(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 10, font="Arial 18",
+                                                   fill=TEXT_COLOR, tags="game_over")
+        canvas.create_text(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 30, font="Arial 25 bold",
+                           text="GAME OVER", fill=GAME_OVER_COLOR, tags="game_over")
+        canvas.create_text(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 40, font="Arial 12",
+                           text="Press 'R' to Restart", fill=TEXT_COLOR, tags="game_over")
+
+        self.shown_score = None
+        self.shown_game_over = None
+        self.shown_autopilot = None
+        self.reset()
+
+    def reset(self):
+        """Return all body items to the pool after a restart."""
+        while self.body_items:
+            item = self.body_items.pop()
+            self.canvas.itemconfigure(item, state="hidden")
+            self.spare_items.append(item)
+
+    def new_body_item(self):
+        """A visible body segment item, reused from the pool when possible."""
+        if self.spare_items:
+            item = self.spare_items.pop()
+            self.canvas.itemconfigure(item, state="normal")
+            return item
+        item = self.canvas.create_rectangle(0, 0, 0, 0, outline="dark green", width=1)
+        # Keep the head and the text above the new segment
+        self.canvas.tag_raise(self.food_item)
+        self.canvas.tag_raise(self.head_item)
+        self.canvas.tag_raise("hud")
+        self.canvas.tag_raise("game_over")
+        return item
+
+    def place(self, item, cell):
+        x, y = cell_to_xy(cell)
+        self.canvas.coords(item, x, y, x + TILE_SIZE, y + TILE_SIZE)
+
+    def update(self, moved):
+        """Bring the canvas in line with the game state after one tick."""
+        canvas = self.canvas
+        snake_cells = state.cells
+        food = state.food
+
+        if moved and len(snake_cells) > 1:
+            # The body gained a segment where the head was: either a new
+            # item (the snake grew) or the old tail item moved to the front
+            if len(snake_cells) - 1 > len(self.body_items):
+                item = self.new_body_item()
+            else:
+                item = self.body_items.pop()
+            self.body_items.appendleft(item)
+
+            # Alternate colors along the body
+            self.front_color = SNAKE_BODY_ALT_COLOR if self.front_color == SNAKE_BODY_COLOR else SNAKE_BODY_COLOR
+            canvas.itemconfigure(item, fill=self.front_color)
+            self.place(item, snake_cells[1])
+
+        self.place(self.head_item, snake_cells[0])
+        if food is not None:
+            self.place(self.food_item, food)
+        else:
+            self.canvas.coords(self.food_item, 0, 0, 0, 0)
+        self.update_text()
+
+    def update_text(self):
+        """Only re-render text when it changes."""
+        canvas = self.canvas
+        score = state.score
+        game_over = state.game_over
+        if score != self.shown_score:
+            self.shown_score = score
+            canvas.itemconfigure(self.score_item, text=f"Score: {score}")
+            canvas.itemconfigure(self.length_item, text=f"Length: {len(state.cells)}")
+            self.shown_autopilot = None
+        if self.shown_autopilot is None:
+            self.shown_autopilot = autopilot_on
+            if autopilot_on:
+                mean, p99, worst = autopilot.latency_report()
+                status = f"Autopilot ON - decision p99 {p99:.0f} us, max {worst:.0f} us"
+            else:
+                status = "Press 'A' for Autopilot"
+            canvas.itemconfigure(self.status_item, text=status)
+        if game_over != self.shown_game_over:
+            self.shown_game_over = game_over
+            if game_over:
+                canvas.itemconfigure(self.final_score_item, text=f"Final Score: {score}")
+            canvas.itemconfigure("game_over", state="normal" if game_over else "hidden")
+            canvas.itemconfigure("hud", state="hidden" if game_over else "normal")
+
+
+class ViewportRenderer(Renderer):
+    """
+    Renderer for boards larger than the window.
+    The view scrolls to keep the head in the centre and only the occupied
+    cells inside it get canvas items, taken from one pool per body color so
+    an item is only ever moved, never restyled. Each tick scans the
+    VIEW_ROWS x VIEW_COLS window, so the cost follows the window size, not
+    the board size or the snake's length. Food outside the view is shown as
+    a hollow marker on the nearest edge.
+    """
+    BODY_COLORS = (SNAKE_BODY_ALT_COLOR, SNAKE_BODY_COLOR)
+
+    def __init__(self, canvas):
+        # Shown and pooled items for each body color
+        self.shown_items = ([], [])
+        self.pooled_items = ([], [])
+        self.food_hint = None
+        super().__init__(canvas)
+
+    def reset(self):
+        super().reset()
+        for parity in (0, 1):
+            self.hide_items(parity, 0)
+
+    def hide_items(self, parity, keep):
+        """Return every shown item of one color past the first keep to its pool."""
+        shown = self.shown_items[parity]
+        while len(shown) > keep:
+            item = shown.pop()
+            self.canvas.itemconfigure(item, state="hidden")
+            self.pooled_items[parity].append(item)
+
+    def body_item(self, parity):
+        pool = self.pooled_items[parity]
+        if pool:
+            item = pool.pop()
+            self.canvas.itemconfigure(item, state="normal")
+        else:
+            item = self.new_body_item()
+            self.canvas.itemconfigure(item, fill=self.BODY_COLORS[parity])
+        self.shown_items[parity].append(item)
+        return item
+
+    def view_place(self, item, view_row, view_col):
+        x, y = view_col * TILE_SIZE, view_row * TILE_SIZE
+        self.canvas.coords(item, x, y, x + TILE_SIZE, y + TILE_SIZE)
+
+    def update(self, moved):
+        """Bring the canvas in line with the game state after one tick."""
+        head = state.cells[0]
+        head_row, head_col = divmod(head, COLS)
+        top = head_row - VIEW_ROWS // 2
+        left = head_col - VIEW_COLS // 2
+
+        # Neighbouring segments always differ in cell parity, so coloring
+        # by parity alternates colors along the body
+        counts = [0, 0]
+        for view_row, view_col, cell in snake_state.visible_cells(state, top, left, VIEW_ROWS, VIEW_COLS):
+            if cell == head:
+                continue
+            parity = (top + left + view_row + view_col) % 2
+            shown = self.shown_items[parity]
+            if counts[parity] < len(shown):
+                item = shown[counts[parity]]
+            else:
+                item = self.body_item(parity)
+            counts[parity] += 1
+            self.view_place(item, view_row, view_col)
+        for parity in (0, 1):
+            self.hide_items(parity, counts[parity])
+
+        self.view_place(self.head_item, VIEW_ROWS // 2, VIEW_COLS // 2)
+        self.update_food(head_row, head_col)
+        self.update_text()
+
+    def update_food(self, head_row, head_col):
+        if state.food is None:
+            self.canvas.coords(self.food_item, 0, 0, 0, 0)
             return
-    
-    # Check food collision
-    if snake.x == food.x and snake.y == food.y:
-        # Add new segment to snake body
-        snake_body.append(Tile(food.x, food.y))
-        
-        # Generate new food at random position (avoiding snake body)
-        while True:
-            food.x = random.randint(0, COLS-1) * TILE_SIZE
-            food.y = random.randint(0, ROWS-1) * TILE_SIZE
-            
-            # Ensure food doesn't spawn on snake
-            food_on_snake = False
-            if snake.x == food.x and snake.y == food.y:
-                food_on_snake = True
-            for tile in snake_body:
-                if tile.x == food.x and tile.y == food.y:
-                    food_on_snake = True
-                    break
-            
-            if not food_on_snake:
-                break
-        
-        score += 1
-    
-    # Update snake body positions (move each segment to position of previous segment)
-    for i in range(len(snake_body)-1, -1, -1):
-        tile = snake_body[i]
-        if i == 0:  # First segment follows the head
-            tile.x = snake.x
-            tile.y = snake.y
-        else:       # Other segments follow the previous segment
-            prev_tile = snake_body[i-1]
-            tile.x = prev_tile.x
-            tile.y = prev_tile.y
-    
-    # Move snake head
-    snake.x += velocityX * TILE_SIZE
-    snake.y += velocityY * TILE_SIZE
 
-def draw():
+        # Offset from the head the short way round the wrapping board
+        food_row, food_col = divmod(state.food, COLS)
+        view_row = (food_row - head_row + ROWS // 2) % ROWS - ROWS // 2 + VIEW_ROWS // 2
+        view_col = (food_col - head_col + COLS // 2) % COLS - COLS // 2 + VIEW_COLS // 2
+
+        hint = not (0 <= view_row < VIEW_ROWS and 0 <= view_col < VIEW_COLS)
+        if hint != self.food_hint:
+            self.food_hint = hint
+            self.canvas.itemconfigure(self.food_item, fill="" if hint else FOOD_COLOR)
+        self.view_place(self.food_item, min(max(view_row, 0), VIEW_ROWS - 1),
+                        min(max(view_col, 0), VIEW_COLS - 1))
+
+
+def tick():
     """
-    Draws all game elements on the canvas and schedules the next frame.
+    Advances the game by one tick and updates the canvas.
     """
-    global snake, food, snake_body, game_over, score
-    
-    # Update game state
-    move()
-    
-    # Clear canvas
-    canvas.delete("all")
-    
-    # Draw grid (optional visual enhancement)
-    draw_grid()
-    
-    # Draw food
-    canvas.create_rectangle(food.x, food.y, food.x + TILE_SIZE, food.y + TILE_SIZE, 
-                           fill=FOOD_COLOR, outline="dark red", width=2)
-    
-    # Draw snake body segments
-    for i, tile in enumerate(snake_body):
-        # Use slightly different color for body segments
-        color = SNAKE_BODY_COLOR if i % 2 == 0 else "light green"
-        canvas.create_rectangle(tile.x, tile.y, tile.x + TILE_SIZE, tile.y + TILE_SIZE, 
-                               fill=color, outline="dark green", width=1)
-    
-    # Draw snake head (different color to distinguish from body)
-    canvas.create_rectangle(snake.x, snake.y, snake.x + TILE_SIZE, snake.y + TILE_SIZE, 
-                           fill=SNAKE_HEAD_COLOR, outline="dark green", width=2)
-    
-    # Draw game information
-    if game_over:
-        # Game over screen (only from self-collision now)
-        canvas.create_text(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 30, 
-                          font="Arial 25 bold", text="GAME OVER", fill=GAME_OVER_COLOR)
-        canvas.create_text(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 10, 
-                          font="Arial 18", text=f"Final Score: {score}", fill=TEXT_COLOR)
-        canvas.create_text(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 40, 
-                          font="Arial 12", text="Press 'R' to Restart", fill=TEXT_COLOR)
+    if autopilot_on and not state.game_over:
+        direction = autopilot(state)
     else:
-        # In-game score display
-        canvas.create_text(50, 15, font="Arial 12 bold", 
-                          text=f"Score: {score}", fill=TEXT_COLOR)
-        canvas.create_text(WINDOW_WIDTH - 50, 15, font="Arial 10", 
-                          text=f"Length: {len(snake_body) + 1}", fill=TEXT_COLOR)
-        
-        # Display wrap-around feature indicator
-        canvas.create_text(WINDOW_WIDTH/2, 15, font="Arial 8", 
-                          text="Wrap-Around Walls: ON", fill="yellow")
-    
-    # Schedule next frame (adjust speed based on score for increasing difficulty)
-    speed = max(50, 150 - min(score, 10) * 5)  # Speed increases with score, up to a limit
-    window.after(speed, draw)
+        direction = inputs.pop()
+    moved = snake_state.step(state, direction)
+    renderer.update(moved)
+
+class TickScheduler:
+    """
+    Drift-free tick scheduler on top of window.after.
+    Ticks are due at fixed deadlines on the perf_counter clock instead of
+    "now + interval", so render time and Tk event-loop latency never push
+    later ticks back. A late wake-up runs the ticks it missed (up to
+    MAX_CATCH_UP) and a longer stall resynchronises instead of fast-forwarding.
+    """
+    MAX_CATCH_UP = 3
+
+    def __init__(self, window, tick):
+        self.window = window
+        self.tick = tick
+        self.deadline = time.perf_counter()
+
+    def resync(self):
+        self.deadline = time.perf_counter()
+
+    def run(self):
+        now = time.perf_counter()
+        ticks = 0
+        while now >= self.deadline and ticks < self.MAX_CATCH_UP:
+            self.tick()
+            ticks += 1
+            self.deadline += snake_state.tick_interval(state) / 1000
+        if now >= self.deadline:
+            self.resync()  # Too far behind to catch up
+
+        # Wake at the next deadline, rounding up so we are never early
+        delay = self.deadline - time.perf_counter()
+        self.window.after(max(1, int(delay * 1000) + 1), self.run)
 
 def draw_grid():
     """
@@ -269,17 +407,43 @@ def draw_grid():
     for i in range(0, WINDOW_HEIGHT, TILE_SIZE):
         canvas.create_line(0, i, WINDOW_WIDTH, i, fill="#111111", width=1)
 
-# Initialize game
-window, canvas = create_window()
-initialize_game()
+# Game objects, created by main() so importing this file opens no window
+window = canvas = renderer = scheduler = state = None
+inputs = snake_state.InputQueue()
+autopilot = None
+autopilot_on = False
+
+def main(rows=snake_state.ROWS, cols=snake_state.COLS):
+    """
+    Opens the window and runs the game until it is closed.
+    """
+    global window, canvas, renderer, scheduler
+    configure_board(rows, cols)
+
+    # Initialize game
+    window, canvas = create_window()
+    initialize_game()
+    if ROWS > VIEW_ROWS or COLS > VIEW_COLS:
+        renderer = ViewportRenderer(canvas)
+    else:
+        renderer = Renderer(canvas)
+
+    # Start game loop
+    scheduler = TickScheduler(window, tick)
+    scheduler.run()
 
-# Start game loop
-draw()
+    # Bind keyboard events
+    window.bind("<KeyRelease>", change_direction)  # Direction changes
+    window.bind("<r>", change_direction)           # Restart game
+    window.bind("<R>", change_direction)           # Restart game (caps lock)
 
-# Bind keyboard events
-window.bind("<KeyRelease>", change_direction)  # Direction changes
-window.bind("<r>", change_direction)           # Restart game
-window.bind("<R>", change_direction)           # Restart game (caps lock)
+    # Start the main event loop
+    window.mainloop()
 
-# Start the main event loop
-window.mainloop()                
\ No newline at end of file
+if __name__ == "__main__":
+    # e.g. python "Snake Game.py" --rows 1000 --cols 1000
+    parser = argparse.ArgumentParser(description="Snake Game")
+    parser.add_argument("--rows", type=int, default=snake_state.ROWS)
+    parser.add_argument("--cols", type=int, default=snake_state.COLS)
+    args = parser.parse_args()
+    main(args.rows, args.cols)
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Autopilot for Snake that can play to a full board.
+
+The autopilot follows a precomputed Hamiltonian cycle (a closed route
+through every cell of the wrapping board) and takes shortcuts towards
+the food. A shortcut only ever moves the head forward along the cycle
+and never past the tail, so the body always lies on the stretch of cycle
+between tail and head and the cycle itself is always a safe way out.
+
+Shortcuts come from a breadth-first search that runs backwards from the
+food. Its result does not depend on where the head is, so it is cached
+until the food moves and can be spread over several ticks: each tick
+expands at most SEARCH_BUDGET cells, which bounds the decision time.
+Until the search reaches the head the snake simply follows the cycle.
+
+Run this file directly to benchmark a game played to a full board:
+
+    python snake_autopilot.py --rows 25 --cols 25
+"""
+
+import time
+from collections import deque
+
+import snake_state
+
+# Cells expanded by the food search per tick
+SEARCH_BUDGET = 256
+
+# Decision times kept for the latency report
+LATENCY_SAMPLES = 1000
+
+DIRECTIONS = (snake_state.UP, snake_state.DOWN, snake_state.LEFT, snake_state.RIGHT)
+
+
+def hamiltonian_cycle(rows, cols):
+    """
+    Cells of a Hamiltonian cycle on the wrapping rows x cols board, in order.
+    Each row is walked end to end, rightwards or leftwards, then the path
+    steps down. A rightwards row ends one column left of where it started
+    and a leftwards row one column right, so the cycle closes when the
+    counts of each kind differ by a multiple of cols. That is possible for
+    every board (transposing it if needed).
+    """
+    if rows % 2 and (cols % 2 == 0 or rows < cols):
+        # Build it on the transposed board and swap rows and columns back
+        return [(cell % rows) * cols + cell // rows for cell in hamiltonian_cycle(cols, rows)]
+
+    lefts = rows // 2 if rows % 2 == 0 else (rows + cols) // 2
+    rights = rows - lefts
+    order = []
+    col = 0
+    for row in range(rows):
+        # Alternate while both kinds remain, then use up the rest
+        leftwards = row % 2 == 1 if row < 2 * rights else True
+        step = -1 if leftwards else 1
+        for _ in range(cols):
+            order.append(row * cols + col)
+            col = (col + step) % cols
+        col = (col - step) % cols  # Step down below the row's last cell
+    return order
+
+
+class Autopilot:
+    """
+    Chooses a direction each tick; call it like a policy: autopilot(state).
+    Decision times are recorded for latency_report().
+    """
+    def __init__(self, rows=snake_state.ROWS, cols=snake_state.COLS, search_budget=SEARCH_BUDGET):
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.search_budget = search_budget
+
+        self.cycle = hamiltonian_cycle(rows, cols)
+        self.position = [0] * self.size
+        for index, cell in enumerate(self.cycle):
+            self.position[cell] = index
+
+        # Cached food search: distances stamped with the search generation
+        # so a new search never has to clear the arrays
+        self.distance = [0] * self.size
+        self.stamp = [0] * self.size
+        self.generation = 0
+        self.target = None
+        self.frontier = deque()
+
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.max_latency = 0
+        self.decisions = 0
+
+    def reset(self):
+        """Forget the cached search, e.g. when a new game starts."""
+        self.start_search(None)
+
+    def ahead(self, start, cell):
+        """How many cells forward along the cycle cell is from start."""
+        return (self.position[cell] - self.position[start]) % self.size
+
+    def neighbour(self, cell, direction):
+        row, col = divmod(cell, self.cols)
+        return ((row + direction[1]) % self.rows) * self.cols + (col + direction[0]) % self.cols
+
+    def start_search(self, food):
+        self.generation += 1
+        self.target = food
+        self.frontier.clear()
+        if food is not None:
+            self.stamp[food] = self.generation
+            self.distance[food] = 0
+            self.frontier.append(food)
+
+    def search(self, state, budget):
+        """
+        Expand up to budget cells of the backwards search from the food.
+        A cell is linked to a neighbour only if that neighbour is closer
+        to the food along the cycle, so every path found moves forward.
+        """
+        frontier = self.frontier
+        occupied = state.occupied
+        generation = self.generation
+        food = self.target
+        while frontier and budget:
+            budget -= 1
+            cell = frontier.popleft()
+            key = self.ahead(cell, food)
+            for direction in DIRECTIONS:
+                prev = self.neighbour(cell, direction)
+                if self.stamp[prev] != generation and not occupied[prev] \
+                        and self.ahead(prev, food) > key:
+                    self.stamp[prev] = generation
+                    self.distance[prev] = self.distance[cell] + 1
+                    frontier.append(prev)
+
+    def __call__(self, state):
+        start = time.perf_counter_ns()
+        direction = self.decide(state)
+        elapsed = time.perf_counter_ns() - start
+        self.latencies.append(elapsed)
+        self.max_latency = max(self.max_latency, elapsed)
+        self.decisions += 1
+        return direction
+
+    def decide(self, state):
+        if state.food != self.target:
+            self.start_search(state.food)
+        if self.frontier:
+            self.search(state, self.search_budget)
+
+        head = state.cells[0]
+        tail = state.cells[-1]
+        room = self.ahead(head, tail) or self.size  # Free cells ahead, plus the tail
+        food = self.target
+        generation = self.generation
+        occupied = state.occupied
+
+        # Shortcut: the neighbour nearest the food that stays ahead of the
+        # head, short of the tail and (if the food is ahead) short of the food
+        best = None
+        best_distance = None
+        fallback = None
+        for direction in DIRECTIONS:
+            if snake_state.is_reversal(direction, state.direction):
+                continue
+            cell = self.neighbour(head, direction)
+            if occupied[cell] and cell != tail:
+                continue
+            forward = self.ahead(head, cell)
+            if forward == 1:
+                fallback = direction  # Next cell on the cycle
+            if food is None or self.stamp[cell] != generation or forward >= room:
+                continue
+            if forward > self.ahead(head, food):
+                continue
+            if best is None or self.distance[cell] < best_distance:
+                best = direction
+                best_distance = self.distance[cell]
+        if best is not None:
+            return best
+        if fallback is not None:
+            return fallback
+
+        # Only reachable when the autopilot took over mid-game with the body
+        # off the cycle: take any free cell
+        for direction in DIRECTIONS:
+            cell = self.neighbour(head, direction)
+            if not occupied[cell] and not snake_state.is_reversal(direction, state.direction):
+                return direction
+        return None
+
+    def latency_report(self):
+        """(mean, p99, max) decision time in microseconds over recent ticks."""
+        if not self.latencies:
+            return 0.0, 0.0, 0.0
+        samples = sorted(self.latencies)
+        mean = sum(samples) / len(samples)
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return mean / 1000, p99 / 1000, self.max_latency / 1000
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play one Snake game to a full board with the autopilot.")
+    parser.add_argument("--rows", type=int, default=snake_state.ROWS)
+    parser.add_argument("--cols", type=int, default=snake_state.COLS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=int, default=SEARCH_BUDGET, help="cells searched per tick")
+    args = parser.parse_args()
+
+    state = snake_state.GameState(args.rows, args.cols, args.seed)
+    autopilot = Autopilot(args.rows, args.cols, args.budget)
+    autopilot.latencies = deque()  # Keep every sample for the report
+    start = time.perf_counter()
+    ticks = 0
+    while not state.game_over:
+        snake_state.step(state, autopilot(state))
+        ticks += 1
+    elapsed = time.perf_counter() - start
+
+    mean, p99, worst = autopilot.latency_report()
+    result = "full board" if state.food is None else "crashed"
+    print(f"{result}: length {len(state.cells)}/{args.rows * args.cols} after {ticks} ticks "
+          f"in {elapsed:.2f}s ({ticks / elapsed:.0f} ticks/s)")
+    print(f"decision time: mean {mean:.1f} us, p99 {p99:.1f} us, max {worst:.1f} us")
@@ -0,0 +1,413 @@
+"""
+Snake game state and simulation, independent of Tk.
+
+GameState holds everything about one game; step(state, direction)
+advances it by exactly one tick. Nothing here knows about the canvas or
+the clock, so the same engine drives the window, replays and headless
+runs. Run this file directly to benchmark headless ticks per second:
+
+    python snake_state.py
+    python snake_state.py --rows 1000 --cols 1000 --length 100000
+"""
+
+import os
+import random
+import sys
+from collections import deque
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Repository root, for common/
+from common.rng import RandomStreams
+
+# Default board size
+ROWS = 25
+COLS = 25
+
+# Movement directions as (dx, dy)
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+STOPPED = (0, 0)
+
+# Maximum number of buffered direction changes
+INPUT_BUFFER_SIZE = 3
+
+# Boards with more cells than this use chunked occupancy storage
+DENSE_BOARD_LIMIT = 250000
+
+# Chunked occupancy tiles are CHUNK_SIZE x CHUNK_SIZE cells
+CHUNK_BITS = 6
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK_SIZE - 1
+
+
+class FreeCells:
+    """
+    The set of empty board cells, as an array plus a position index.
+    Add, remove and uniform random choice are all O(1) (removal swaps the
+    last cell into the hole), so food placement stays constant time even
+    when the snake fills almost the whole board.
+    """
+    def __init__(self, size):
+        self.cells = list(range(size))
+        self.position = list(range(size))  # index into cells, -1 if not free
+
+    def __len__(self):
+        return len(self.cells)
+
+    def add(self, cell):
+        self.position[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def remove(self, cell):
+        pos = self.position[cell]
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[pos] = last
+            self.position[last] = pos
+        self.position[cell] = -1
+
+    def choice(self, rng=random):
+        """A uniformly random free cell, or None when the board is full."""
+        return rng.choice(self.cells) if self.cells else None
+
+
+class DenseOccupancy:
+    """
+    Occupancy bitmap covering the whole board plus the set of free cells.
+    Lookups are a single bytearray index and food placement is O(1) at
+    any fill level, at the cost of memory proportional to the board area.
+    """
+    def __init__(self, rows, cols):
+        self.bits = bytearray(rows * cols)
+        self.free_cells = FreeCells(rows * cols)
+
+    def __getitem__(self, cell):
+        return self.bits[cell]
+
+    def add(self, cell):
+        self.bits[cell] = 1
+        self.free_cells.remove(cell)
+
+    def remove(self, cell):
+        self.bits[cell] = 0
+        self.free_cells.add(cell)
+
+    def random_free(self, rng):
+        return self.free_cells.choice(rng)
+
+
+class ChunkedOccupancy:
+    """
+    Occupancy for large boards, stored as CHUNK_SIZE x CHUNK_SIZE tiles.
+    A tile is allocated the first time the snake enters it and dropped
+    when the snake leaves it, so memory follows the snake's length rather
+    than the board area. Food is placed by rejection sampling, which takes
+    fewer than two draws on average while at least half the board is free.
+    """
+    def __init__(self, rows, cols):
+        self.cols = cols
+        self.size = rows * cols
+        self.chunk_cols = (cols + CHUNK_MASK) >> CHUNK_BITS
+        self.chunks = {}  # tile index -> [occupied count, bytearray]
+        self.count = 0
+
+    def _locate(self, cell):
+        row, col = divmod(cell, self.cols)
+        key = (row >> CHUNK_BITS) * self.chunk_cols + (col >> CHUNK_BITS)
+        return key, ((row & CHUNK_MASK) << CHUNK_BITS) | (col & CHUNK_MASK)
+
+    def __getitem__(self, cell):
+        key, index = self._locate(cell)
+        chunk = self.chunks.get(key)
+        return chunk[1][index] if chunk is not None else 0
+
+    def add(self, cell):
+        key, index = self._locate(cell)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = [0, bytearray(CHUNK_SIZE * CHUNK_SIZE)]
+        chunk[0] += 1
+        chunk[1][index] = 1
+        self.count += 1
+
+    def remove(self, cell):
+        key, index = self._locate(cell)
+        chunk = self.chunks[key]
+        chunk[0] -= 1
+        if chunk[0]:
+            chunk[1][index] = 0
+        else:
+            del self.chunks[key]
+        self.count -= 1
+
+    def random_free(self, rng):
+        if self.count * 2 <= self.size:
+            while True:
+                cell = rng.randrange(self.size)
+                if not self[cell]:
+                    return cell
+        # Nearly full: fall back to listing the free cells
+        free = [cell for cell in range(self.size) if not self[cell]]
+        return rng.choice(free) if free else None
+
+
+def make_occupancy(rows, cols):
+    """Dense storage for normal boards, chunked storage for very large ones."""
+    if rows * cols <= DENSE_BOARD_LIMIT:
+        return DenseOccupancy(rows, cols)
+    return ChunkedOccupancy(rows, cols)
+
+
+class GameState:
+    """
+    All state of one game.
+    The snake is a deque of packed cell indices (row * cols + col), head
+    first, with a parallel occupancy structure (see make_occupancy).
+    """
+    def __init__(self, rows=ROWS, cols=COLS, seed=None):
+        self.rows = rows
+        self.cols = cols
+        self.rng = RandomStreams(seed).stream("food")
+
+        self.cells = deque()
+        self.occupied = make_occupancy(rows, cols)
+
+        # Snake starts in the middle of the grid (just the head)
+        head = (rows // 2) * cols + cols // 2
+        self.cells.append(head)
+        self.occupied.add(head)
+
+        # Place first food at a random free position
+        self.food = self.occupied.random_free(self.rng)
+
+        # Direction the snake last moved in (stationary until the first key)
+        self.direction = STOPPED
+        self.game_over = False
+        self.score = 0
+        self.ticks = 0
+
+    @property
+    def head(self):
+        return self.cells[0]
+
+
+def is_reversal(direction, current):
+    """True if direction points straight back along current."""
+    return direction[0] == -current[0] and direction[1] == -current[1]
+
+
+def step(state, direction=None):
+    """
+    Advance the game by one tick, turning to direction first if it is given
+    and is not a 180-degree turn from the direction the snake last moved.
+    Walls wrap around instead of ending the game. Every step is O(1): push
+    the new head, pop the tail unless the snake grows, and test
+    self-collision against the occupancy structure.
+    Returns True if the snake moved.
+    """
+    if state.game_over:
+        return False
+
+    # Validate against the last *applied* direction, so a burst of key
+    # presses can never turn the snake back into its own neck
+    if direction is not None and not is_reversal(direction, state.direction):
+        state.direction = direction
+
+    dx, dy = state.direction
+    if dx == 0 and dy == 0:
+        return False
+
+    # Next head cell, wrapping around the walls
+    cols = state.cols
+    head = state.cells[0]
+    col = (head % cols + dx) % cols
+    row = (head // cols + dy) % state.rows
+    new_head = row * cols + col
+
+    grows = new_head == state.food
+    tail = state.cells[-1]
+    occupied = state.occupied
+
+    # Check self-collision (game over only on self-collision). The tail
+    # cell is safe to enter unless the snake is growing this step
+    if occupied[new_head] and (grows or new_head != tail):
+        state.game_over = True
+        return False
+
+    if not grows:
+        state.cells.pop()
+        occupied.remove(tail)
+
+    state.cells.appendleft(new_head)
+    occupied.add(new_head)
+    state.ticks += 1
+
+    if grows:
+        state.score += 1
+        # Generate new food at a random free position
+        state.food = occupied.random_free(state.rng)
+        if state.food is None:
+            state.game_over = True  # The snake fills the whole board
+    return True
+
+
+def tick_interval(state):
+    """Milliseconds per tick; the game speeds up with the score, up to a limit."""
+    return max(50, 150 - min(state.score, 10) * 5)
+
+
+def visible_cells(state, top, left, view_rows, view_cols):
+    """
+    Yield (view_row, view_col, cell) for every occupied cell inside a
+    view_rows x view_cols window whose top-left board cell is (top, left).
+    The window wraps around the board edges like the snake does. Cost is
+    proportional to the window area, not to the snake's length.
+    """
+    rows, cols = state.rows, state.cols
+    occupied = state.occupied
+    col_offsets = [(left + view_col) % cols for view_col in range(min(view_cols, cols))]
+    for view_row in range(min(view_rows, rows)):
+        base = ((top + view_row) % rows) * cols
+        for view_col, col in enumerate(col_offsets):
+            if occupied[base + col]:
+                yield view_row, view_col, base + col
+
+
+class InputQueue:
+    """
+    Direction changes buffered between ticks.
+    Each tick consumes at most one entry, so two quick presses inside one
+    tick become two turns on consecutive ticks instead of the second one
+    overwriting the first. Repeats of the last queued direction and
+    presses beyond the buffer size are dropped.
+    """
+    def __init__(self, size=INPUT_BUFFER_SIZE):
+        self.pending = deque()
+        self.size = size
+
+    def push(self, direction):
+        if self.pending and self.pending[-1] == direction:
+            return
+        if len(self.pending) < self.size:
+            self.pending.append(direction)
+
+    def pop(self):
+        """The next direction to apply, or None if nothing is buffered."""
+        return self.pending.popleft() if self.pending else None
+
+    def clear(self):
+        self.pending.clear()
+
+
+def chase_food(state):
+    """Simple policy for headless runs: turn towards the food, avoiding reversals."""
+    if state.food is None:
+        return None
+    head_row, head_col = divmod(state.cells[0], state.cols)
+    food_row, food_col = divmod(state.food, state.cols)
+    for direction, wanted in ((RIGHT, food_col > head_col), (LEFT, food_col < head_col),
+                              (DOWN, food_row > head_row), (UP, food_row < head_row)):
+        if wanted and not is_reversal(direction, state.direction):
+            return direction
+    return None
+
+
+def sweep(state):
+    """
+    Policy for large-board runs: sweep the board row by row, rightwards on
+    even rows and leftwards on odd ones, stepping down at each end. On a
+    board with an even number of rows this is a cycle through every cell,
+    so a snake laid out by long_snake never runs into itself.
+    """
+    row, col = divmod(state.cells[0], state.cols)
+    if row % 2 == 0:
+        return RIGHT if col < state.cols - 1 else DOWN
+    return LEFT if col > 0 else DOWN
+
+
+def long_snake(rows, cols, length, seed=0):
+    """
+    A game whose snake already fills the top rows of the board back and
+    forth, length cells long, following the same path as sweep. Used to
+    benchmark ticks on large boards.
+    """
+    state = GameState(rows, cols, seed)
+    state.occupied.remove(state.cells.popleft())
+    for i in range(length):
+        row, col = divmod(i, cols)
+        if row % 2:
+            col = cols - 1 - col
+        cell = row * cols + col
+        state.cells.appendleft(cell)
+        state.occupied.add(cell)
+    state.direction = RIGHT if (length - 1) // cols % 2 == 0 else LEFT
+    if state.occupied[state.food]:
+        state.food = state.occupied.random_free(state.rng)
+    return state
+
+
+def run_headless(ticks, policy=chase_food, rows=ROWS, cols=COLS, seed=0):
+    """
+    Run the simulation for a number of ticks with no window and no clock,
+    restarting whenever a game ends. Returns (games played, best score).
+    """
+    state = GameState(rows, cols, seed)
+    games = 1
+    best = 0
+    for _ in range(ticks):
+        step(state, policy(state))
+        if state.game_over:
+            best = max(best, state.score)
+            games += 1
+            state = GameState(rows, cols, state.rng.randrange(2**32))
+    return games, max(best, state.score)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Benchmark the Snake simulation without a window.")
+    parser.add_argument("--ticks", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rows", type=int, default=ROWS)
+    parser.add_argument("--cols", type=int, default=COLS)
+    parser.add_argument("--length", type=int, default=0,
+                        help="start with a snake this long and time single ticks plus a 25x25 view scan")
+    args = parser.parse_args()
+
+    if not args.length:
+        start = time.perf_counter()
+        games, best = run_headless(args.ticks, rows=args.rows, cols=args.cols, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"{args.ticks} ticks in {elapsed:.2f}s ({args.ticks / elapsed:.0f} ticks/s), "
+              f"{games} games, best score {best}")
+        sys.exit()
+
+    state = long_snake(args.rows, args.cols, args.length, args.seed)
+    occupied = state.occupied
+    if isinstance(occupied, ChunkedOccupancy):
+        print(f"{type(occupied).__name__}: {len(occupied.chunks)} tiles, "
+              f"{len(occupied.chunks) * CHUNK_SIZE * CHUNK_SIZE // 1024} KiB "
+              f"for {args.rows * args.cols // 1024} Ki cells")
+    else:
+        print(f"{type(occupied).__name__}: {args.rows * args.cols // 1024} KiB bitmap")
+
+    ticks = min(args.ticks, 20000)
+    step_time = view_time = 0.0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        step(state, sweep(state))
+        mid = time.perf_counter()
+        head_row, head_col = divmod(state.cells[0], state.cols)
+        for _ in visible_cells(state, head_row - 12, head_col - 12, 25, 25):
+            pass
+        step_time += mid - start
+        view_time += time.perf_counter() - mid
+        if state.game_over:
+            print(f"game over after {state.ticks} ticks")
+            ticks = state.ticks
+            break
+    print(f"length {len(state.cells)}: step {step_time / ticks * 1e6:.1f} us/tick, "
+          f"view scan {view_time / ticks * 1e6:.1f} us/tick")
@@ -10,20 +10,19 @@ Advanced Tic Tac Toe — Modern Animated Menu with Minecraft-style Pixel Font
 """
 
 import pygame
+import os
 import sys
-import random
 import math
 from pygame import mixer
 
-# ----------------------------
-# Initialization
-# ----------------------------
-pygame.init()
-# Initialize mixer: best-effort; protect against initialization errors
-try:
-    mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-except Exception as e:
-    print("Warning: pygame.mixer failed to initialize:", e)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Repository root, for common/
+from common import assets
+from common.fonts import sys_font
+from common.lazy import Lazy, init_display, init_mixer
+from common.pacing import FramePacer, add_gc_argument, schedule_gc
+from common.profiler import FrameProfiler, add_profile_argument
+from common.rng import RandomStreams
+from common.sprites import circle, shade, sprite
 
 # ----------------------------
 # Configuration & Constants
@@ -33,13 +32,15 @@ BOARD_SIZE = 450
 CELL_SIZE = BOARD_SIZE // 3
 FPS = 60
 
-# Files (edit names if you have different)
-FONT_FILE = "minecraft.ttf"   # <-- Put your Minecraft-like pixel font here
-BG_MUSIC_FILE = "bg_music.mp3" # <-- Background music (MP3, loops)
+# Files (edit names if you have different), next to this script so the
+# game also finds them when started from the launcher
+HERE = os.path.dirname(os.path.abspath(__file__))
+FONT_FILE = os.path.join(HERE, "minecraft.ttf")   # <-- Put your Minecraft-like pixel font here
+BG_MUSIC_FILE = os.path.join(HERE, "bg_music.mp3") # <-- Background music (MP3, loops)
 SOUND_FILES = {
-    "click": "click.wav",
-    "win": "win.wav",
-    "lose": "lose.wav",
+    "click": os.path.join(HERE, "click.wav"),
+    "win": os.path.join(HERE, "win.wav"),
+    "lose": os.path.join(HERE, "lose.wav"),
 }
 
 # Colors (RGB)
@@ -58,10 +59,15 @@ DIFFICULTY_SELECT = 2
 IN_GAME = 3
 GAME_OVER = 4
 
-# Pygame setup
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Tic Tac Toe ")
-clock = pygame.time.Clock()
+# Pygame setup (nothing is initialized at import: the window opens with the
+# game, fonts and sounds load on first use)
+screen = None
+profiler = FrameProfiler()  # F3 shows where frame time goes
+
+def open_window():
+    global screen
+    screen = init_display((WIDTH, HEIGHT), "Tic Tac Toe ")  # Reuses the launcher's window
+    return screen
 
 # ----------------------------
 # Font loading (Minecraft-like pixel font with graceful fallback)
@@ -72,17 +78,20 @@ def load_font(path, size, fallback_name="arial", bold=False):
     Returns a pygame.font.Font instance.
     """
     try:
-        font = pygame.font.Font(path, size)
+        font = assets.font_file(path, size)
         return font
     except Exception:
         print(f"Note: Could not load font '{path}'. Falling back to system font '{fallback_name}'.")
-        return pygame.font.SysFont(fallback_name, size, bold=bold)
+        return sys_font(fallback_name, size, bold=bold)
 
-# Sizes chosen: Title big, buttons medium, game text medium
-title_font = load_font(FONT_FILE, 72, fallback_name="arial", bold=True)
-button_font = load_font(FONT_FILE, 30, fallback_name="arial", bold=True)
-game_font = load_font(FONT_FILE, 32, fallback_name="arial", bold=True)
-info_font = load_font(FONT_FILE, 20, fallback_name="arial")
+# Sizes chosen: Title big, buttons medium, game text medium (each loaded on first use)
+title_font = Lazy(lambda: load_font(FONT_FILE, 72, fallback_name="arial", bold=True))
+button_font = Lazy(lambda: load_font(FONT_FILE, 30, fallback_name="arial", bold=True))
+game_font = Lazy(lambda: load_font(FONT_FILE, 32, fallback_name="arial", bold=True))
+info_font = Lazy(lambda: load_font(FONT_FILE, 20, fallback_name="arial"))
+# The menu title and its shadow, rendered once (the menu fades them with set_alpha)
+menu_title = Lazy(lambda: (title_font.render("TIC TAC TOE", True, (255,255,255)),
+                           title_font.render("TIC TAC TOE", True, (0,0,0))))
 
 # ----------------------------
 # Sound manager (SFX + MP3 background)
@@ -94,6 +103,11 @@ class SoundManager:
     - Background music: uses pygame.mixer.music, loops infinitely
     """
     def __init__(self):
+        # Initialize mixer: best-effort; protect against initialization errors
+        try:
+            init_mixer(frequency=44100, size=-16, channels=2, buffer=512)
+        except Exception as e:
+            print("Warning: pygame.mixer failed to initialize:", e)
         self.sounds = {}
         self.bg_loaded = False
         self.load_sfx()
@@ -103,7 +117,7 @@ class SoundManager:
         """Load WAV sound effects; if missing, use a silent fallback or None."""
         for key, filename in SOUND_FILES.items():
             try:
-                self.sounds[key] = mixer.Sound(filename)
+                self.sounds[key] = assets.sound_file(filename)  # Decoded once, then mapped from the asset cache
             except Exception as e:
                 print(f"Note: Could not load SFX '{filename}' for '{key}': {e}. Using silent fallback.")
                 # Best-effort silent fallback: small buffer; if that fails set None
@@ -150,12 +164,17 @@ class SoundManager:
                 except Exception:
                     pass
 
-# Create a global SoundManager
-sound_manager = SoundManager()
+# Create a global SoundManager (the mixer opens on first use)
+sound_manager = Lazy(SoundManager)
 
 # ----------------------------
 # Gradient & visual helpers
 # ----------------------------
+def gradient_background(colors):
+    """A window-sized left-to-right gradient, drawn once per palette and then cached."""
+    return sprite(("gradient", tuple(colors)), (WIDTH, HEIGHT),
+                  lambda surface: draw_multi_gradient(surface, colors, vertical=False))
+
 def draw_multi_gradient(surface, colors, vertical=True):
     """
     Draws a multi-stop linear gradient across surface.
@@ -228,6 +247,7 @@ class Button:
         self.pulse_amp = 0.045
         self.pulse_speed = 5.5
         self.border_thickness = 3
+        self.text_surf = None  # Rendered on the first draw, once the font is loaded
 
     def update(self, mouse_pos):
         """Update slide-in animation & hover status."""
@@ -247,6 +267,11 @@ class Button:
         else:
             self.scale += (1.0 - self.scale) * 0.2
 
+    def animating(self):
+        """True while sliding in, pulsing under the mouse or easing back to size."""
+        sliding = pygame.time.get_ticks() < self.slide_start_time + self.slide_duration
+        return sliding or self.is_hovered or abs(self.scale - 1.0) > 0.002
+
     def draw(self, surf):
         """Draw button (scaled) and text using pixel button_font."""
         base = self.hover_color if self.is_hovered else self.color
@@ -259,8 +284,8 @@ class Button:
 
         # Glow effect
         if self.is_hovered:
-            glow = pygame.Surface((w+24, h+24), pygame.SRCALPHA)
-            pygame.draw.ellipse(glow, (base[0], base[1], base[2], 40), glow.get_rect())
+            glow = sprite(("button_glow", w, h, base), (w+24, h+24), lambda g: pygame.draw.ellipse(
+                g, (base[0], base[1], base[2], 40), g.get_rect()))
             glow_pos = glow.get_rect(center=self.rect.center)
             surf.blit(glow, glow_pos)
 
@@ -268,7 +293,9 @@ class Button:
         pygame.draw.rect(surf, border, draw_rect, self.border_thickness, border_radius=10)
 
         # Render text using pixel font (button_font)
-        text_surf = button_font.render(self.text, True, self.text_color)
+        if self.text_surf is None:
+            self.text_surf = button_font.render(self.text, True, self.text_color)
+        text_surf = self.text_surf
         text_rect = text_surf.get_rect(center=draw_rect.center)
         surf.blit(text_surf, text_rect)
 
@@ -284,7 +311,19 @@ class Button:
 # TicTacToe Main Class
 # ----------------------------
 class TicTacToe:
-    def __init__(self):
+    # Buttons shown on each screen
+    SCREEN_BUTTONS = {
+        MAIN_MENU: ['start', 'quit'],
+        GAME_MODE_SELECT: ['single', 'multi', 'back_mode'],
+        DIFFICULTY_SELECT: ['easy', 'medium', 'hard', 'back_diff'],
+        GAME_OVER: ['play_again', 'main_menu'],
+    }
+
+    def __init__(self, seed=None):
+        open_window()  # Buttons time their slide-in from now
+        self.rng = RandomStreams(seed).stream("ai")  # The easy AI's picks
+        self.pacer = FramePacer(FPS)  # Drops to a few FPS while nothing moves
+
         # Game data
         self.board = [['' for _ in range(3)] for _ in range(3)]
         self.current_player = 'X'
@@ -391,7 +430,7 @@ class TicTacToe:
     def computer_move_easy(self):
         empty = [(r,c) for r in range(3) for c in range(3) if self.board[r][c] == '']
         if empty:
-            r,c = random.choice(empty)
+            r,c = self.rng.choice(empty)
             self.make_move(r,c)
 
     def computer_move_medium(self):
@@ -516,28 +555,25 @@ class TicTacToe:
     # ------------------------
     def draw_main_menu(self, mouse_pos):
         """Draw animated multi-color gradient background, pixel title & animated buttons."""
-        gradient = pygame.Surface((WIDTH, HEIGHT))
         palette = [(255, 60, 120), (255,165,0), (255,235,59), (60,180,255), (120,60,255)]
-        draw_multi_gradient(gradient, palette, vertical=False)
+        screen.blit(gradient_background(palette), (0,0))
 
-        # Moving radial overlay for subtle motion
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        # Moving radial overlay for subtle motion (added straight onto the screen)
         t = pygame.time.get_ticks() / 1000.0
         cx = int(WIDTH/2 + math.sin(t * 0.6) * 120)
         cy = int(HEIGHT/2 + math.cos(t * 0.5) * 60)
-        pygame.draw.circle(overlay, (255,255,255,28), (cx,cy), 300)
-        gradient.blit(overlay, (0,0), special_flags=pygame.BLEND_RGBA_ADD)
-        screen.blit(gradient, (0,0))
+        glow = circle((255,255,255,28), 300)
+        half = glow.get_width() // 2
+        screen.blit(glow, (cx - half, cy - half), special_flags=pygame.BLEND_RGBA_ADD)
 
         # Title with Minecraft-like pixel font & glow pulse
         elapsed = pygame.time.get_ticks() - self.menu_start_time
         fade = min(255, int(255 * (elapsed / 700.0)))
         bob = math.sin(pygame.time.get_ticks() / 900.0) * 5
-        title_surf = title_font.render("TIC TAC TOE", True, (255,255,255))
+        title_surf, shadow = menu_title.get()
         title_surf.set_alpha(fade)
         title_rect = title_surf.get_rect(center=(WIDTH//2, HEIGHT//6 + bob))
         # Shadow for depth
-        shadow = title_font.render("TIC TAC TOE", True, (0,0,0))
         shadow.set_alpha(max(0, fade-60))
         shadow_rect = shadow.get_rect(center=(title_rect.centerx + 6, title_rect.centery + 6))
         screen.blit(shadow, shadow_rect)
@@ -545,9 +581,7 @@ class TicTacToe:
 
         # Decorative translucent card for contrast
         card_rect = pygame.Rect(WIDTH//2 - 260, HEIGHT//2 - 120, 520, 320)
-        card_surf = pygame.Surface(card_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(card_surf, (255,255,255,200), card_surf.get_rect(), border_radius=18)
-        pygame.draw.rect(card_surf, (0,0,0,40), card_surf.get_rect(), 3, border_radius=18)
+        card_surf = sprite(("menu_card",), card_rect.size, self.paint_card)
         screen.blit(card_surf, card_rect.topleft)
 
         # Buttons
@@ -556,10 +590,14 @@ class TicTacToe:
             btn.update(mouse_pos)
             btn.draw(screen)
 
+    @staticmethod
+    def paint_card(card_surf):
+        """The translucent card behind the main menu buttons."""
+        pygame.draw.rect(card_surf, (255,255,255,200), card_surf.get_rect(), border_radius=18)
+        pygame.draw.rect(card_surf, (0,0,0,40), card_surf.get_rect(), 3, border_radius=18)
+
     def draw_game_mode_select(self, mouse_pos):
-        surface = pygame.Surface((WIDTH, HEIGHT))
-        draw_multi_gradient(surface, [(40,160,255),(100,200,180),(220,120,255)], vertical=False)
-        screen.blit(surface,(0,0))
+        screen.blit(gradient_background([(40,160,255),(100,200,180),(220,120,255)]), (0,0))
         title = title_font.render("SELECT MODE", True, WHITE)
         screen.blit(title, title.get_rect(center=(WIDTH//2, HEIGHT//6)))
         box = pygame.Rect(WIDTH//2 - 380//2, HEIGHT//2 - 160//2, 380, 260)
@@ -571,9 +609,7 @@ class TicTacToe:
             btn.draw(screen)
 
     def draw_difficulty_select(self, mouse_pos):
-        surface = pygame.Surface((WIDTH, HEIGHT))
-        draw_multi_gradient(surface, [(255,140,0),(255,60,120),(120,60,255)], vertical=False)
-        screen.blit(surface,(0,0))
+        screen.blit(gradient_background([(255,140,0),(255,60,120),(120,60,255)]), (0,0))
         title = title_font.render("DIFFICULTY", True, WHITE)
         screen.blit(title, title.get_rect(center=(WIDTH//2, HEIGHT//6)))
         box = pygame.Rect(WIDTH//2 - 420//2, HEIGHT//2 - 180//2, 420, 320)
@@ -587,9 +623,7 @@ class TicTacToe:
     def draw_game_over(self, mouse_pos):
         # draw board underneath then overlay
         self.draw_board()
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0,0,0,160))
-        screen.blit(overlay,(0,0))
+        screen.blit(shade((WIDTH, HEIGHT), (0,0,0,160)), (0,0))
         box = pygame.Rect(WIDTH//2 - 300, HEIGHT//3 - 60, 600, 320)
         pygame.draw.rect(screen, WHITE, box, border_radius=16)
         pygame.draw.rect(screen, BLACK, box, 2, border_radius=16)
@@ -613,16 +647,34 @@ class TicTacToe:
             btn.update(mouse_pos)
             btn.draw(screen)
 
+    def animating(self):
+        """
+        True while something on screen must move smoothly: always on the
+        main menu (its glow drifts and its title bobs), elsewhere while a
+        button slides or pulses.
+        """
+        if self.game_state == MAIN_MENU:
+            return True
+        return any(self.buttons[key].animating() for key in self.SCREEN_BUTTONS.get(self.game_state, []))
+
     # ------------------------
     # Main loop
     # ------------------------
     def run(self):
+        """Main loop; returns True if the window was closed, False on Quit or Esc."""
         running = True
+        closed = False
         while running:
+            profiler.begin_frame()
             mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
+            for event in self.pacer.events():
+                if profiler.handle_event(event):
+                    continue
                 if event.type == pygame.QUIT:
                     running = False
+                    closed = True
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    running = False
 
                 # AI timer event: triggered after short delay to simulate thinking
                 if event.type == pygame.USEREVENT + 1:
@@ -679,6 +731,8 @@ class TicTacToe:
                             elif key == 'main_menu':
                                 self.game_state = MAIN_MENU
 
+            profiler.mark("events")
+
             # Update buttons (hover & animation)
             for b in self.buttons.values():
                 b.update(mouse_pos)
@@ -686,6 +740,7 @@ class TicTacToe:
             # Auto-transition to GAME_OVER screen if game finished
             if self.game_state == IN_GAME and self.game_over:
                 self.game_state = GAME_OVER
+            profiler.mark("update")
 
             # Drawing
             if self.game_state == MAIN_MENU:
@@ -699,18 +754,38 @@ class TicTacToe:
                 self.draw_board()
             elif self.game_state == GAME_OVER:
                 self.draw_game_over(mouse_pos)
+            profiler.mark("draw")
+            profiler.draw(screen)
 
             pygame.display.flip()
-            clock.tick(FPS)
+            profiler.mark("flip")
+            profiler.end_frame()
+            self.pacer.tick(self.animating())
 
-        # Cleanup
+        # Cleanup (the window and mixer stay open for the launcher)
+        pygame.time.set_timer(pygame.USEREVENT + 1, 0)  # Drop a pending AI move
+        profiler.close()
         sound_manager.stop_background_music()
-        pygame.quit()
-        sys.exit()
+        return closed
 
 # ----------------------------
 # Run (entrypoint)
 # ----------------------------
 if __name__ == "__main__":
-    game = TicTacToe()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tic Tac Toe")
+    parser.add_argument("--seed", type=int, help="seed for reproducible computer moves")
+    add_profile_argument(parser)
+    add_gc_argument(parser)
+    args = parser.parse_args()
+    if args.profile:
+        profiler.record_to(args.profile)
+    if args.profile_allocations:
+        profiler.track_allocations()
+    if args.gc_between_frames:
+        schedule_gc()
+    game = TicTacToe(args.seed)
     game.run()
+    pygame.quit()
+    sys.exit()
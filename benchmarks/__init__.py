@@ -0,0 +1,14 @@
+"""
+Microbenchmarks of every game's hot paths.
+
+The games are imported headlessly (SDL dummy video and audio drivers) and
+their real classes and functions are timed on synthetic workloads whose
+size scales with --scale. Results are stored as JSON so a later run can be
+compared against a baseline:
+
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks run --output current.json
+    python -m benchmarks compare baseline.json current.json --threshold 0.1
+
+Run from the repository root.
+"""
@@ -0,0 +1,182 @@
+"""
+Command line for the benchmark suite.
+
+    python -m benchmarks run [--scale 2] [--repeats 7] [--filter sling] [--output FILE]
+    python -m benchmarks startup [--repeats 5] [--window] [--output FILE]
+    python -m benchmarks idle [--seconds 5] [--output FILE]
+    python -m benchmarks memory [--filter sling] [--output FILE]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.1]
+
+run times every case (each repeat on freshly built state, with the garbage
+collector paused) and reports the best and median time per op, and for
+drawing cases the draw calls per op that went through common/sprites.py. compare
+flags every case whose median slowed down by more than the threshold and
+exits with status 1 if there is any. startup measures import time and
+time to first frame per game (see benchmarks/startup.py), and idle the
+CPU time spent on screens where nothing moves (see benchmarks/idle.py),
+and memory the bytes each game entity takes (see benchmarks/memory.py);
+their results compare the same way. Results that are not times (idle,
+memory) carry their measurement in "value", with "unit" naming it in full.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+
+from benchmarks.games import use_dummy_drivers
+from benchmarks.idle import run_idle
+from benchmarks.memory import run_memory
+from benchmarks.startup import run_startup
+
+
+def run_case(function, size, repeats):
+    """Time one case; returns (ops, per-op times in ns, best first, draw calls per op)."""
+    from common import sprites
+
+    times = []
+    for _ in range(repeats):
+        run, ops = function(size)
+        sprites.stats["calls"] = 0
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            run()
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            gc.enable()
+        times.append(elapsed / ops)
+    return ops, sorted(times), sprites.stats["calls"] / ops
+
+
+def environment():
+    import pygame
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run_all(scale=1.0, repeats=5, name_filter=None):
+    from benchmarks.cases import BENCHMARKS
+
+    results = {}
+    for name, (function, base_size, unit) in BENCHMARKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        size = max(1, int(base_size * scale))
+        ops, times, draw_calls = run_case(function, size, repeats)
+        results[name] = {
+            "size": size,
+            "ops": ops,
+            "unit": unit,
+            "best_ns": times[0],
+            "median_ns": statistics.median(times),
+            "repeats": repeats,
+        }
+        calls = ""
+        if draw_calls:
+            results[name]["draw_calls"] = draw_calls
+            calls = f"  {draw_calls:.1f} draw calls/{unit}"
+        print(f"{name:<36} size {size:>7}  {results[name]['median_ns']:>12.0f} ns/{unit}  "
+              f"(best {times[0]:.0f}){calls}")
+    return dict(environment(), scale=scale, results=results)
+
+
+def measured(result):
+    """The quantity a result compares on and its unit: the median time, or value for other measurements."""
+    if "value" in result:
+        return result["value"], result["unit"]
+    return result["median_ns"], f"ns/{result['unit']}"
+
+
+def compare(baseline, current, threshold):
+    """Print the change of every case in both reports; returns the regressed names."""
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<32} new")
+            continue
+        if before["size"] != result["size"]:
+            print(f"{name:<32} skipped: size {before['size']} -> {result['size']}")
+            continue
+        (old, _), (new, unit) = measured(before), measured(result)
+        change = new / old - 1
+        status = "REGRESSION" if change > threshold else "improved" if change < -threshold else "ok"
+        print(f"{name:<32} {old:>12.0f} -> {new:>12.0f} {unit}  {change:+7.1%}  {status}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the games' hot paths.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--scale", type=float, default=1.0, help="multiply every workload size")
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--filter", help="only run cases whose name contains this")
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+
+    startup_parser = commands.add_parser("startup", help="time each game's import and first frame")
+    startup_parser.add_argument("--repeats", type=int, default=5)
+    startup_parser.add_argument("--window", action="store_true", help="use a real window and audio device")
+    startup_parser.add_argument("--filter", help="only measure names containing this")
+    startup_parser.add_argument("--output", help="write the results to this JSON file")
+
+    idle_parser = commands.add_parser("idle", help="measure CPU use on idle screens, paced and at full rate")
+    idle_parser.add_argument("--seconds", type=float, default=5.0, help="time to show each screen")
+    idle_parser.add_argument("--filter", help="only measure names containing this")
+    idle_parser.add_argument("--output", help="write the results to this JSON file")
+
+    memory_parser = commands.add_parser("memory", help="measure the bytes per game entity, before and after slots")
+    memory_parser.add_argument("--filter", help="only measure names containing this")
+    memory_parser.add_argument("--output", help="write the results to this JSON file")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="flag slowdowns above this fraction (default 0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if args.command in ("run", "startup", "idle", "memory"):
+        if args.command == "run":
+            use_dummy_drivers()
+            report = run_all(args.scale, args.repeats, args.filter)
+        elif args.command == "idle":
+            use_dummy_drivers()
+            report = dict(environment(), results=run_idle(args.seconds, args.filter))
+        elif args.command == "memory":
+            use_dummy_drivers()
+            report = dict(environment(), results=run_memory(args.filter))
+        else:
+            report = dict(environment(), results=run_startup(args.repeats, args.window, args.filter))
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"results written to {args.output}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"no regressions over {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
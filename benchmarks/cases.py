@@ -0,0 +1,256 @@
+"""
+The benchmark cases.
+
+Each case is a function of the workload size that builds fresh state (not
+timed) and returns (run, ops): run() is the timed call and ops is how many
+units of work it does, so results are comparable as time per op. BENCHMARKS
+maps each case's name to (function, base size, unit); the size actually
+used is the base size times --scale.
+"""
+
+import random
+
+import pygame
+
+from benchmarks.games import load_game, load_module
+from common import sprites
+
+BENCHMARKS = {}
+
+# Frames simulated by the per-frame cases
+FRAMES = 100
+
+
+def benchmark(name, size, unit):
+    """Register a case under name with its base workload size."""
+    def register(function):
+        BENCHMARKS[name] = (function, size, unit)
+        return function
+    return register
+
+
+def unbatched(function):
+    """The same drawing case with every sprite in its own blit (see common/sprites.py)."""
+    def case(size):
+        run, ops = function(size)
+
+        def run_unbatched():
+            sprites.BATCHING = False
+            try:
+                run()
+            finally:
+                sprites.BATCHING = True
+        return run_unbatched, ops
+    return case
+
+
+@benchmark("tic_tac_toe.minimax", size=20, unit="position")
+def tic_tac_toe_minimax(size):
+    """Full minimax search from size random positions with two marks played."""
+    game_module = load_game("tic_tac_toe")
+    game = game_module.TicTacToe()
+    rng = random.Random(0)
+    boards = []
+    for _ in range(size):
+        board = [['' for _ in range(3)] for _ in range(3)]
+        first, second = rng.sample(range(9), 2)
+        board[first // 3][first % 3] = 'X'
+        board[second // 3][second % 3] = 'O'
+        boards.append(board)
+
+    def run():
+        for board in boards:
+            game.board = board
+            game.minimax(0, False)
+    return run, size
+
+
+@benchmark("sling_ship.check_collision", size=200, unit="pair")
+def sling_ship_collisions(size):
+    """The projectile x asteroid collision loop, splitting every asteroid hit."""
+    game = load_game("sling_ship")
+    game.streams = game.RandomStreams(0)  # The game draws from its module-level streams
+    rng = random.Random(0)
+    asteroids = []
+    for _ in range(size):
+        asteroid = game.Asteroid(rng.randint(1, 3))
+        asteroid.x = rng.uniform(0, game.WIDTH)
+        asteroid.y = rng.uniform(0, game.HEIGHT)
+        asteroids.append(asteroid)
+    projectiles = [game.Projectile(rng.uniform(0, game.WIDTH), rng.uniform(0, game.HEIGHT),
+                                   rng.uniform(0, 6.28), 100) for _ in range(max(1, size // 4))]
+
+    def run():
+        new_asteroids = []
+        for projectile in projectiles:
+            for asteroid in asteroids:
+                if game.check_collision(projectile, asteroid):
+                    new_asteroids.extend(asteroid.split())
+                    break
+        return new_asteroids
+    return run, len(projectiles) * len(asteroids)
+
+
+def explosions(size):
+    """size seeded explosions of mixed sizes scattered over the window."""
+    game = load_game("sling_ship")
+    game.streams = game.RandomStreams(0)
+    rng = random.Random(0)
+    return game, [game.Explosion(rng.uniform(0, game.WIDTH), rng.uniform(0, game.HEIGHT),
+                                 rng.randint(1, 3)) for _ in range(size)]
+
+
+@benchmark("sling_ship.explosion_update", size=50, unit="explosion-frame")
+def sling_ship_explosion_update(size):
+    """Explosion.update over their first frames, while every particle is alive."""
+    _, live = explosions(size)
+    frames = 10  # Particles live at least 10 frames
+
+    def run():
+        for _ in range(frames):
+            for explosion in live:
+                explosion.update()
+    return run, size * frames
+
+
+@benchmark("sling_ship.explosion_draw", size=50, unit="explosion")
+def sling_ship_explosion_draw(size):
+    """Explosion.draw onto an off-screen surface the size of the window."""
+    game, live = explosions(size)
+    surface = pygame.Surface((game.WIDTH, game.HEIGHT))
+    layer = sprites.SpriteBatch()
+
+    def run():
+        for explosion in live:
+            explosion.draw(layer)
+        layer.flush(surface)
+    return run, size
+
+
+benchmark("sling_ship.explosion_draw.unbatched", size=50, unit="explosion")(unbatched(sling_ship_explosion_draw))
+
+
+@benchmark("sling_ship.star_draw", size=100, unit="frame")
+def sling_ship_star_draw(size):
+    """size background stars moved and drawn, frame after frame."""
+    game = load_game("sling_ship")
+    game.streams = game.RandomStreams(0)
+    stars = [game.Star() for _ in range(size)]
+    surface = pygame.Surface((game.WIDTH, game.HEIGHT))
+    layer = sprites.SpriteBatch()
+
+    def run():
+        for _ in range(FRAMES):
+            for star in stars:
+                star.update()
+                star.draw(layer)
+            layer.flush(surface)
+    return run, FRAMES
+
+
+benchmark("sling_ship.star_draw.unbatched", size=100, unit="frame")(unbatched(sling_ship_star_draw))
+
+
+def light_jumper_level(size):
+    """size platforms and size // 4 dangers spread over a scrolling world."""
+    game = load_game("light_jumper")
+    rng = random.Random(0)
+    width = max(game.SCREEN_WIDTH, size * 60)
+    platforms = [game.Platform(rng.uniform(0, width), rng.uniform(200, game.SCREEN_HEIGHT - 50),
+                               rng.randint(60, 200), is_moving=rng.random() < 0.2) for _ in range(size)]
+    dangers = [game.Danger(rng.uniform(0, width), rng.uniform(200, game.SCREEN_HEIGHT - 50), 60, 20)
+               for _ in range(max(1, size // 4))]
+    player = game.Player(100, 300)
+    player.max_x = None
+    player.vel_x = game.PLAYER_SPEED
+    return game, platforms, dangers, player
+
+
+@benchmark("light_jumper.player_move", size=100, unit="step")
+def light_jumper_player_move(size):
+    """Player.move against every platform and danger, running right and jumping."""
+    _, platforms, dangers, player = light_jumper_level(size)
+
+    def run():
+        for frame in range(FRAMES):
+            if frame % 30 == 0:
+                player.jump()
+            player.move(platforms, dangers)
+    return run, FRAMES
+
+
+@benchmark("light_jumper.platform_reveal", size=100, unit="platform-frame")
+def light_jumper_platform_reveal(size):
+    """The Platform.update reveal loop while the light pulse is active."""
+    game, platforms, _, player = light_jumper_level(size)
+
+    def run():
+        for _ in range(FRAMES):
+            player.light_pulse = game.LIGHT_DURATION
+            for platform in platforms:
+                platform.update(player)
+    return run, size * FRAMES
+
+
+@benchmark("light_jumper.draw_world", size=100, unit="frame")
+def light_jumper_draw_world(size):
+    """Game.draw_game with every platform and danger lit, scrolling across the level."""
+    game, platforms, dangers, player = light_jumper_level(size)
+    world = game.Game(seed=0)
+    world.level.platforms = platforms
+    world.level.dangers = dangers
+    world.player = player
+    world.game_state = "playing"
+    rng = random.Random(0)
+    world.particles = [game.Particle(rng.uniform(0, game.SCREEN_WIDTH), rng.uniform(0, game.SCREEN_HEIGHT),
+                                     game.LIGHT_PULSE_COLOR, rng) for _ in range(50)]
+    for thing in platforms + dangers:
+        thing.revealed = True
+        thing.reveal_timer = 30  # Fully lit (update() is never called here)
+    game.screen = pygame.Surface((game.SCREEN_WIDTH, game.SCREEN_HEIGHT))  # Off-screen, no window
+
+    def run():
+        for frame in range(FRAMES):
+            world.camera_x = world.prev_camera_x = frame * 10
+            world.draw_game()
+    return run, FRAMES
+
+
+benchmark("light_jumper.draw_world.unbatched", size=100, unit="frame")(unbatched(light_jumper_draw_world))
+
+
+@benchmark("snake.step", size=10000, unit="tick")
+def snake_step(size):
+    """snake_state.step on a snake size cells long, sweeping a 100-column board."""
+    snake_state = load_module("Snake Game", "snake_state")
+    cols = 100
+    rows = (size + FRAMES * 10) // cols + 2
+    rows += rows % 2  # sweep only cycles on an even number of rows
+    state = snake_state.long_snake(rows, cols, size)
+    ticks = FRAMES * 10
+
+    def run():
+        for _ in range(ticks):
+            snake_state.step(state, snake_state.sweep(state))
+    return run, ticks
+
+
+@benchmark("rain_dodge.star_update", size=1000, unit="frame")
+def rain_dodge_star_update(size):
+    """Spawn, move, cull and hit-test a pool holding about size stars."""
+    falling_objects = load_module("Rain Dodge Game", "falling_objects")
+    rng = random.Random(0)
+    width, height = 1000, 800
+    pool = falling_objects.FallingObjectPool(10, 20, 3.0)
+    pool.spawn([rng.randint(0, width - 10) for _ in range(size)], 0)
+    pool.y[:size] = [rng.uniform(-20, height) for _ in range(size)]  # Spread down the screen
+    player = pygame.Rect(200, height - 60, 40, 60)
+    wave = [rng.randint(0, width - 10) for _ in range(3)]
+
+    def run():
+        for _ in range(FRAMES):
+            pool.spawn(wave, -20)
+            pool.move()
+            pool.cull(height)
+            pool.hits(player)
+    return run, FRAMES
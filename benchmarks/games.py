@@ -0,0 +1,23 @@
+"""
+Headless loading of the game scripts.
+
+The loading itself lives in common/games.py; here every game is imported
+with the SDL dummy drivers, so no window or audio device is ever opened.
+"""
+
+import os
+
+from common import games
+from common.games import GAMES, ROOT, add_folder, load_module
+
+
+def use_dummy_drivers():
+    """Make SDL open no window and no audio device; must run before pygame.init."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def load_game(name):
+    """Import one of GAMES (once) and return the module."""
+    use_dummy_drivers()
+    return games.load_game(name)
@@ -0,0 +1,71 @@
+"""
+Idle CPU benchmark: the CPU time a game burns on a screen where nothing
+happens.
+
+Each scene is left alone for a few seconds under the SDL dummy drivers,
+once with the frame pacer's idle mode and once rendering at full rate,
+and the process CPU time is reported per second of wall time (1e9 ns/s is
+one busy core). The game is closed with a timed QUIT event, as if the
+player had closed the window.
+
+    tic_tac_toe.mode_select  the mode select screen (static once the buttons are in)
+    light_jumper.start       the start screen
+"""
+
+import time
+
+import pygame
+
+from benchmarks.games import load_game
+from common.pacing import FramePacer
+
+
+def tic_tac_toe_mode_select():
+    """Tic Tac Toe opened on the mode select screen (the main menu never stops moving)."""
+    game_module = load_game("tic_tac_toe")
+    game = game_module.TicTacToe()
+    game.game_state = game_module.GAME_MODE_SELECT
+    return game.run()
+
+
+# Scene -> function that shows it until the window is closed
+SCENES = {
+    "tic_tac_toe.mode_select": tic_tac_toe_mode_select,
+    "light_jumper.start": lambda: load_game("light_jumper").Game().run(),
+}
+
+MODES = {"paced": True, "full_rate": False}
+
+
+def measure(scene, seconds, idle):
+    """CPU ns per wall second while showing scene for seconds."""
+    FramePacer.idle_enabled = idle
+    try:
+        pygame.event.clear()
+        pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), loops=1)
+        wall = time.perf_counter_ns()
+        cpu = time.process_time_ns()
+        SCENES[scene]()
+        return (time.process_time_ns() - cpu) / (time.perf_counter_ns() - wall) * 1e9
+    finally:
+        FramePacer.idle_enabled = True
+
+
+def run_idle(seconds=5.0, name_filter=None):
+    """Results for every scene and mode, in the same format as benchmarks run."""
+    results = {}
+    for scene in SCENES:
+        for mode, idle in MODES.items():
+            key = f"idle.{scene}.{mode}"
+            if name_filter and name_filter not in key:
+                continue
+            cpu = measure(scene, seconds, idle)
+            results[key] = {
+                "size": seconds,
+                "ops": 1,
+                "unit": "CPU ns/s",
+                "value": cpu,  # CPU time per wall second, not a time per op
+                "repeats": 1,
+            }
+            print(f"{key:<36} {cpu / 1e7:>6.1f}% of a core")
+    return results
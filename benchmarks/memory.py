@@ -0,0 +1,114 @@
+"""
+Memory benchmark: bytes per game entity, in the slotted and columnar
+layouts the games use and in the old per-instance __dict__ layout.
+
+Each entity is copied COUNT times under tracemalloc, once as it is and
+once as an equivalent object holding the same attributes in a __dict__
+(for explosions, with the old dict per particle). The copies share the
+attribute values, so the difference is the cost of the layout itself.
+
+    light_jumper.player / platform / danger / goal / particle
+    sling_ship.player / projectile / asteroid / explosion / star
+"""
+
+import copy
+import gc
+import random
+import tracemalloc
+
+from benchmarks.games import load_game
+
+COUNT = 1000
+
+
+def light_jumper_entities():
+    game = load_game("light_jumper")
+    return {
+        "light_jumper.player": game.Player(100, 300),
+        "light_jumper.platform": game.Platform(200, 400, 120, is_moving=True),
+        "light_jumper.danger": game.Danger(300, 500, 60, 20),
+        "light_jumper.goal": game.Goal(700, 300),
+        "light_jumper.particle": game.Particle(100, 300, game.LIGHT_PULSE_COLOR, random.Random(0)),
+    }
+
+
+def sling_ship_entities():
+    game = load_game("sling_ship")
+    game.streams = game.RandomStreams(0)
+    return {
+        "sling_ship.player": game.Player(),
+        "sling_ship.projectile": game.Projectile(100, 100, 0.5, 100),
+        "sling_ship.asteroid": game.Asteroid(3),
+        "sling_ship.explosion": game.Explosion(100, 100, 3),
+        "sling_ship.star": game.Star(),
+    }
+
+
+def unslotted(entity):
+    """A factory of plain objects with entity's attributes in an instance __dict__."""
+    names = [name for name in type(entity).__slots__ if name != "__weakref__"]
+    values = [getattr(entity, name) for name in names]
+    if type(entity).__name__ == "Explosion":
+        # The old layout: one dict per particle instead of the columns
+        columns = ("lifetimes", "vx", "vy", "sizes", "colors")
+        names = [name for name in names if name not in columns + ("age", "alive")] + ["particles"]
+        values = [getattr(entity, name) for name in names[:-1]] + [
+            [{"x": entity.x, "y": entity.y, "vx": vx, "vy": vy, "lifetime": lifetime, "size": size, "color": color}
+             for lifetime, vx, vy, size, color in
+             zip(entity.lifetimes, entity.vx, entity.vy, entity.sizes, entity.colors)]]
+
+    def __init__(self):
+        for name, value in zip(names, values):
+            if name == "particles":
+                value = [dict(particle) for particle in value]
+            setattr(self, name, value)
+    return type(type(entity).__name__, (), {"__init__": __init__})
+
+
+def slotted(entity):
+    """A factory of copies of entity, with its own copy of every list (the columns)."""
+    lists = [name for name in type(entity).__slots__ if isinstance(getattr(entity, name), list)]
+
+    def build():
+        clone = copy.copy(entity)
+        for name in lists:
+            setattr(clone, name, list(getattr(entity, name)))
+        return clone
+    return build
+
+
+def bytes_per_entity(factory, count=COUNT):
+    """Memory held by count objects from factory, per object."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        kept = [factory() for _ in range(count)]
+        held = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del kept
+    return held / count
+
+
+def run_memory(name_filter=None):
+    """Results for every entity and layout, in the same format as benchmarks run."""
+    results = {}
+    entities = dict(light_jumper_entities(), **sling_ship_entities())
+    for name, entity in entities.items():
+        if name_filter and name_filter not in name:
+            continue
+        sizes = {}
+        for layout, factory in (("dict", unslotted(entity)), ("slots", slotted(entity))):
+            key = f"memory.{name}.{layout}"
+            sizes[layout] = size = bytes_per_entity(factory)
+            results[key] = {
+                "size": COUNT,
+                "ops": 1,
+                "unit": "bytes/entity",
+                "value": size,
+                "repeats": 1,
+            }
+        print(f"{name:<28} {sizes['dict']:>8.0f} -> {sizes['slots']:>6.0f} bytes/entity  "
+              f"({sizes['slots'] / sizes['dict'] - 1:+.0%})")
+    return results
@@ -0,0 +1,111 @@
+"""
+Startup benchmark: import time and time to first frame for every game.
+
+Each measurement runs in a fresh interpreter, so nothing is warm except
+the OS file cache (and the font lookup cache in common/, which is what a
+player's second launch sees too). Both phases start the clock before
+pygame or Tk is imported:
+
+    import       executing the game script as a module, as a launcher or
+                 the benchmarks would import it
+    first_frame  running the script as __main__ until its first
+                 pygame.display.flip/update (for Snake, until Tk's
+                 mainloop starts, after the first tick has been drawn)
+
+By default the SDL dummy drivers are used; --window measures with a real
+window and audio device. Snake needs a Tk display either way.
+"""
+
+import os
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.games import GAMES, ROOT, add_folder, load_game
+
+PHASES = ("import", "first_frame")
+
+
+class FirstFrame(BaseException):
+    """Raised from the patched flip to stop the game once it has drawn a frame."""
+
+
+def first_frame(name):
+    """Run a game's script as __main__ up to its first frame (called in the child)."""
+    folder, script = GAMES[name]
+    path = add_folder(folder)
+
+    def stop(*args, **kwargs):
+        raise FirstFrame
+
+    if name == "snake":
+        import tkinter
+        tkinter.Tk.mainloop = stop
+    else:
+        import pygame
+        pygame.display.flip = stop
+        pygame.display.update = stop
+
+    os.chdir(path)
+    sys.argv = [script]
+    try:
+        runpy.run_path(os.path.join(path, script), run_name="__main__")
+    except FirstFrame:
+        return
+    raise RuntimeError(f"{script} exited without drawing a frame")
+
+
+def measure(name, phase, window=False):
+    """Time one phase of one game in a fresh interpreter; returns nanoseconds."""
+    env = dict(os.environ)
+    if not window:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+        env.setdefault("SDL_AUDIODRIVER", "dummy")
+    child = subprocess.run([sys.executable, "-m", "benchmarks.startup", name, phase],
+                           cwd=ROOT, env=env, capture_output=True, text=True)
+    for line in reversed(child.stdout.splitlines()):
+        if line.startswith("STARTUP_NS "):
+            return int(line.split()[1])
+    error = child.stderr.strip().splitlines()
+    raise RuntimeError(error[-1] if error else f"exit status {child.returncode}")
+
+
+def run_startup(repeats=5, window=False, name_filter=None):
+    """Results for every game and phase, in the same format as benchmarks run."""
+    results = {}
+    for name in GAMES:
+        for phase in PHASES:
+            key = f"startup.{name}.{phase}"
+            if name_filter and name_filter not in key:
+                continue
+            try:
+                times = sorted(measure(name, phase, window) for _ in range(repeats))
+            except RuntimeError as error:
+                print(f"{key:<32} failed: {error}")
+                continue
+            results[key] = {
+                "size": 1,
+                "ops": 1,
+                "unit": "launch",
+                "best_ns": times[0],
+                "median_ns": statistics.median(times),
+                "repeats": repeats,
+            }
+            print(f"{key:<32} {results[key]['median_ns'] / 1e6:>9.1f} ms  (best {times[0] / 1e6:.1f})")
+    return results
+
+
+if __name__ == "__main__":
+    # Child process: python -m benchmarks.startup NAME PHASE
+    game, phase = sys.argv[1:3]
+    start = time.perf_counter_ns()
+    if phase == "import":
+        load_game(game)
+    else:
+        first_frame(game)
+    elapsed = time.perf_counter_ns() - start
+    sys.stdout.flush()
+    os.write(1, f"\nSTARTUP_NS {elapsed}\n".encode())
+    os._exit(0)  # Skip interpreter and pygame teardown
@@ -0,0 +1,6 @@
+"""
+Code shared by the pygame games.
+
+Each game runs as a script from its own folder and appends the repository
+root to sys.path before importing from here.
+"""
@@ -0,0 +1,196 @@
+"""
+Content-addressed asset cache shared by the games.
+
+Generated surfaces and decoded sounds are stored in asset_cache/ as raw
+pixels or PCM, under the hash of everything the bytes depend on: the
+generator's name and parameters, the hash of the file defining the
+generator (so editing a game's drawing code redraws its assets), the hash
+of the source file for loaded ones, the pygame version (for pixels) and
+the mixer format (for PCM). Later launches map
+the stored file into memory and hand it to pygame, without drawing or
+decoding anything:
+
+    surfaces  pygame.image.frombuffer on a copy-on-write mapping, so the
+              pixels are never copied unless something draws on them
+    sounds    mixer.Sound(buffer=...) on a mapping (SDL_mixer copies the
+              PCM once into its own chunk)
+
+The objects themselves are kept in an in-memory LRU of at most
+MEMORY_BUDGET bytes of pixels and samples, so an asset asked for twice in
+one process (by the launcher's warm-up and then by the game, say) is only
+built once.
+
+    ship = assets.surface(("sling_ship.ship",), create_ship_image)
+    click = assets.sound_file("click.wav")
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "asset_cache")
+MEMORY_BUDGET = 64 * 1024 * 1024  # Bytes of pixels and PCM kept alive in memory
+FORMAT_VERSION = 1  # Bump when the stored layout changes
+
+_memory = OrderedDict()  # digest -> (object, bytes), least recently used first
+_memory_bytes = 0
+_lock = threading.Lock()
+_file_digests = {}  # (path, size, mtime) -> sha256 of the contents
+
+
+def file_digest(path):
+    """sha256 of a file's contents, hashed once per process per version of the file."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    digest = _file_digests.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                sha.update(block)
+        digest = _file_digests[key] = sha.hexdigest()
+    return digest
+
+
+def generator_digest(generate):
+    """sha256 of the file that defines generate (a function or lambda), or None."""
+    code = getattr(generate, "__code__", None)
+    if code is None or not os.path.isfile(code.co_filename):
+        return None
+    return file_digest(code.co_filename)
+
+
+def asset_key(kind, params):
+    """The content address of an asset: a hash of what produced it."""
+    return hashlib.sha256(repr((FORMAT_VERSION, kind, params)).encode()).hexdigest()
+
+
+def _recall(digest):
+    with _lock:
+        entry = _memory.get(digest)
+        if entry is None:
+            return None
+        _memory.move_to_end(digest)
+        return entry[0]
+
+
+def _remember(digest, value, size):
+    global _memory_bytes
+    with _lock:
+        if digest in _memory:
+            return _memory[digest][0]  # Another thread built it first; share that one
+        _memory[digest] = (value, size)
+        _memory_bytes += size
+        while _memory_bytes > MEMORY_BUDGET and len(_memory) > 1:
+            _, (_, evicted) = _memory.popitem(last=False)
+            _memory_bytes -= evicted
+        return value
+
+
+def _paths(digest):
+    base = os.path.join(CACHE_DIR, digest)
+    return base + ".raw", base + ".json"
+
+
+def _read(digest):
+    """(metadata, buffer) for a stored asset, or None if it is not stored."""
+    raw_path, meta_path = _paths(digest)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta["bytes"] == 0:
+            return meta, b""  # mmap cannot map an empty file
+        with open(raw_path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError, KeyError):
+        return None
+    if len(data) != meta["bytes"]:
+        return None  # Truncated
+    return meta, data
+
+
+def _replace(path, content):
+    temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp, "wb") as f:
+        f.write(content)
+    os.replace(temp, path)  # Atomic, so a reader never maps half a file
+
+
+def _write(digest, meta, data):
+    raw_path, meta_path = _paths(digest)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _replace(raw_path, data)
+        # The metadata goes last: an entry without it is a miss
+        _replace(meta_path, json.dumps(dict(meta, bytes=len(data))).encode())
+    except OSError:
+        pass  # A read-only checkout just goes without the cache
+
+
+def surface(params, generate):
+    """
+    A generated Surface, drawn by generate() only when it is not cached.
+    params must pin down the pixels together with generate's source file.
+    """
+    digest = asset_key("surface", (params, generator_digest(generate), pygame.version.ver))
+    surf = _recall(digest)
+    if surf is not None:
+        return surf
+    stored = _read(digest)
+    if stored is not None:
+        meta, data = stored
+        surf = pygame.image.frombuffer(data, meta["size"], meta["format"])
+    else:
+        surf = generate()
+        pixel_format = "RGBA" if surf.get_flags() & pygame.SRCALPHA else "RGBX"
+        data = pygame.image.tobytes(surf, pixel_format)
+        _write(digest, {"size": surf.get_size(), "format": pixel_format}, data)
+    return _remember(digest, surf, len(data))
+
+
+def sound(params, generate):
+    """
+    A generated Sound, synthesized by generate() only when it is not
+    cached. The mixer must be open, since the PCM is cached per mixer
+    format; without one, generate() is just called.
+    """
+    mixer_format = pygame.mixer.get_init()
+    if mixer_format is None:
+        return generate()
+    digest = asset_key("sound", (params, generator_digest(generate), mixer_format))
+    cached = _recall(digest)
+    if cached is not None:
+        return cached
+    stored = _read(digest)
+    if stored is not None:
+        data = stored[1]
+        result = pygame.mixer.Sound(buffer=data)
+    else:
+        result = generate()
+        data = result.get_raw()
+        _write(digest, {"mixer": mixer_format}, data)
+    return _remember(digest, result, len(data))
+
+
+def sound_file(path):
+    """A sound file, decoded and converted to the mixer's format once per file contents."""
+    return sound(("file", file_digest(path)), lambda: pygame.mixer.Sound(path))
+
+
+def font_file(path, size):
+    """
+    A font loaded from a file, shared by everything that asks for the same
+    file contents at the same size. Fonts are kept in memory only; the
+    system font lookup is cached on disk by common/fonts.py.
+    """
+    digest = asset_key("font", (file_digest(path), size))
+    font = _recall(digest)
+    if font is None:
+        pygame.font.init()
+        font = _remember(digest, pygame.font.Font(path, size), os.path.getsize(path))
+    return font
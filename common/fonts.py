@@ -0,0 +1,77 @@
+"""
+System fonts with an on-disk lookup cache.
+
+pygame.font.SysFont scans every installed font the first time it is
+called in a process (on Linux by running fc-list), which can take longer
+than the rest of a game's startup. sys_font resolves each (name, bold,
+italic) to a font file once, remembers the answer in font_cache.json, and
+loads the file directly on later runs. Fonts are also shared within a
+process, so asking for the same font twice returns the same object.
+"""
+
+import json
+import os
+
+import pygame
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "font_cache.json")
+
+_paths = None   # "name|bold|italic" -> [path or None, fake bold, fake italic]
+_fonts = {}
+
+
+def _load_paths():
+    global _paths
+    if _paths is None:
+        try:
+            with open(CACHE_PATH) as f:
+                _paths = json.load(f)
+        except (OSError, ValueError):
+            _paths = {}
+    return _paths
+
+
+def _save_paths():
+    temp = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "w") as f:
+            json.dump(_paths, f, indent=1, sort_keys=True)
+        os.replace(temp, CACHE_PATH)  # Atomic, so games starting together never read half a file
+    except OSError:
+        pass  # A read-only checkout just goes without the cache
+
+
+def resolve(name, bold=False, italic=False):
+    """
+    (path, fake_bold, fake_italic) for a system font, like SysFont picks it:
+    the styled file if there is one, otherwise the regular file with
+    pygame's synthetic style. path is None if no such font is installed.
+    """
+    paths = _load_paths()
+    key = f"{name.lower()}|{int(bold)}|{int(italic)}"
+    entry = paths.get(key)
+    if entry is None or (entry[0] is not None and not os.path.exists(entry[0])):
+        path = pygame.font.match_font(name, bold, italic)  # The slow system scan
+        if path is None:
+            entry = [None, bold, italic]
+        else:
+            entry = [path,
+                     bold and path == pygame.font.match_font(name, False, italic),
+                     italic and path == pygame.font.match_font(name, bold, False)]
+        paths[key] = entry
+        _save_paths()
+    return entry
+
+
+def sys_font(name, size, bold=False, italic=False):
+    """Drop-in for pygame.font.SysFont that skips the system scan when it can."""
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        pygame.font.init()
+        path, fake_bold, fake_italic = resolve(name, bold, italic)
+        font = pygame.font.Font(path, size)
+        font.set_bold(fake_bold)
+        font.set_italic(fake_italic)
+        _fonts[key] = font
+    return font
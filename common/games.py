@@ -0,0 +1,55 @@
+"""
+Loading the game scripts as modules.
+
+The games are scripts in folders with spaces in their names, so they are
+loaded from their file paths, with their folder put on sys.path for their
+helper modules. Importing a game does no pygame work (see common/lazy.py),
+so a game can be loaded ahead of time, from any thread, and run later.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module name -> (folder, script)
+GAMES = {
+    "light_jumper": ("Light Jumper", "Light Jumper.py"),
+    "rain_dodge": ("Rain Dodge Game", "Rain Dodge game.py"),
+    "snake": ("Snake Game", "Snake Game.py"),
+    "sling_ship": ("Sling_Ship_Asteroids", "Sling_Ship_Asteroids.py"),
+    "tic_tac_toe": ("Tic_Tac_Toe", "Tic_Tac_Toe.py"),
+}
+
+_loaded = {}
+_load_lock = threading.Lock()
+
+
+def add_folder(folder):
+    """Put a game folder on sys.path so its helper modules import."""
+    path = os.path.join(ROOT, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return path
+
+
+def load_game(name):
+    """Import one of GAMES (once per process) and return the module."""
+    with _load_lock:
+        if name not in _loaded:
+            folder, script = GAMES[name]
+            path = add_folder(folder)
+            spec = importlib.util.spec_from_file_location(name, os.path.join(path, script))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _loaded[name] = module
+        return _loaded[name]
+
+
+def load_module(folder, name):
+    """Import a helper module from a game folder."""
+    add_folder(folder)
+    return importlib.import_module(name)
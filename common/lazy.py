@@ -0,0 +1,70 @@
+"""
+Lazy initialization helpers, so importing a game does no pygame work.
+
+The window and the mixer are opened by the game's entry point or on first
+use, never at import. Fonts, sounds and generated images are wrapped in
+Lazy and built the first time they are used, or ahead of time by
+warm_up (the launcher does that in the background while its menu is up).
+"""
+
+import threading
+
+import pygame
+
+# Held while a Lazy is being built, so a warm-up thread and the game never
+# build the same object twice. Reentrant because factories may use other Lazies
+_build_lock = threading.RLock()
+
+
+class Lazy:
+    """
+    An object that is built on first use.
+
+    Attribute access is forwarded to factory()'s result, so a Lazy font or
+    sound is used exactly like the real one (font.render(...),
+    sound.play()). Anything passed to pygame's C functions, such as a
+    Surface given to blit, must be unwrapped with get().
+    """
+    __slots__ = ("factory", "value")
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.value = None
+
+    def get(self):
+        if self.value is None:
+            with _build_lock:
+                if self.value is None:
+                    self.value = self.factory()
+        return self.value
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+
+def warm_up(module):
+    """Build every Lazy a module holds at the top level."""
+    for value in list(vars(module).values()):
+        if isinstance(value, Lazy):
+            value.get()
+
+
+def init_display(size, caption):
+    """
+    Open the window, or reuse the one that is open and resize it if needed,
+    so games sharing a process share one window. Only the display module is
+    initialized (it brings up events and the clock); the mixer is left to
+    init_mixer.
+    """
+    pygame.display.init()
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != tuple(size):
+        screen = pygame.display.set_mode(size)
+    pygame.display.set_caption(caption)
+    return screen
+
+
+def init_mixer(**settings):
+    """Open the audio device the first time a game needs sound."""
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(**settings)
@@ -0,0 +1,128 @@
+"""
+Frame pacing with a power-saving idle mode.
+
+A game loop normally renders FPS frames a second whether or not anything
+on screen changes. FramePacer drops to IDLE_FPS once nothing has animated
+and no input has arrived for LINGER_MS, and blocks in
+pygame.event.wait between idle frames, so a menu or game-over screen
+costs almost no CPU. The first event (a key, the mouse, a timer) wakes it
+back to full rate.
+
+The loop fetches its events through the pacer and tells it, once a frame,
+whether anything is moving:
+
+    pacer = FramePacer(FPS)
+    while running:
+        for event in pacer.events():
+            ...
+        draw()
+        dt = pacer.tick(animating=state != "menu")
+
+Run `python -m benchmarks idle` to see the CPU it saves.
+
+The pacer can also take the garbage collector off the frame (opt in with
+--gc-between-frames, see schedule_gc): automatic collection is turned off,
+everything alive once a pacer's first frame is complete (the assets that
+frame loaded, the level, the modules) is frozen out of the collector's
+reach, and tick() runs the collections itself after each frame is drawn,
+in the time it would sleep anyway. Young generations are collected when
+the automatic collector would have; a full collection, once due, waits
+for an idle frame, unless OLD_LIMIT times the usual number of them have
+piled up.
+"""
+
+import gc
+
+import pygame
+
+IDLE_FPS = 4
+LINGER_MS = 300  # Stay at full rate this long after the last input or animation
+OLD_LIMIT = 4  # Full collection while active once this many times its threshold is pending
+
+
+def add_gc_argument(parser):
+    """Add the --gc-between-frames option to a game's argparse parser."""
+    parser.add_argument("--gc-between-frames", action="store_true",
+                        help="freeze what is loaded and collect garbage between frames, "
+                             "fully only on idle frames")
+
+
+def freeze_loaded():
+    """Collect, then move everything still alive out of the collector's reach for good."""
+    gc.collect()
+    gc.freeze()
+
+
+def schedule_gc():
+    """Opt in to collecting between frames, for every pacer."""
+    gc.disable()
+    FramePacer.gc_between_frames = True
+
+
+class FramePacer:
+    """Drop-in for a Clock driving a game loop; see the module docstring."""
+    idle_enabled = True  # Off renders at full rate always (benchmarks/idle.py compares both)
+    gc_between_frames = False  # Set by schedule_gc
+
+    def __init__(self, fps=60, idle_fps=IDLE_FPS):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.last_active = pygame.time.get_ticks()
+        self.idle = False
+        self.ticks = 0  # Counted until freeze_loaded has run
+        self.frozen = False  # freeze_loaded has run after this pacer's first frame
+
+    def wake(self):
+        """Go back to full rate (input arrived or something started moving)."""
+        self.last_active = pygame.time.get_ticks()
+        self.idle = False
+
+    def events(self):
+        """
+        This frame's events, like pygame.event.get(). When idle, first waits
+        until an event arrives or the next idle frame is due.
+        """
+        if self.idle:
+            first = pygame.event.wait(1000 // self.idle_fps)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+        else:
+            events = pygame.event.get()
+        if events:
+            self.wake()
+        return events
+
+    def tick(self, animating=True):
+        """
+        End the frame; returns the ms since the last tick, like Clock.tick.
+        While active the frame rate is capped at fps; when idle, events()
+        does the waiting.
+        """
+        if animating:
+            self.wake()
+        elif self.idle_enabled:
+            self.idle = pygame.time.get_ticks() - self.last_active > LINGER_MS
+        if self.gc_between_frames:
+            self.collect()
+        return self.clock.tick(0 if self.idle else self.fps)
+
+    def collect(self):
+        """Run the collection this frame is due, if any (see the module docstring)."""
+        if not self.frozen:
+            # Loops tick at the top or the bottom of a frame, so only the
+            # second tick is sure to come after a whole frame was drawn
+            self.ticks += 1
+            if self.ticks == 2:
+                freeze_loaded()
+                self.frozen = True
+            return
+        young, middle, old = gc.get_count()
+        young_threshold, middle_threshold, old_threshold = gc.get_threshold()
+        if old >= old_threshold * (1 if self.idle else OLD_LIMIT):
+            gc.collect()
+        elif middle >= middle_threshold:
+            gc.collect(1)
+        elif young >= young_threshold:
+            gc.collect(0)
@@ -0,0 +1,308 @@
+"""
+Frame profiler with an in-game overlay, shared by the pygame games.
+
+A game loop marks the end of each named section of its frame:
+
+    profiler.begin_frame()
+    ...handle events...
+    profiler.mark("events")
+    ...update...
+    profiler.mark("update")
+    ...
+    profiler.end_frame()
+
+Marks are timed with perf_counter_ns, and the last `frames` frames are
+kept in a ring buffer. F3 toggles recording and the overlay: a frame-time
+graph against the 60 FPS budget, p50/p95/p99 and the mean time of each
+section. While the profiler is off every hook returns straight away, so
+the hooks stay in the loops for good.
+
+With --profile FILE the profiler records from the start and writes the
+buffered frames on close(): a .json file gets a Chrome trace (open it in
+chrome://tracing or Perfetto), any other name a CSV with one row per frame.
+
+With --profile-allocations every section also records the bytes it
+allocated (the tracemalloc peak above the memory in use when the section
+began), and every garbage collection that lands inside a frame is
+counted and timed. close() then prints the source lines holding the most
+memory that was allocated since tracking began, from a tracemalloc
+snapshot. Tracking slows everything down; the timings it is combined with
+are only good for comparing sections with each other.
+"""
+
+import csv
+import gc
+import json
+import time
+import tracemalloc
+
+import pygame
+
+# Frame time the graph is drawn against (ms)
+FRAME_BUDGET_MS = 1000 / 60
+
+GRAPH_WIDTH = 300
+GRAPH_HEIGHT = 80
+PANEL_COLOR = (0, 0, 0, 170)
+TEXT_COLOR = (255, 255, 255)
+BAR_COLOR = (80, 200, 120)
+SLOW_BAR_COLOR = (230, 70, 60)      # Frames over budget
+BUDGET_COLOR = (255, 215, 0)
+
+
+# Allocation sites close() prints
+TOP_ALLOCATIONS = 10
+
+
+def add_profile_argument(parser):
+    """Add the --profile FILE and --profile-allocations options to a game's argparse parser."""
+    parser.add_argument("--profile", metavar="FILE",
+                        help="record frame timings from the start and write them to FILE on exit "
+                             "(.json: Chrome trace, otherwise CSV); F3 toggles the overlay")
+    parser.add_argument("--profile-allocations", action="store_true",
+                        help="also record the bytes each section allocates and the garbage "
+                             "collections inside frames (slow)")
+
+
+class FrameProfiler:
+    """
+    Per-section frame timings for the last `frames` frames.
+    Each record is (start_ns, total_ns, [(section, start_ns, duration_ns, bytes), ...],
+    [(gc_start_ns, gc_duration_ns, generation), ...]); bytes and the
+    collections are only recorded while tracking allocations.
+    """
+    def __init__(self, frames=300, hotkey=pygame.K_F3):
+        self.capacity = frames
+        self.hotkey = hotkey
+        self.enabled = False
+        self.dump_path = None
+        self.records = [None] * frames
+        self.count = 0                  # Frames recorded since the start
+        self.frame_start = 0            # 0 while no frame is being recorded
+        self.last_mark = 0
+        self.sections = []
+        self.collections = []           # Garbage collections inside the current frame
+        self.tracking = False           # Allocations and collections are recorded
+        self.started_tracing = False    # tracemalloc was started by track_allocations
+        self.memory_mark = 0            # Traced memory at the last mark
+        self.gc_start = 0
+        self.baseline = None            # tracemalloc snapshot from when tracking began
+        self.font = None
+        self.panel = None
+
+    def track_allocations(self):
+        """Record allocations per section and collections per frame from now on."""
+        if self.tracking:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        self.tracking = True
+        self.baseline = tracemalloc.take_snapshot()
+        gc.callbacks.append(self.on_gc)
+
+    def on_gc(self, phase, info):
+        """gc.callbacks hook: time the collections that run while a frame is recorded."""
+        if not self.frame_start:
+            return
+        now = time.perf_counter_ns()
+        if phase == "start":
+            self.gc_start = now
+        elif self.gc_start:
+            self.collections.append((self.gc_start, now - self.gc_start, info["generation"]))
+            self.gc_start = 0
+
+    def record_to(self, path):
+        """Record from now on and write the buffered frames to path on close()."""
+        self.dump_path = path
+        self.enabled = True
+
+    def handle_event(self, event):
+        """Toggle on the hotkey; returns True if the event was the hotkey."""
+        if event.type == pygame.KEYDOWN and event.key == self.hotkey:
+            self.enabled = not self.enabled
+            self.frame_start = 0        # Never record a frame that was only partly timed
+            return True
+        return False
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_start = self.last_mark = time.perf_counter_ns()
+        self.sections = []
+        self.collections = []
+        if self.tracking:
+            tracemalloc.reset_peak()
+            self.memory_mark = tracemalloc.get_traced_memory()[0]
+
+    def mark(self, name):
+        """End the section called name, which began at the previous mark."""
+        if not self.enabled or not self.frame_start:
+            return
+        allocated = 0
+        if self.tracking:
+            current, peak = tracemalloc.get_traced_memory()
+            allocated = peak - self.memory_mark
+            tracemalloc.reset_peak()
+            self.memory_mark = current
+        now = time.perf_counter_ns()
+        self.sections.append((name, self.last_mark, now - self.last_mark, allocated))
+        self.last_mark = now
+
+    def end_frame(self):
+        if not self.enabled or not self.frame_start:
+            return
+        self.records[self.count % self.capacity] = (self.frame_start, self.last_mark - self.frame_start,
+                                                    self.sections, self.collections)
+        self.count += 1
+        self.frame_start = 0
+
+    def recent(self):
+        """Buffered frame records, oldest first."""
+        first = max(0, self.count - self.capacity)
+        return [self.records[i % self.capacity] for i in range(first, self.count)]
+
+    def stats(self):
+        """
+        Frame time percentiles and mean time per section over the buffer, in
+        ms; with allocation tracking also the mean bytes allocated per
+        section and the collections per frame and longest collection.
+        """
+        frames = self.recent()
+        if not frames:
+            return None
+        totals = sorted(total for _, total, _, _ in frames)
+
+        def percentile(p):
+            return totals[min(len(totals) - 1, len(totals) * p // 100)] / 1e6
+
+        sections = {}
+        allocated = {}
+        collections = []
+        for _, _, marks, frame_collections in frames:
+            for name, _, duration, size in marks:
+                sections[name] = sections.get(name, 0) + duration
+                allocated[name] = allocated.get(name, 0) + size
+            collections += frame_collections
+        return {
+            "frames": len(frames),
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99),
+            "max": totals[-1] / 1e6,
+            "sections": {name: total / len(frames) / 1e6 for name, total in sections.items()},
+            "allocated": {name: total / len(frames) for name, total in allocated.items()},
+            "gc_per_frame": len(collections) / len(frames),
+            "gc_max": max((duration for _, duration, _ in collections), default=0) / 1e6,
+        }
+
+    def draw(self, surface):
+        """Draw the overlay in the bottom-right corner; its own cost is marked as "overlay"."""
+        if not self.enabled:
+            return
+        stats = self.stats()
+        if stats is None:
+            return
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+        lines = [f"{stats['frames']} frames  p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}  "
+                 f"p99 {stats['p99']:.2f}  max {stats['max']:.2f} ms"]
+        if self.tracking:
+            lines += [f"{name:<10} {ms:6.2f} ms {stats['allocated'][name] / 1024:8.1f} KB"
+                      for name, ms in stats["sections"].items()]
+            lines.append(f"gc         {stats['gc_per_frame']:6.2f} per frame, longest {stats['gc_max']:.2f} ms")
+        else:
+            lines += [f"{name:<10} {ms:6.2f} ms" for name, ms in stats["sections"].items()]
+        line_height = self.font.get_linesize()
+
+        height = GRAPH_HEIGHT + 10 + line_height * len(lines) + 10
+        if self.panel is None or self.panel.get_height() != height:
+            self.panel = pygame.Surface((GRAPH_WIDTH + 20, height), pygame.SRCALPHA)
+        panel = self.panel
+        panel.fill(PANEL_COLOR)
+
+        # One bar per frame, newest on the right; the budget line sits at half height
+        scale = GRAPH_HEIGHT / (2 * FRAME_BUDGET_MS * 1e6)
+        frames = self.recent()[-GRAPH_WIDTH:]
+        left = 10 + GRAPH_WIDTH - len(frames)
+        bottom = 10 + GRAPH_HEIGHT
+        for i, (_, total, _, _) in enumerate(frames):
+            bar = min(GRAPH_HEIGHT, int(total * scale))
+            color = SLOW_BAR_COLOR if total > FRAME_BUDGET_MS * 1e6 else BAR_COLOR
+            pygame.draw.line(panel, color, (left + i, bottom), (left + i, bottom - bar))
+        budget_y = bottom - GRAPH_HEIGHT // 2
+        pygame.draw.line(panel, BUDGET_COLOR, (10, budget_y), (10 + GRAPH_WIDTH, budget_y))
+
+        for i, line in enumerate(lines):
+            panel.blit(self.font.render(line, True, TEXT_COLOR), (10, bottom + 10 + i * line_height))
+
+        width, screen_height = surface.get_size()
+        surface.blit(panel, (width - panel.get_width() - 10, screen_height - height - 10))
+        self.mark("overlay")
+
+    def dump(self, path):
+        """Write the buffered frames to path: Chrome trace JSON for .json, else CSV."""
+        frames = self.recent()
+        if path.lower().endswith(".json"):
+            events = []
+            for number, (start, total, marks, collections) in enumerate(frames):
+                events.append({"name": f"frame {number}", "ph": "X", "pid": 1, "tid": 1,
+                               "ts": start / 1000, "dur": total / 1000})
+                for name, mark_start, duration, size in marks:
+                    events.append({"name": name, "ph": "X", "pid": 1, "tid": 1,
+                                   "ts": mark_start / 1000, "dur": duration / 1000,
+                                   "args": {"allocated_bytes": size}})
+                for gc_start, duration, generation in collections:
+                    events.append({"name": f"gc gen {generation}", "ph": "X", "pid": 1, "tid": 2,
+                                   "ts": gc_start / 1000, "dur": duration / 1000})
+            with open(path, "w") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+            return
+
+        names = []
+        for _, _, marks, _ in frames:
+            for name, _, _, _ in marks:
+                if name not in names:
+                    names.append(name)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            header = ["frame", "start_ms", "total_ms"] + [f"{name}_ms" for name in names]
+            if self.tracking:
+                header += [f"{name}_bytes" for name in names] + ["gc_collections", "gc_ms"]
+            writer.writerow(header)
+            for number, (start, total, marks, collections) in enumerate(frames):
+                per_section = dict.fromkeys(names, 0)
+                allocated = dict.fromkeys(names, 0)
+                for name, _, duration, size in marks:
+                    per_section[name] += duration
+                    allocated[name] += size
+                row = ([number, f"{(start - frames[0][0]) / 1e6:.3f}", f"{total / 1e6:.3f}"]
+                       + [f"{per_section[name] / 1e6:.3f}" for name in names])
+                if self.tracking:
+                    row += [allocated[name] for name in names]
+                    row += [len(collections), f"{sum(duration for _, duration, _ in collections) / 1e6:.3f}"]
+                writer.writerow(row)
+
+    def report_allocations(self, limit=TOP_ALLOCATIONS):
+        """Print the source lines that allocated the most memory still held since tracking began."""
+        own = [tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__)]
+        snapshot = tracemalloc.take_snapshot().filter_traces(own)
+        growth = snapshot.compare_to(self.baseline.filter_traces(own), "lineno")
+        print(f"Memory allocated since allocation tracking began, top {limit} lines:")
+        for stat in growth[:limit]:
+            print(f"  {stat}")
+
+    def close(self):
+        """
+        Write the dump requested with record_to, if any frames were recorded,
+        and stop tracking allocations after printing where they went.
+        """
+        if self.dump_path and self.count:
+            self.dump(self.dump_path)
+        if self.tracking:
+            self.report_allocations()
+            gc.callbacks.remove(self.on_gc)
+            self.tracking = False
+            if self.started_tracing:
+                tracemalloc.stop()
+                self.started_tracing = False
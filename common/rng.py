@@ -0,0 +1,89 @@
+"""
+Seeded random number streams for the games.
+
+A game makes one RandomStreams from its seed and gives every subsystem
+(asteroid spawns, explosion particles, the AI, food placement...) its own
+named stream. A run is reproducible from the seed alone, and drawing more
+numbers in one subsystem never shifts the numbers of another.
+
+Streams draw uniform numbers BATCH at a time and serve scalar draws from
+that buffer, which costs a list lookup instead of a trip through
+random.randint. The batches always come from random.Random, so a seed
+gives the same numbers whether NumPy is installed or not (replays check
+the simulation against them). Bulk arrays from integers() come from a
+NumPy Generator seeded from the same seed and name.
+
+    streams = RandomStreams(seed)
+    particles = streams.stream("particles")
+    speed = particles.uniform(1, 5)
+"""
+
+import random
+import zlib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BATCH = 1024
+
+
+class Stream:
+    """One named random stream; the scalar methods mirror random.Random's."""
+    __slots__ = ("seed", "name", "source", "bulk", "buffer", "index")
+
+    def __init__(self, seed, name):
+        self.seed = seed
+        self.name = name
+        self.source = random.Random(f"{seed}/{name}")  # Scalar draws
+        self.bulk = None  # NumPy Generator for integers(), made on first use
+        self.buffer = []
+        self.index = 0
+
+    def refill(self):
+        draw = self.source.random
+        self.buffer = [draw() for _ in range(BATCH)]
+        self.index = 0
+
+    def random(self):
+        """A float in [0, 1)."""
+        if self.index == len(self.buffer):
+            self.refill()
+        value = self.buffer[self.index]
+        self.index += 1
+        return value
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def randint(self, a, b):
+        """An int in [a, b], both included."""
+        return a + int((b - a + 1) * self.random())
+
+    def randrange(self, n):
+        return int(n * self.random())
+
+    def choice(self, seq):
+        return seq[int(len(seq) * self.random())]
+
+    def integers(self, low, high, size, dtype="int64"):
+        """A NumPy array of ints in [low, high), drawn in bulk (needs NumPy)."""
+        if self.bulk is None:
+            self.bulk = numpy.random.default_rng([self.seed, zlib.crc32(self.name.encode())])
+        return self.bulk.integers(low, high, size=size, dtype=dtype)
+
+
+class RandomStreams:
+    """The named streams of one run, all derived from one seed."""
+
+    def __init__(self, seed=None):
+        # Without a seed pick one, so the run can still be reported and replayed
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.streams = {}
+
+    def stream(self, name):
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams[name] = Stream(self.seed, name)
+        return stream
@@ -0,0 +1,97 @@
+"""
+Batched sprite rendering.
+
+Scenes built from many small repeated primitives (starfields, particles,
+the stripes on a danger zone) cost one call into pygame per primitive.
+Here each distinct primitive is drawn once into a cached sprite Surface,
+and a whole layer is submitted as (sprite, position) pairs in a single
+Surface.fblits (pygame-ce) or Surface.blits call:
+
+    layer = SpriteBatch()
+    for star in stars:
+        layer.add_centered(circle(color, radius), (x, y))
+    layer.flush(screen)
+
+Sprites are kept in an LRU of MAX_SPRITES entries, keyed by everything
+that changes their pixels. stats counts the draw calls and sprites
+submitted (the benchmarks report draw calls per frame); with BATCHING off
+every sprite gets its own blit, for comparison.
+"""
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+MAX_SPRITES = 1024
+BATCHING = True
+
+stats = {"calls": 0, "sprites": 0}
+_sprites = OrderedDict()
+
+
+def sprite(key, size, paint):
+    """
+    The cached sprite for key. On a miss, paint(surface) draws it onto a
+    transparent Surface of size.
+    """
+    surface = _sprites.get(key)
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        paint(surface)
+        _sprites[key] = surface
+        if len(_sprites) > MAX_SPRITES:
+            _sprites.popitem(last=False)
+    else:
+        _sprites.move_to_end(key)
+    return surface
+
+
+def circle(color, radius):
+    """A filled circle, exactly as pygame.draw.circle draws it; blit it with add_centered."""
+    center = math.ceil(radius) + 1
+    return sprite(("circle", color, radius), (2 * center + 1, 2 * center + 1),
+                  lambda surface: pygame.draw.circle(surface, color, (center, center), radius))
+
+
+def shade(size, color):
+    """A translucent fill of size, like the dimming behind a game-over message."""
+    return sprite(("shade", size, color), size, lambda surface: surface.fill(color))
+
+
+def blit_all(surface, pairs, count=None):
+    """Draw (sprite, position) pairs onto surface in one call; count is len(pairs) for iterators."""
+    count = len(pairs) if count is None else count
+    if not count:
+        return
+    stats["sprites"] += count
+    if not BATCHING:
+        for image, position in pairs:
+            surface.blit(image, position)
+        stats["calls"] += count
+        return
+    stats["calls"] += 1
+    if hasattr(surface, "fblits"):  # pygame-ce
+        surface.fblits(pairs)
+    else:
+        surface.blits(pairs, doreturn=False)
+
+
+class SpriteBatch:
+    """One layer of sprites, drawn in the order they were added."""
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items = []
+
+    def add(self, image, position):
+        self.items.append((image, position))
+
+    def add_centered(self, image, center):
+        """Add a sprite centred on center (odd-sized sprites land on the exact pixel)."""
+        self.items.append((image, (center[0] - image.get_width() // 2, center[1] - image.get_height() // 2)))
+
+    def flush(self, surface):
+        """Draw everything added since the last flush and start over."""
+        blit_all(surface, self.items)
+        self.items = []
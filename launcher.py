@@ -0,0 +1,165 @@
+"""
+One window for all the pygame games.
+
+The launcher shows a menu and runs the chosen game as a scene in the same
+process: the games share the window (each resizes it on entry), the mixer
+and the font cache. While the menu is up, the highlighted game, then the
+ones after it, are imported and their fonts, sounds and images built on a
+background thread (see common/lazy.py), so starting a game that has been
+warmed up takes no loading at all.
+
+Esc in a game returns to the menu; closing the window quits.
+
+    python launcher.py [--gc-between-frames]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from common.fonts import sys_font
+from common.games import load_game
+from common.lazy import init_display, warm_up
+from common.pacing import FramePacer, add_gc_argument, schedule_gc
+
+WIDTH, HEIGHT = 640, 480
+FPS = 30
+BACKGROUND = (12, 14, 30)
+TEXT_COLOR = (200, 200, 220)
+HIGHLIGHT = (255, 215, 0)
+STATUS_COLOR = (110, 110, 140)
+
+# Menu entry: (title, module name in common.games.GAMES, start function).
+# The start function runs the game until the player leaves it and returns
+# True if the window was closed.
+SCENES = [
+    ("Light Jumper", "light_jumper", lambda game: game.Game().run()),
+    ("Rain Dodge", "rain_dodge", lambda game: game.run()),
+    ("Sling-Ship Asteroids", "sling_ship", lambda game: game.main()),
+    ("Tic Tac Toe", "tic_tac_toe", lambda game: game.TicTacToe().run()),
+]
+
+ITEM_TOP = 150
+ITEM_HEIGHT = 60
+
+
+def prepare(name):
+    """Import a game and build its assets (runs on the warm-up thread)."""
+    game = load_game(name)
+    warm_up(game)
+    return game
+
+
+def render_menu():
+    """
+    Render every piece of menu text once, up front, so the main thread does
+    no font work while the warm-up thread is building a game's fonts.
+    """
+    title_font = sys_font("verdana", 40, bold=True)
+    item_font = sys_font("verdana", 28)
+    small_font = sys_font("verdana", 16)
+    return {
+        "title": title_font.render("Games", True, HIGHLIGHT),
+        "help": small_font.render("Up/Down and Enter, or click. Esc in a game comes back here.", True, STATUS_COLOR),
+        "items": [(item_font.render(title, True, TEXT_COLOR), item_font.render(title, True, HIGHLIGHT))
+                  for title, _, _ in SCENES],
+        "loading": small_font.render("loading", True, STATUS_COLOR),
+        "ready": small_font.render("ready", True, STATUS_COLOR),
+        "failed": small_font.render("failed", True, STATUS_COLOR),
+    }
+
+
+def item_at(pos):
+    """Index of the menu entry under a mouse position, or None."""
+    index = (pos[1] - ITEM_TOP) // ITEM_HEIGHT
+    return index if 0 <= index < len(SCENES) else None
+
+
+def draw_menu(screen, text, selected, pending):
+    screen.fill(BACKGROUND)
+    screen.blit(text["title"], (WIDTH // 2 - text["title"].get_width() // 2, 50))
+    for index, (normal, highlighted) in enumerate(text["items"]):
+        y = ITEM_TOP + index * ITEM_HEIGHT
+        label = highlighted if index == selected else normal
+        screen.blit(label, (80, y))
+        future = pending.get(SCENES[index][1])
+        if future is not None:
+            if not future.done():
+                status = text["loading"]
+            else:
+                status = text["failed"] if future.exception() is not None else text["ready"]
+            screen.blit(status, (WIDTH - 80 - status.get_width(), y + 10))
+    screen.blit(text["help"], (WIDTH // 2 - text["help"].get_width() // 2, HEIGHT - 40))
+    pygame.display.flip()
+
+
+def main():
+    screen = init_display((WIDTH, HEIGHT), "Games")
+    pacer = FramePacer(FPS)
+    text = render_menu()
+    loader = ThreadPoolExecutor(max_workers=1)
+    pending = {}  # Module name -> Future of the warmed-up module
+    selected = 0
+
+    running = True
+    while running:
+        chosen = None
+        for event in pacer.events():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key in (pygame.K_UP, pygame.K_w):
+                    selected = (selected - 1) % len(SCENES)
+                elif event.key in (pygame.K_DOWN, pygame.K_s):
+                    selected = (selected + 1) % len(SCENES)
+                elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                    chosen = selected
+            elif event.type == pygame.MOUSEMOTION and item_at(event.pos) is not None:
+                selected = item_at(event.pos)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and item_at(event.pos) is not None:
+                chosen = item_at(event.pos)
+        if not running:
+            break
+
+        # Warm up one game at a time: the highlighted one first, then the next ones
+        if all(future.done() for future in pending.values()):
+            for offset in range(len(SCENES)):
+                name = SCENES[(selected + offset) % len(SCENES)][1]
+                if name not in pending:
+                    pending[name] = loader.submit(prepare, name)
+                    break
+
+        if chosen is not None:
+            _, name, start = SCENES[chosen]
+            if name not in pending:
+                pending[name] = loader.submit(prepare, name)
+            error = pending[name].exception()  # Only waits if the warm-up is still running
+            if error is not None:
+                # Say why (a missing dependency, say) and stay in the menu, which shows it failed
+                print(f"{SCENES[chosen][0]} could not be loaded: {error!r}")
+            else:
+                if start(pending[name].result()):
+                    break
+                pygame.event.clear()  # Don't let the game's last keys reach the menu
+                screen = init_display((WIDTH, HEIGHT), "Games")
+                pacer.tick()  # Don't count the time spent in the game
+                continue
+
+        draw_menu(screen, text, selected, pending)
+        pacer.tick(animating=not all(future.done() for future in pending.values()))  # Loading status
+
+    loader.shutdown(wait=True)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play the pygame games from one window.")
+    add_gc_argument(parser)
+    args = parser.parse_args()
+    if args.gc_between_frames:
+        schedule_gc()
+    main()